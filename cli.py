@@ -23,23 +23,58 @@ Interactive mode:
 
 from __future__ import annotations
 
-import argparse
-import copy
+import codecs
+import functools
 import json
+import os
 import sys
-from typing import Any
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable
 
-import yaml
+if TYPE_CHECKING:
+    import argparse
 
 # ─── ANSI color constants ────────────────────────────────────────────────
 
-BOLD = "\033[1m"
-GREEN = "\033[92m"
-YELLOW = "\033[93m"
-CYAN = "\033[96m"
-RED = "\033[91m"
-DIM = "\033[2m"
-RESET = "\033[0m"
+
+def _use_color() -> bool:
+    """Colour only interactive terminals; honour NO_COLOR and FORCE_COLOR."""
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    return sys.stdout.isatty()
+
+
+if _use_color():
+    BOLD = "\033[1m"
+    GREEN = "\033[92m"
+    YELLOW = "\033[93m"
+    CYAN = "\033[96m"
+    RED = "\033[91m"
+    DIM = "\033[2m"
+    RESET = "\033[0m"
+else:
+    BOLD = GREEN = YELLOW = CYAN = RED = DIM = RESET = ""
+
+# ─── Row templates ───────────────────────────────────────────────────────
+# Colour codes are baked in once here; per-row work is a plain str.format().
+
+_MENU_ROW = f"    [{{i}}] {CYAN}{{name:12s}}{RESET} — {{desc}}\n"
+_BLUEPRINT_MENU_ROW = f"    [{{i}}] {CYAN}{{name}}{RESET} — {{desc}}\n"
+_LIST_ROW = f"    {CYAN}{{name}}{RESET}  (type={{agent_type}})\n"
+_CMD_LIST_ROW = f"    {CYAN}{{name:20s}}{RESET}  type={{agent_type:12s}}  v{{version}}\n"
+_HISTORY_ROW = (
+    f"    {DIM}{{i}}.{RESET} {CYAN}{{name:12s}}{RESET} reward={{reward:+.2f}}{{tag}}\n"
+    f"    {DIM}   {{text}}{RESET}\n"
+)
+# cache_hit value → history tag (anything else, e.g. None or 1, gets no tag)
+_CACHE_TAGS = {True: f" {GREEN}[HIT]{RESET}", False: f" {YELLOW}[MISS]{RESET}"}
+_PIPELINE_AGENT_ROW = f"    {CYAN}{{role:16s}}{RESET} {{cls}}\n"
+_PIPELINE_STEP_ROW = (
+    f"    {DIM}{{i}}.{RESET} {CYAN}{{name:20s}}{RESET} "
+    f"agent={{agent_role:12s}} depends_on=[{{deps}}]\n"
+)
 
 # ─── Print helpers ───────────────────────────────────────────────────────
 
@@ -67,16 +102,145 @@ def show_data(label: str, value: object) -> None:
     print(f"    {CYAN}{label}:{RESET} {value}")
 
 
+# ─── Blueprint registry ─────────────────────────────────────────────────
+
+_REGISTRY = None
+
+
+def _get_registry():
+    """Return the process-wide BlueprintRegistry, loading it on first use.
+
+    Loading goes through ``load_cached()`` so back-to-back CLI invocations
+    skip re-parsing blueprint YAML files that have not changed on disk.
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        from agent_factory.factory.registry import BlueprintRegistry
+
+        registry = BlueprintRegistry()
+        registry.load_cached()
+        _REGISTRY = registry
+    return _REGISTRY
+
+
 # ─── Infrastructure check ───────────────────────────────────────────────
 
 
+def _probe_bridge(endpoint: str) -> Exception | None:
+    """Connect to and ping a single bridge. Returns the failure, if any."""
+    from agent_factory.iowarp.client import IOWarpClient
+
+    try:
+        probe = IOWarpClient(endpoint=endpoint, connect_timeout_ms=3000)
+        probe.connect()
+        probe.close()
+    except Exception as exc:
+        return exc
+    return None
+
+
+def _probe_cache(host: str, port: int) -> Exception | None:
+    """Connect to a single memcached node. Returns the failure, if any."""
+    from agent_factory.iowarp.cache import BlobCache
+
+    try:
+        probe = BlobCache(hosts=[(host, port)])
+        probe.connect()
+        probe.close()
+    except Exception as exc:
+        return exc
+    return None
+
+
+# Upper bound on any single probe, whatever the client-side timeouts are.
+_PROBE_TIMEOUT_S = 3.0
+
+
+async def _probe_all(
+    endpoints: list[str], cache_hosts: list[tuple[str, int]]
+) -> tuple[list[Exception | None], list[Exception | None]]:
+    """Run every bridge and cache probe concurrently in daemon threads.
+
+    A probe that has not finished within ``_PROBE_TIMEOUT_S`` is reported
+    as a ``TimeoutError``; its thread is abandoned rather than awaited,
+    and does not keep the process alive.
+
+    Each endpoint gets its own probe: ``IOWarpClient.connect()`` with
+    several endpoints pings them one after another and only logs which
+    ones failed, so it would be both slower and less informative.
+    """
+    import asyncio
+    import threading
+
+    # Import the clients (zmq, pymemcache, pydantic models) once up front so
+    # the worker threads don't serialise on the import lock.
+    import agent_factory.iowarp.cache  # noqa: F401
+    import agent_factory.iowarp.client  # noqa: F401
+
+    loop = asyncio.get_running_loop()
+
+    def start(fn: Callable[..., Exception | None], *args: Any) -> asyncio.Future:
+        # A daemon thread per probe: unlike executor workers (asyncio's or a
+        # ThreadPoolExecutor's), it is not joined at interpreter exit, so a
+        # probe hung in connect() cannot hold up the CLI.
+        future = loop.create_future()
+
+        def settle(result: Exception | None, exc: BaseException | None) -> None:
+            if future.done():  # timed out and cancelled
+                return
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
+
+        def run() -> None:
+            try:
+                outcome = (fn(*args), None)
+            except Exception as exc:
+                outcome = (None, exc)
+            try:
+                loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:  # the loop has already finished
+                pass
+
+        threading.Thread(target=run, name=f"probe-{fn.__name__}", daemon=True).start()
+        return future
+
+    async def bounded(fn: Callable[..., Exception | None], *args: Any) -> Exception | None:
+        try:
+            return await asyncio.wait_for(start(fn, *args), _PROBE_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            return TimeoutError(f"no response within {_PROBE_TIMEOUT_S:g}s")
+
+    results = await asyncio.gather(
+        *(bounded(_probe_bridge, ep) for ep in endpoints),
+        *(bounded(_probe_cache, h, p) for h, p in cache_hosts),
+    )
+    return list(results[:len(endpoints)]), list(results[len(endpoints):])
+
+
+def _pad(label: str, width: int = 45) -> str:
+    return "." * max(1, width - len(label))
+
+
+def _probe_status(exc: Exception | None) -> str:
+    if exc is None:
+        return f"{GREEN}OK{RESET}"
+    if isinstance(exc, TimeoutError):
+        return f"{RED}TIMEOUT{RESET}"
+    return f"{RED}FAIL{RESET}"
+
+
 def check_infrastructure(blueprint: dict[str, Any]) -> bool:
     """Verify all IOWarp bridges and memcached nodes are reachable.
 
+    All probes run concurrently, so the wait is bounded by the slowest
+    endpoint rather than the sum of all of them.  Results are printed in
+    configuration order once every probe has finished.
+
     Returns True if at least one bridge and the cache are alive.
     """
-    from agent_factory.iowarp.cache import BlobCache
-    from agent_factory.iowarp.client import IOWarpClient
+    import asyncio
 
     iowarp_cfg = blueprint.get("iowarp", {})
     endpoints = iowarp_cfg.get("bridge_endpoints")
@@ -85,64 +249,62 @@ def check_infrastructure(blueprint: dict[str, Any]) -> bool:
 
     cache_cfg = blueprint.get("cache", {})
     hosts_raw = cache_cfg.get("hosts", [{"host": "127.0.0.1", "port": 11211}])
+    cache_hosts = [(h.get("host", "127.0.0.1"), h.get("port", 11211)) for h in hosts_raw]
 
     print(f"  {BOLD}Checking infrastructure...{RESET}")
+    bridge_errors, cache_errors = asyncio.run(_probe_all(endpoints, cache_hosts))
+
+    # The whole section is assembled first and emitted with one write
+    out: list[str] = []
+
+    def emit(result: bool) -> bool:
+        if result:
+            out.append("\n")
+        sys.stdout.write("".join(out))
+        sys.stdout.flush()
+        return result
 
     # IOWarp bridges
     bridge_ok = 0
-    for ep in endpoints:
+    for ep, exc in zip(endpoints, bridge_errors):
         label = f"IOWarp bridge ({ep})"
-        dots = "." * max(1, 45 - len(label))
-        print(f"    {label} {dots} ", end="", flush=True)
-        try:
-            probe = IOWarpClient(endpoint=ep, connect_timeout_ms=3000)
-            probe.connect()
-            probe.close()
-            print(f"{GREEN}OK{RESET}")
+        out.append(f"    {label} {_pad(label)} {_probe_status(exc)}\n")
+        if exc is None:
             bridge_ok += 1
-        except Exception as exc:
-            print(f"{RED}FAIL{RESET}")
-            err(f"Bridge not reachable: {exc}")
+        else:
+            out.append(f"    {RED}✗{RESET} Bridge not reachable: {exc}\n")
 
     if bridge_ok == 0:
-        info("Run: docker-compose up -d")
-        return False
+        out.append(f"    {DIM}Run: docker-compose up -d{RESET}\n")
+        return emit(False)
 
     if bridge_ok < len(endpoints):
-        info(f"{bridge_ok}/{len(endpoints)} bridges reachable (partial)")
+        out.append(f"    {DIM}{bridge_ok}/{len(endpoints)} bridges reachable (partial){RESET}\n")
 
     # Memcached nodes
-    cache_hosts = [(h.get("host", "127.0.0.1"), h.get("port", 11211)) for h in hosts_raw]
     cache_ok = 0
-    for host, port in cache_hosts:
+    for (host, port), exc in zip(cache_hosts, cache_errors):
         label = f"Memcached ({host}:{port})"
-        dots = "." * max(1, 45 - len(label))
-        print(f"    {label} {dots} ", end="", flush=True)
-        try:
-            probe = BlobCache(hosts=[(host, port)])
-            probe.connect()
-            probe.close()
-            print(f"{GREEN}OK{RESET}")
+        out.append(f"    {label} {_pad(label)} {_probe_status(exc)}\n")
+        if exc is None:
             cache_ok += 1
-        except Exception as exc:
-            print(f"{RED}FAIL{RESET}")
-            err(f"Memcached not reachable: {exc}")
+        else:
+            out.append(f"    {RED}✗{RESET} Memcached not reachable: {exc}\n")
 
     if cache_ok == 0:
-        return False
+        return emit(False)
 
     if cache_ok < len(cache_hosts):
-        info(f"{cache_ok}/{len(cache_hosts)} cache nodes reachable (partial)")
+        out.append(f"    {DIM}{cache_ok}/{len(cache_hosts)} cache nodes reachable (partial){RESET}\n")
 
-    print()
-    return True
+    return emit(True)
 
 
 # ─── Agent selection ─────────────────────────────────────────────────────
 
 AGENT_CHOICES = [
     ("rule_based", "keyword matching (fast, no LLM needed)", {}),
-    ("llm", "Ollama local LLM (llama3.2)", {"model": "llama3.2:latest", "temperature": 0.1}),
+    ("llm", "Ollama local LLM (llama3.2)", {"model": "llama3.2:3b-instruct-q4_K_M", "temperature": 0.1}),
     ("claude", "Claude Code CLI (no API key needed)", {"model": "sonnet"}),
 ]
 
@@ -150,8 +312,10 @@ AGENT_CHOICES = [
 def select_agent_type() -> dict[str, Any]:
     """Interactive menu to choose agent type. Returns agent config dict."""
     print(f"  {BOLD}Select agent type:{RESET}")
-    for i, (name, desc, _) in enumerate(AGENT_CHOICES, 1):
-        print(f"    [{i}] {CYAN}{name:12s}{RESET} — {desc}")
+    sys.stdout.write("".join(
+        _MENU_ROW.format(i=i, name=name, desc=desc)
+        for i, (name, desc, _) in enumerate(AGENT_CHOICES, 1)
+    ))
 
     while True:
         try:
@@ -189,8 +353,9 @@ def build_stack(blueprint: dict[str, Any], agent_cfg: dict[str, Any]):
     """
     from agent_factory.factory.builder import AgentBuilder
 
-    bp = copy.deepcopy(blueprint)
-    bp["agent"] = agent_cfg
+    # Only the agent section differs from the stored blueprint, so a shallow
+    # copy suffices; handle_configure() copies sections before editing them.
+    bp = {**blueprint, "agent": dict(agent_cfg)}
 
     print(f"  Building agent stack from blueprint... ", end="", flush=True)
     builder = AgentBuilder()
@@ -200,6 +365,15 @@ def build_stack(blueprint: dict[str, Any], agent_cfg: dict[str, Any]):
     return built
 
 
+# Blueprint sections that determine the client/cache/resolver/environment.
+_INFRA_SECTIONS = ("iowarp", "cache", "uri_resolver", "environment")
+
+
+def same_infrastructure(a: dict[str, Any], b: dict[str, Any]) -> bool:
+    """True if two blueprints would build identical infrastructure."""
+    return all(a.get(k) == b.get(k) for k in _INFRA_SECTIONS)
+
+
 def agent_description(built) -> str:
     """Return a human-readable description of the agent."""
     agent = built.agent
@@ -272,20 +446,17 @@ def handle_history(trajectory) -> None:
         print()
         return
 
-    print()
-    print(f"  {BOLD}History ({trajectory.length} steps){RESET}")
+    parts: list[str] = ["\n", f"  {BOLD}History ({trajectory.length} steps){RESET}\n"]
     for i, (action, sr) in enumerate(trajectory.steps, 1):
-        tag = ""
-        if sr.observation.data.get("cache_hit") is True:
-            tag = f" {GREEN}[HIT]{RESET}"
-        elif sr.observation.data.get("cache_hit") is False:
-            tag = f" {YELLOW}[MISS]{RESET}"
-
-        print(f"    {DIM}{i}.{RESET} {CYAN}{action.name:12s}{RESET} "
-              f"reward={sr.reward:+.2f}{tag}")
-        info(f"   {sr.observation.text}")
-    print(f"\n  Total reward: {BOLD}{trajectory.total_reward:.2f}{RESET}")
-    print()
+        hit = sr.observation.data.get("cache_hit")
+        parts.append(_HISTORY_ROW.format(
+            i=i, name=action.name, reward=sr.reward,
+            tag=_CACHE_TAGS[hit] if isinstance(hit, bool) else "",
+            text=sr.observation.text,
+        ))
+    parts.append(f"\n  Total reward: {BOLD}{trajectory.total_reward:.2f}{RESET}\n\n")
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 
 def handle_agent(built) -> None:
@@ -343,13 +514,18 @@ def handle_manual(args_str: str, built, trajectory):
 # ─── Retrieve content preview ────────────────────────────────────────────
 
 
+_PREVIEWABLE_ACTIONS = frozenset({"retrieve"})
+_PREVIEW_BYTES = 400
+_PREVIEW_LINES = 8
+
+
 def show_retrieve_preview(built, action, result) -> None:
     """If the action was a retrieve, show a content preview."""
-    if action.name != "retrieve":
+    if action.name not in _PREVIEWABLE_ACTIONS:
         return
 
-    tag = action.params.get("tag")
-    blob_name = action.params.get("blob_name")
+    params = action.params
+    tag, blob_name = params.get("tag"), params.get("blob_name")
     if not tag or not blob_name:
         return
 
@@ -379,13 +555,24 @@ def show_retrieve_preview(built, action, result) -> None:
             content_bytes = built.cache.get(tag, blob_name)
         
         if content_bytes:
-            snippet = content_bytes.decode("utf-8", errors="replace")[:400]
-            lines = snippet.splitlines()[:8]
+            # Decode only the bytes we might show, not the whole blob.  When
+            # the cut lands inside a multi-byte character, a non-final
+            # decode drops the partial sequence instead of showing U+FFFD.
+            truncated = len(content_bytes) > _PREVIEW_BYTES
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            snippet = decoder.decode(content_bytes[:_PREVIEW_BYTES], final=not truncated)
+            lines = snippet.split("\n", _PREVIEW_LINES)
+            if len(lines) > _PREVIEW_LINES:
+                truncated = truncated or lines[-1] != ""
+                lines = lines[:_PREVIEW_LINES]
+            elif lines[-1] == "":
+                lines.pop()
             print()
             print(f"    {DIM}── Content preview ──{RESET}")
             for line in lines:
+                line = line.rstrip("\r")
                 print(f"    {DIM}│ {line}{RESET}")
-            if len(snippet) >= 400 or len(snippet.splitlines()) > 8:
+            if truncated:
                 print(f"    {DIM}│ ...{RESET}")
     except Exception as e:
         # Log the error for debugging
@@ -397,6 +584,21 @@ def show_retrieve_preview(built, action, result) -> None:
 # ─── Agent-driven loop ──────────────────────────────────────────────────
 
 
+def show_routing() -> None:
+    """Echo the coordinator's routing log lines in the REPL.
+
+    The coordinator only logs its decisions; this attaches the one handler
+    that shows them, instead of printing on every delegation.
+    """
+    import logging
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter(f"\n  {CYAN}→ %(message)s{RESET}\n"))
+    logger = logging.getLogger("agent_factory.agents.coordinator_agent")
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
 def run_agent_loop(text: str, built, trajectory):
     """Send natural language to agent: think → act → step → display.
 
@@ -409,22 +611,33 @@ def run_agent_loop(text: str, built, trajectory):
     print()
     print(f"  {BOLD}Agent thinking...{RESET}")
 
-    # Think
-    try:
-        thought = built.agent.think(obs)
-        info(f'Thought: "{thought}"')
-    except Exception as exc:
-        err(f"Agent think() failed: {exc}")
-        return trajectory
+    # Think + act in one call when the agent supports it
+    if hasattr(type(built.agent), "step"):
+        try:
+            thought, action = built.agent.step(obs)
+            info(f'Thought: "{thought}"')
+            info(f"Action: {action.name}")
+            info(f"Params: {action.params}")
+        except Exception as exc:
+            err(f"Agent step() failed: {exc}")
+            return trajectory
+    else:
+        # Think
+        try:
+            thought = built.agent.think(obs)
+            info(f'Thought: "{thought}"')
+        except Exception as exc:
+            err(f"Agent think() failed: {exc}")
+            return trajectory
 
-    # Act
-    try:
-        action = built.agent.act(obs)
-        info(f"Action: {action.name}")
-        info(f"Params: {action.params}")
-    except Exception as exc:
-        err(f"Agent act() failed: {exc}")
-        return trajectory
+        # Act
+        try:
+            action = built.agent.act(obs)
+            info(f"Action: {action.name}")
+            info(f"Params: {action.params}")
+        except Exception as exc:
+            err(f"Agent act() failed: {exc}")
+            return trajectory
 
     # Environment step
     try:
@@ -460,22 +673,24 @@ def run_agent_loop(text: str, built, trajectory):
 
 def handle_list(registry) -> None:
     """List all blueprints in the registry."""
-    names = registry.list_blueprints()
-    print()
-    print(f"  {BOLD}Blueprints:{RESET}")
-    for name in names:
-        bp = registry.get(name)
+    parts: list[str] = ["\n", f"  {BOLD}Blueprints:{RESET}\n"]
+    for name, bp in registry.items():
         agent_type = bp.get("agent", {}).get("type", "?")
-        print(f"    {CYAN}{name}{RESET}  (type={agent_type})")
-    print()
+        parts.append(_LIST_ROW.format(name=name, agent_type=agent_type))
+    parts.append("\n")
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 
 def handle_show_blueprint(registry, name: str) -> None:
     """Show a blueprint's full config."""
+    from agent_factory.factory.registry import dump_yaml
+
     try:
         bp = registry.get(name.strip())
         print()
-        print(yaml.dump(bp, default_flow_style=False, sort_keys=False))
+        dump_yaml(bp, sys.stdout)
+        print()
     except Exception as exc:
         err(str(exc))
 
@@ -516,16 +731,27 @@ def handle_switch(registry, name, built, trajectory):
 
     agent_cfg = new_bp.get("agent", {"type": "rule_based"})
 
-    try:
-        built.environment.close()
-    except Exception:
-        pass
+    if same_infrastructure(built.blueprint, new_bp):
+        # Keep the live bridge/memcached connections; only swap the agent.
+        from agent_factory.factory.builder import AgentBuilder
 
-    try:
-        new_built = build_stack(new_bp, agent_cfg)
-    except Exception as exc:
-        err(f"Failed to build: {exc}")
-        return built, trajectory
+        bp = {**new_bp, "agent": dict(agent_cfg)}
+        try:
+            new_built = AgentBuilder().rebuild_agent(bp, built)
+        except Exception as exc:
+            err(f"Failed to build: {exc}")
+            return built, trajectory
+    else:
+        try:
+            built.environment.close()
+        except Exception:
+            pass
+
+        try:
+            new_built = build_stack(new_bp, agent_cfg)
+        except Exception as exc:
+            err(f"Failed to build: {exc}")
+            return built, trajectory
 
     task = TaskSpec(
         task_id="cli_session",
@@ -540,8 +766,38 @@ def handle_switch(registry, name, built, trajectory):
     return new_built, new_trajectory
 
 
-def handle_configure(args_str: str, built, registry) -> None:
-    """Set a config value using dotted key path."""
+@functools.lru_cache(maxsize=256)
+def _compile_path(key_path: str) -> Callable[[dict[str, Any], Any], None]:
+    """Return a setter that assigns a value at dotted *key_path* in a blueprint.
+
+    Sections may be shared with the registry's copy (see build_stack), so
+    the setter copies each dict along the path before writing into it.
+    """
+    *parents, leaf = key_path.split(".")
+
+    def setter(bp: dict[str, Any], value: Any) -> None:
+        target = bp
+        for k in parents:
+            child = target.get(k)
+            target[k] = dict(child) if isinstance(child, dict) else {}
+            target = target[k]
+        target[leaf] = value
+
+    return setter
+
+
+def handle_configure(
+    args_str: str,
+    built,
+    registry,
+    pending: dict[str, tuple[dict[str, Any], set[str]]] | None = None,
+) -> None:
+    """Set a config value using dotted key path.
+
+    If *pending* is given, the save to YAML is deferred: the touched section
+    is recorded there and written later by :func:`flush_pending_saves`, so
+    a burst of ``configure`` commands costs one write per blueprint.
+    """
     parts = args_str.split(None, 1)
     if len(parts) != 2:
         err("Usage: configure <dotted.key> <value>")
@@ -550,6 +806,7 @@ def handle_configure(args_str: str, built, registry) -> None:
         return
 
     key_path, raw_value = parts
+    section = key_path.partition(".")[0]
 
     # Parse value: try JSON first (for numbers, bools, objects), else string
     try:
@@ -557,15 +814,8 @@ def handle_configure(args_str: str, built, registry) -> None:
     except (ValueError, json.JSONDecodeError):
         value = raw_value
 
-    # Navigate blueprint dict to set the value
-    keys = key_path.split(".")
     bp = built.blueprint
-    target = bp
-    for k in keys[:-1]:
-        if k not in target or not isinstance(target[k], dict):
-            target[k] = {}
-        target = target[k]
-    target[keys[-1]] = value
+    _compile_path(key_path)(bp, value)
 
     ok(f"Set {key_path} = {value!r}")
     info("Rebuild the agent (use 'switch' or restart) for changes to take effect.")
@@ -573,11 +823,27 @@ def handle_configure(args_str: str, built, registry) -> None:
     # Persist to YAML if blueprint is in registry
     bp_name = bp.get("blueprint", {}).get("name", "")
     if bp_name and bp_name in registry:
-        try:
-            registry.update(bp_name, **{keys[0]: bp.get(keys[0], {})})
-            info(f"Saved to {bp_name}.yaml")
-        except Exception as exc:
-            err(f"Failed to save: {exc}")
+        if pending is None:
+            _save_sections(registry, bp_name, bp, {section})
+        else:
+            pending.setdefault(bp_name, (bp, set()))[1].add(section)
+
+
+def _save_sections(registry, name: str, bp: dict[str, Any], sections: set[str]) -> None:
+    try:
+        registry.update(name, **{k: bp.get(k, {}) for k in sections})
+        info(f"Saved to {name}.yaml")
+    except Exception as exc:
+        err(f"Failed to save: {exc}")
+
+
+def flush_pending_saves(
+    registry, pending: dict[str, tuple[dict[str, Any], set[str]]]
+) -> None:
+    """Write every blueprint with deferred ``configure`` changes, once each."""
+    for name, (bp, sections) in pending.items():
+        _save_sections(registry, name, bp, sections)
+    pending.clear()
 
 
 # ─── Pipeline mode ──────────────────────────────────────────────────────
@@ -608,19 +874,20 @@ def pipeline_banner(pipeline_def: dict[str, Any]) -> None:
 
 def show_pipeline_info(built_pipeline: Any) -> None:
     """Show pipeline steps and agents."""
-    print()
-    print(f"  {BOLD}Agents:{RESET}")
+    parts: list[str] = ["\n", f"  {BOLD}Agents:{RESET}\n"]
     for role, agent in built_pipeline.agents.items():
         cls = type(agent).__name__
-        print(f"    {CYAN}{role:16s}{RESET} {cls}")
+        parts.append(_PIPELINE_AGENT_ROW.format(role=role, cls=cls))
 
-    print()
-    print(f"  {BOLD}Steps (execution order):{RESET}")
+    parts.append(f"\n  {BOLD}Steps (execution order):{RESET}\n")
     for i, step in enumerate(built_pipeline.dag.execution_order, 1):
         deps = ", ".join(step.depends_on) if step.depends_on else "none"
-        print(f"    {DIM}{i}.{RESET} {CYAN}{step.name:20s}{RESET} "
-              f"agent={step.agent_role:12s} depends_on=[{deps}]")
-    print()
+        parts.append(_PIPELINE_STEP_ROW.format(
+            i=i, name=step.name, agent_role=step.agent_role, deps=deps,
+        ))
+    parts.append("\n")
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 
 def parse_run_args(args_str: str) -> dict[str, str]:
@@ -673,15 +940,33 @@ def run_pipeline(built_pipeline: Any, initial_vars: dict[str, Any]) -> None:
     print()
 
 
+def _pipeline_run(args_str: str, built_pipeline: Any) -> None:
+    run_pipeline(built_pipeline, parse_run_args(args_str.strip()))
+
+
+# Exact pipeline commands → handler(built_pipeline); None means "leave the REPL".
+_PIPELINE_COMMANDS: dict[str, Callable[[Any], None] | None] = {
+    "quit": None,
+    "exit": None,
+    "help": lambda _: print(PIPELINE_HELP_TEXT),
+    "info": show_pipeline_info,
+}
+
+# Prefixed pipeline commands → handler(args_str, built_pipeline)
+_PIPELINE_PREFIXES: tuple[tuple[str, Callable[[str, Any], None]], ...] = (
+    ("run", _pipeline_run),
+)
+
+
 def pipeline_main(pipeline_path: str) -> None:
     """Pipeline REPL mode — load a pipeline YAML and execute interactively."""
     from agent_factory.factory.builder import AgentBuilder
-    from agent_factory.factory.registry import BlueprintRegistry
+    from agent_factory.factory.registry import load_yaml
 
     # Load pipeline definition
     try:
         with open(pipeline_path) as f:
-            pipeline_def = yaml.safe_load(f)
+            pipeline_def = load_yaml(f)
     except Exception as exc:
         err(f"Failed to load pipeline YAML: {exc}")
         sys.exit(1)
@@ -690,8 +975,7 @@ def pipeline_main(pipeline_path: str) -> None:
 
     # Load blueprint for infrastructure config
     try:
-        registry = BlueprintRegistry()
-        registry.load()
+        registry = _get_registry()
         available = registry.list_blueprints()
         if len(available) == 1:
             blueprint_name = available[0]
@@ -701,7 +985,7 @@ def pipeline_main(pipeline_path: str) -> None:
                 bp = registry.get(name)
                 desc = bp.get("blueprint", {}).get("description", "").strip()
                 short = (desc[:50] + "...") if len(desc) > 50 else desc
-                print(f"    [{i}] {CYAN}{name}{RESET} — {short}")
+                sys.stdout.write(_BLUEPRINT_MENU_ROW.format(i=i, name=name, desc=short))
             while True:
                 try:
                     raw = input(f"  {BOLD}>{RESET} ").strip()
@@ -758,16 +1042,16 @@ def pipeline_main(pipeline_path: str) -> None:
         cmd = raw.lower()
 
         try:
-            if cmd in ("quit", "exit"):
-                break
-            elif cmd == "help":
-                print(PIPELINE_HELP_TEXT)
-            elif cmd == "info":
-                show_pipeline_info(built_pipeline)
-            elif cmd.startswith("run"):
-                args_str = raw[3:].strip()
-                initial_vars = parse_run_args(args_str)
-                run_pipeline(built_pipeline, initial_vars)
+            if cmd in _PIPELINE_COMMANDS:
+                handler = _PIPELINE_COMMANDS[cmd]
+                if handler is None:
+                    break
+                handler(built_pipeline)
+                continue
+            for prefix, prefixed in _PIPELINE_PREFIXES:
+                if cmd.startswith(prefix):
+                    prefixed(raw[len(prefix):], built_pipeline)
+                    break
             else:
                 err(f"Unknown command. Type 'help' for available commands.")
         except Exception as exc:
@@ -789,10 +1073,7 @@ def pipeline_main(pipeline_path: str) -> None:
 
 def cmd_create(args) -> None:
     """Handle 'cli.py create <name> --type <type>' subcommand."""
-    from agent_factory.factory.registry import BlueprintRegistry
-
-    registry = BlueprintRegistry()
-    registry.load()
+    registry = _get_registry()
 
     kwargs: dict[str, Any] = {}
     if args.model:
@@ -813,36 +1094,34 @@ def cmd_create(args) -> None:
 
 def cmd_list(_args) -> None:
     """Handle 'cli.py list' subcommand."""
-    from agent_factory.factory.registry import BlueprintRegistry
+    registry = _get_registry()
 
-    registry = BlueprintRegistry()
-    registry.load()
-
-    names = registry.list_blueprints()
-    if not names:
+    blueprints = registry.items()
+    if not blueprints:
         info("No blueprints found.")
         return
 
     print(f"\n  {BOLD}Available blueprints:{RESET}")
-    for name in names:
-        bp = registry.get(name)
+    for name, bp in blueprints:
         agent_type = bp.get("agent", {}).get("type", "?")
         version = bp.get("blueprint", {}).get("version", "?")
-        print(f"    {CYAN}{name:20s}{RESET}  type={agent_type:12s}  v{version}")
+        sys.stdout.write(_CMD_LIST_ROW.format(
+            name=name, agent_type=agent_type, version=version,
+        ))
     print()
 
 
 def cmd_show(args) -> None:
     """Handle 'cli.py show <name>' subcommand."""
-    from agent_factory.factory.registry import BlueprintRegistry
+    from agent_factory.factory.registry import dump_yaml
 
-    registry = BlueprintRegistry()
-    registry.load()
+    registry = _get_registry()
 
     try:
         bp = registry.get(args.name)
         print(f"\n  {BOLD}Blueprint: {args.name}{RESET}\n")
-        print(yaml.dump(bp, default_flow_style=False, sort_keys=False))
+        dump_yaml(bp, sys.stdout)
+        print()
     except Exception as exc:
         err(str(exc))
         sys.exit(1)
@@ -850,10 +1129,7 @@ def cmd_show(args) -> None:
 
 def cmd_delete(args) -> None:
     """Handle 'cli.py delete <name>' subcommand."""
-    from agent_factory.factory.registry import BlueprintRegistry
-
-    registry = BlueprintRegistry()
-    registry.load()
+    registry = _get_registry()
 
     try:
         registry.delete(args.name)
@@ -865,10 +1141,7 @@ def cmd_delete(args) -> None:
 
 def cmd_run(args) -> None:
     """Handle 'cli.py run <name>' subcommand — load blueprint and start REPL."""
-    from agent_factory.factory.registry import BlueprintRegistry
-
-    registry = BlueprintRegistry()
-    registry.load()
+    registry = _get_registry()
 
     try:
         blueprint = registry.get(args.name)
@@ -890,6 +1163,8 @@ def cmd_run(args) -> None:
 
 def build_parser() -> argparse.ArgumentParser:
     """Build the CLI argument parser with subcommands."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="cli.py",
         description="AgentFactory CLI — manage and run agent blueprints.",
@@ -940,6 +1215,48 @@ def build_parser() -> argparse.ArgumentParser:
 # ─── Interactive REPL ────────────────────────────────────────────────────
 
 
+@dataclass
+class ReplSession:
+    """Mutable state threaded through the interactive REPL's command handlers."""
+
+    built: Any
+    trajectory: Any
+    registry: Any
+    # Blueprint name → (blueprint dict, top-level sections) awaiting a save
+    pending_saves: dict[str, tuple[dict[str, Any], set[str]]] = field(default_factory=dict)
+
+
+def _repl_switch(args_str: str, s: ReplSession) -> None:
+    s.built, s.trajectory = handle_switch(s.registry, args_str, s.built, s.trajectory)
+
+
+def _repl_manual(args_str: str, s: ReplSession) -> None:
+    s.trajectory = handle_manual(args_str, s.built, s.trajectory)
+
+
+# Exact REPL commands → handler(session); None means "leave the REPL".
+_REPL_COMMANDS: dict[str, Callable[[ReplSession], None] | None] = {
+    "quit": None,
+    "exit": None,
+    "help": lambda _: handle_help(),
+    "status": lambda s: handle_status(s.built, s.trajectory),
+    "observe": lambda s: handle_observe(s.built),
+    "history": lambda s: handle_history(s.trajectory),
+    "agent": lambda s: handle_agent(s.built),
+    "list": lambda s: handle_list(s.registry),
+}
+
+# Prefixed REPL commands → handler(args_str, session)
+_REPL_PREFIXES: dict[str, Callable[[str, ReplSession], None]] = {
+    "show": lambda a, s: handle_show_blueprint(s.registry, a),
+    "create": lambda a, s: handle_create_repl(s.registry, a),
+    "delete": lambda a, s: handle_delete_repl(s.registry, a),
+    "switch": _repl_switch,
+    "configure": lambda a, s: handle_configure(a, s.built, s.registry, s.pending_saves),
+    "manual": _repl_manual,
+}
+
+
 def run_interactive(blueprint: dict[str, Any], agent_cfg: dict[str, Any], registry) -> None:
     """Run the interactive REPL with a given blueprint and agent config."""
     from agent_factory.core.types import TaskSpec, Trajectory
@@ -964,7 +1281,7 @@ def run_interactive(blueprint: dict[str, Any], agent_cfg: dict[str, Any], regist
         instruction="Interactive CLI session — agent responds to user instructions.",
     )
     built.environment.reset(task)
-    trajectory = Trajectory(task=task)
+    session = ReplSession(built=built, trajectory=Trajectory(task=task), registry=registry)
 
     # REPL loop
     while True:
@@ -980,43 +1297,36 @@ def run_interactive(blueprint: dict[str, Any], agent_cfg: dict[str, Any], regist
         cmd = raw.lower()
 
         try:
-            if cmd in ("quit", "exit"):
-                break
-            elif cmd == "help":
-                handle_help()
-            elif cmd == "status":
-                handle_status(built, trajectory)
-            elif cmd == "observe":
-                handle_observe(built)
-            elif cmd == "history":
-                handle_history(trajectory)
-            elif cmd == "agent":
-                handle_agent(built)
-            elif cmd == "list":
-                handle_list(registry)
-            elif cmd.startswith("show "):
-                handle_show_blueprint(registry, raw[5:])
-            elif cmd.startswith("create "):
-                handle_create_repl(registry, raw[7:])
-            elif cmd.startswith("delete "):
-                handle_delete_repl(registry, raw[7:])
-            elif cmd.startswith("switch "):
-                built, trajectory = handle_switch(registry, raw[7:], built, trajectory)
-            elif cmd.startswith("configure "):
-                handle_configure(raw[10:], built, registry)
-            elif cmd.startswith("manual "):
-                trajectory = handle_manual(raw[7:], built, trajectory)
+            exact = cmd in _REPL_COMMANDS
+            # "<command> <args>" → table lookup on the first word
+            head, _, rest = raw.partition(" ")
+            prefix = None if exact or not rest else head.lower()
+            prefixed = _REPL_PREFIXES.get(prefix)
+
+            # Coalesce consecutive 'configure' saves into one write
+            if session.pending_saves and prefix != "configure":
+                flush_pending_saves(session.registry, session.pending_saves)
+
+            if exact:
+                handler = _REPL_COMMANDS[cmd]
+                if handler is None:
+                    break
+                handler(session)
+            elif prefixed:
+                prefixed(rest.lstrip(), session)
             else:
                 # Natural language → agent
-                trajectory = run_agent_loop(raw, built, trajectory)
+                session.trajectory = run_agent_loop(raw, session.built, session.trajectory)
         except Exception as exc:
             err(f"Unexpected error: {exc}")
             print()
 
     # Cleanup
+    if session.pending_saves:
+        flush_pending_saves(session.registry, session.pending_saves)
     print(f"  {DIM}Cleaning up...{RESET}")
     try:
-        built.environment.close()
+        session.built.environment.close()
     except Exception:
         pass
     print(f"  Goodbye.")
@@ -1048,13 +1358,10 @@ def main() -> None:
         cmd_run(args)
     else:
         # No subcommand → original interactive flow
-        from agent_factory.factory.registry import BlueprintRegistry
-
         banner()
 
         try:
-            registry = BlueprintRegistry()
-            registry.load()
+            registry = _get_registry()
             available = registry.list_blueprints()
             if len(available) == 1:
                 blueprint_name = available[0]
@@ -1064,7 +1371,7 @@ def main() -> None:
                     bp = registry.get(name)
                     desc = bp.get("blueprint", {}).get("description", "").strip()
                     short = (desc[:50] + "...") if len(desc) > 50 else desc
-                    print(f"    [{i}] {CYAN}{name}{RESET} — {short}")
+                    sys.stdout.write(_BLUEPRINT_MENU_ROW.format(i=i, name=name, desc=short))
                 while True:
                     try:
                         raw = input(f"  {BOLD}>{RESET} ").strip()
@@ -1093,6 +1400,8 @@ def main() -> None:
             agent_cfg = blueprint.get("agent", {})
             print(f"  Using {CYAN}{existing_agent_type}{RESET} agent from blueprint")
             print()
+            if existing_agent_type == "coordinator":
+                show_routing()
         else:
             # Select agent type for generic blueprints
             agent_cfg = select_agent_type()
@@ -1100,5 +1409,23 @@ def main() -> None:
         run_interactive(blueprint, agent_cfg, registry)
 
 
+def _main_fast_path() -> None:
+    """Dispatch trivial subcommands without building the argparse parser.
+
+    ``list`` and ``delete <name>`` are the commands most often scripted in
+    loops; anything else (including ``-h`` or extra flags) goes through the
+    full parser in :func:`main`.
+    """
+    import types
+
+    argv = sys.argv[1:]
+    if argv == ["list"]:
+        cmd_list(None)
+    elif len(argv) == 2 and argv[0] == "delete" and not argv[1].startswith("-"):
+        cmd_delete(types.SimpleNamespace(command="delete", name=argv[1]))
+    else:
+        main()
+
+
 if __name__ == "__main__":
-    main()
+    _main_fast_path()
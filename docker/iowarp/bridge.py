@@ -1,4 +1,4 @@
-"""ZeroMQ REP bridge wrapping the wrp_cee Python API.
+"""ZeroMQ ROUTER/DEALER bridge wrapping the wrp_cee Python API.
 
 Runs inside the IOWarp container.  Exposes a JSON-RPC-style interface
 over ZeroMQ so the host-side AgentFactory can drive the context engine
@@ -7,9 +7,15 @@ without needing wrp_cee installed locally.
 Supported methods:
     ping              → {"result": "pong"}
     context_bundle    → assimilate data into the context engine
+    context_bundle_many → several context_bundle calls in one round trip
     context_query     → query for tags/blobs matching patterns
     context_retrieve  → retrieve blob data
+    context_retrieve_many → several context_retrieve calls in one round trip
     context_destroy   → destroy a context (tag set)
+
+Frames are JSON unless they start with ``MSGPACK_TAG``, in which case the
+rest of the frame is msgpack (requires ``msgspec``).  Replies use the same
+encoding as the request; the ping reply advertises msgpack support.
 """
 
 from __future__ import annotations
@@ -17,17 +23,78 @@ from __future__ import annotations
 import json
 import logging
 import os
+import signal
 import sys
+import threading
 import traceback
+from enum import IntEnum
 
 import zmq
 
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.environ.get("BRIDGE_LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s [bridge] %(levelname)s %(message)s",
 )
 log = logging.getLogger("bridge")
 
+# ---------------------------------------------------------------------------
+# Wire format
+# ---------------------------------------------------------------------------
+try:
+    import msgspec
+
+    _MSGPACK_ENC = msgspec.msgpack.Encoder()
+    _MSGPACK_DEC = msgspec.msgpack.Decoder()
+    HAS_MSGPACK = True
+except ImportError:
+    HAS_MSGPACK = False
+    log.warning("msgspec not available — bridge will speak JSON only")
+
+MSGPACK_TAG = b"\x01"
+
+
+def decode_frame(buf) -> tuple[dict, bool]:
+    """Decode a request frame. Returns (message, is_msgpack)."""
+    if HAS_MSGPACK and buf[:1] == MSGPACK_TAG:
+        return _MSGPACK_DEC.decode(buf[1:]), True
+    return json.loads(bytes(buf)), False
+
+
+# Per-thread msgpack output buffer, reused across replies
+_encode_local = threading.local()
+
+
+def encode_frame(msg: dict, msgpack: bool) -> bytes | bytearray:
+    """Encode a reply frame.
+
+    msgpack frames are written into a per-thread buffer that the next call
+    on the same thread overwrites, so send them with ``copy=True``.
+    """
+    if msgpack:
+        buf = getattr(_encode_local, "buf", None)
+        if buf is None:
+            buf = _encode_local.buf = bytearray(MSGPACK_TAG)
+        # encode_into resizes buf to exactly tag + message
+        _MSGPACK_ENC.encode_into(msg, buf, len(MSGPACK_TAG))
+        return buf
+    # JSON has no bytes type: hex-encode retrieved blob data for these peers
+    result = msg.get("result")
+    if isinstance(result, dict):
+        if isinstance(result.get("data"), (bytes, bytearray)):
+            msg = {**msg, "result": _hex_data(result)}
+        elif isinstance(result.get("results"), list):
+            results = [_hex_data(r) if isinstance(r, dict) else r for r in result["results"]]
+            msg = {**msg, "result": {**result, "results": results}}
+    return json.dumps(msg).encode()
+
+
+def _hex_data(result: dict) -> dict:
+    data = result.get("data")
+    if isinstance(data, (bytes, bytearray)):
+        return {**result, "data": data.hex(), "encoding": "hex"}
+    return result
+
+
 # ---------------------------------------------------------------------------
 # wrp_cee import — only available inside the IOWarp container
 # ---------------------------------------------------------------------------
@@ -44,8 +111,46 @@ except ImportError:
 # Handler functions
 # ---------------------------------------------------------------------------
 
+_PING = {"result": "pong", "msgpack": HAS_MSGPACK}
+
+# Pre-encoded JSON ping replies, without and with a (%d) request id
+_PING_JSON = json.dumps(_PING).encode()
+_PING_JSON_ID = json.dumps(_PING)[:-1].encode() + b', "id": %d}'
+
+
 def handle_ping(params: dict) -> dict:
-    return {"result": "pong"}
+    return dict(_PING)
+
+
+def ping_reply(req_id, msgpack: bool) -> bytes | bytearray:
+    """Encoded ping reply, built without going through DISPATCH."""
+    if not msgpack:
+        if req_id is None:
+            return _PING_JSON
+        if type(req_id) is int:
+            return _PING_JSON_ID % req_id
+    resp = _PING if req_id is None else {**_PING, "id": req_id}
+    return encode_frame(resp, msgpack)
+
+
+class Fmt(IntEnum):
+    """Compact wire codes for the well-known data formats."""
+
+    ARROW = 0
+    BINARY = 1
+    HDF5 = 2
+    CSV = 3
+    JSON = 4
+
+
+_FORMAT_NAMES = {f.value: f.name.lower() for f in Fmt}
+
+
+def format_name(fmt) -> str:
+    """Accept a ``Fmt`` code or a format string; return the string."""
+    if isinstance(fmt, int):
+        return _FORMAT_NAMES.get(fmt, "arrow")
+    return fmt
 
 
 def handle_context_bundle(params: dict) -> dict:
@@ -54,11 +159,11 @@ def handle_context_bundle(params: dict) -> dict:
     Expected params:
         src: str | list[str]  — source URI(s) (file::, hdf5::, etc.)
         dst: str              — destination tag
-        format: str           — data format hint (arrow, csv, json, ...)
+        format: str | int     — data format hint (arrow, csv, ...) or Fmt code
     """
     src = params["src"]
     dst = params["dst"]
-    fmt = params.get("format", "arrow")
+    fmt = format_name(params.get("format", Fmt.ARROW))
 
     # Call stub or real wrp_cee function
     result = wrp_cee.context_bundle(src=src, dst=dst, format=fmt)
@@ -71,6 +176,23 @@ def handle_context_bundle(params: dict) -> dict:
         return {"result": {"status": "ok", "tag": dst, **stub_marker}}
 
 
+def handle_context_bundle_many(params: dict) -> dict:
+    """Assimilate several bundles in one request.
+
+    Expected params:
+        items: list[dict]  — each with src, dst and optional format
+    """
+    items = [
+        {**item, "format": format_name(item.get("format", Fmt.ARROW))}
+        for item in params["items"]
+    ]
+    results = wrp_cee.context_bundle_many(items)
+    if not HAS_WRP:
+        for r in results:
+            r["stub"] = True
+    return {"result": {"results": results}}
+
+
 def handle_context_query(params: dict) -> dict:
     """Query the context engine for matching tags/blobs.
 
@@ -86,14 +208,13 @@ def handle_context_query(params: dict) -> dict:
         tag_pattern=tag_pattern,
         blob_pattern=blob_pattern,
     )
-    # matches may be a list of dicts or custom objects — normalise to dicts
-    normalised = []
-    for m in matches:
-        if isinstance(m, dict):
-            normalised.append(m)
-        else:
-            normalised.append({"tag": str(m)})
-    
+    # matches may be a list of dicts or custom objects — normalise to dicts.
+    # wrp_cee already returns a list of dicts, so that case is passed through.
+    if isinstance(matches, list) and all(type(m) is dict for m in matches):
+        normalised = matches
+    else:
+        normalised = [m if isinstance(m, dict) else {"tag": str(m)} for m in matches]
+
     stub_marker = {"stub": True} if not HAS_WRP else {}
     return {"result": {"matches": normalised, **stub_marker}}
 
@@ -111,15 +232,22 @@ def handle_context_retrieve(params: dict) -> dict:
     # Call stub or real wrp_cee function
     data = wrp_cee.context_retrieve(tag=tag, blob_name=blob_name)
 
-    # Encode bytes as hex for JSON transport; caller decodes
-    if isinstance(data, (bytes, bytearray)):
-        stub_marker = {"stub": True} if not HAS_WRP else {}
-        return {"result": {"data": data.hex(), "encoding": "hex", **stub_marker}}
-    
+    # Raw bytes go out as-is over msgpack; encode_frame() hex-encodes for JSON
     stub_marker = {"stub": True} if not HAS_WRP else {}
     return {"result": {"data": data, **stub_marker}}
 
 
+def handle_context_retrieve_many(params: dict) -> dict:
+    """Retrieve several blobs in one request.
+
+    Expected params:
+        items: list[dict]  — each with tag and blob_name
+    """
+    datas = wrp_cee.context_retrieve_many(params["items"])
+    stub_marker = {"stub": True} if not HAS_WRP else {}
+    return {"result": {"results": [{"data": data, **stub_marker} for data in datas]}}
+
+
 def handle_context_destroy(params: dict) -> dict:
     """Destroy a context (tag set).
 
@@ -147,53 +275,165 @@ def handle_stub_state(params: dict) -> dict:
 DISPATCH = {
     "ping": handle_ping,
     "context_bundle": handle_context_bundle,
+    "context_bundle_many": handle_context_bundle_many,
     "context_query": handle_context_query,
     "context_retrieve": handle_context_retrieve,
+    "context_retrieve_many": handle_context_retrieve_many,
     "context_destroy": handle_context_destroy,
     "stub_state": handle_stub_state,
 }
 
 
 # ---------------------------------------------------------------------------
-# Main loop
+# Request handling
 # ---------------------------------------------------------------------------
 
-def main() -> None:
-    port = int(os.environ.get("BRIDGE_PORT", "5560"))
-    ctx = zmq.Context()
-    socket = ctx.socket(zmq.REP)
-    socket.bind(f"tcp://*:{port}")
-    log.info("Bridge listening on tcp://*:%d", port)
+def handle_request(payload) -> list:
+    """Decode one request frame, dispatch it, and return the reply frames.
 
-    while True:
+    If the request sets ``frames`` and the result carries blob bytes, the
+    bytes are sent untouched as a second frame (``encoding: "frame"``)
+    instead of being copied into the encoded header.
+    """
+    try:
+        raw, msgpack = decode_frame(payload)
+    except Exception as exc:
+        log.error("Failed to parse message:\n%s", traceback.format_exc())
+        return [encode_frame({"error": f"malformed request: {exc}"}, False)]
+    if not isinstance(raw, dict):
+        return [encode_frame({"error": "malformed request: expected a map"}, msgpack)]
+
+    method = raw.get("method", "")
+    req_id = raw.get("id")
+    if method == "ping":
+        return [ping_reply(req_id, msgpack)]
+
+    params = raw.get("params", {})
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Received: method=%s params=%.200r", method, params)
+
+    handler = DISPATCH.get(method)
+    if handler is None:
+        resp = {"error": f"unknown method: {method}"}
+    else:
         try:
-            raw = socket.recv_json()
-        except Exception:
-            log.error("Failed to receive/parse message:\n%s", traceback.format_exc())
-            continue
-
-        method = raw.get("method", "")
-        params = raw.get("params", {})
-        req_id = raw.get("id")
-        
-        log.info(f"Received: method={method}, params={params}")
-
-        handler = DISPATCH.get(method)
-        if handler is None:
-            resp = {"error": f"unknown method: {method}"}
-        else:
+            resp = handler(params)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Handler %s result keys: %s", method, list(resp))
+        except Exception as exc:
+            log.error("Handler %s failed:\n%s", method, traceback.format_exc())
+            resp = {"error": str(exc)}
+
+    if req_id is not None:
+        resp["id"] = req_id
+
+    result = resp.get("result")
+    if raw.get("frames") and isinstance(result, dict) \
+            and isinstance(result.get("data"), (bytes, bytearray)):
+        header = {**resp, "result": {**result, "data": None, "encoding": "frame"}}
+        return [encode_frame(header, msgpack), result["data"]]
+
+    return [encode_frame(resp, msgpack)]
+
+
+# ---------------------------------------------------------------------------
+# Main loop
+# ---------------------------------------------------------------------------
+
+# Front-end ROUTER ↔ back-end DEALER proxy; each worker thread owns a REP
+# socket connected here, so no socket is ever shared between threads.
+_WORKERS_ENDPOINT = "inproc://bridge-workers"
+
+# Sending TERMINATE on this socket stops the proxy and shuts down cleanly.
+_CONTROL_ENDPOINT = "inproc://bridge-control"
+
+# One process-wide context: its I/O threads are shared by every socket,
+# including the workers' inproc sockets.
+_CTX = zmq.Context.instance()
+
+
+def request_shutdown() -> None:
+    """Ask a running main() loop to exit. Safe to call from any thread."""
+    ctrl = _CTX.socket(zmq.PAIR)
+    ctrl.connect(_CONTROL_ENDPOINT)
+    ctrl.send(b"TERMINATE")
+    ctrl.close(linger=1000)
+
+
+def worker() -> None:
+    """Serve requests from the proxy until the context is terminated."""
+    sock = _CTX.socket(zmq.REP)
+    sock.setsockopt(zmq.LINGER, 0)
+    sock.connect(_WORKERS_ENDPOINT)
+    # Bound once: this loop runs for every request the worker serves
+    recv, send, handle, more = sock.recv, sock.send, handle_request, zmq.SNDMORE
+    try:
+        while True:
+            payload = recv(copy=False)
             try:
-                resp = handler(params)
-                log.info(f"Handler {method} result: {list(resp.keys()) if isinstance(resp, dict) else type(resp)}")
+                header, *blob = handle(payload.buffer)
             except Exception as exc:
-                log.error("Handler %s failed:\n%s", method, traceback.format_exc())
-                resp = {"error": str(exc)}
+                # Always answer: the REQ peer waits for a reply, and an
+                # exception escaping here would kill this worker thread
+                log.error("Request failed:\n%s", traceback.format_exc())
+                header, blob = encode_frame({"error": f"internal error: {exc}"}, False), []
+            # The header may be encode_frame()'s reused buffer: copy it out
+            send(header, more if blob else 0, copy=True)
+            if blob:
+                send(blob[0], copy=False)
+    except zmq.ContextTerminated:
+        pass
+    finally:
+        sock.close()
 
-        if req_id is not None:
-            resp["id"] = req_id
-
-        socket.send_json(resp)
 
+def main() -> None:
+    port = int(os.environ.get("BRIDGE_PORT", "5560"))
+    workers = int(os.environ.get("BRIDGE_WORKERS", str(os.cpu_count() or 4)))
+    ctx = _CTX
+    ctx.set(zmq.IO_THREADS, int(os.environ.get("BRIDGE_IO_THREADS", "2")))
+
+    # ROUTER accepts plain REQ clients as well as DEALERs, and lets several
+    # requests be in flight at once instead of REP's strict lockstep.
+    frontend = ctx.socket(zmq.ROUTER)
+    frontend.setsockopt(zmq.LINGER, 0)
+    frontend.setsockopt(zmq.SNDHWM, 10000)
+    frontend.setsockopt(zmq.RCVHWM, 10000)
+    frontend.setsockopt(zmq.TCP_KEEPALIVE, 1)
+    frontend.bind(f"tcp://*:{port}")
+    backend = ctx.socket(zmq.DEALER)
+    backend.setsockopt(zmq.LINGER, 0)
+    backend.bind(_WORKERS_ENDPOINT)
+    control = ctx.socket(zmq.PAIR)
+    control.bind(_CONTROL_ENDPOINT)
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: request_shutdown())
+
+    threads = [
+        threading.Thread(target=worker, name=f"bridge-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    for t in threads:
+        t.start()
+    log.info("Bridge listening on tcp://*:%d (%d workers)", port, workers)
+
+    # The proxy runs in its own thread so this one stays free to handle
+    # signals; join() returns once request_shutdown() stops it.
+    proxy = threading.Thread(
+        target=zmq.proxy_steerable, args=(frontend, backend, None, control),
+        name="bridge-proxy",
+    )
+    proxy.start()
+    proxy.join()
+
+    # Workers see ContextTerminated once their current request is done
+    log.info("Bridge shutting down")
+    for sock in (frontend, backend, control):
+        sock.close()
+    ctx.term()
+    for t in threads:
+        t.join()
 
 if __name__ == "__main__":
     main()
@@ -5,6 +5,11 @@
  *
  * Protocol: one JSON object per line on stdin, one JSON response per line on stdout.
  * First output line is a ready message with init status.
+ * Blob payloads are raw: a line carrying "nbytes":N is followed by exactly N
+ * bytes (put requests on stdin, get responses on stdout).  put_many carries
+ * "count":K and is followed by K such put lines, answered with one reply.
+ * A missing or non-numeric "nbytes"/"count" gets an error reply and ends the
+ * session, since the stream can no longer be framed.
  */
 
 #include <wrp_cte/core/content_transfer_engine.h>
@@ -36,34 +41,6 @@ static std::string json_get(const std::string &json, const std::string &key) {
     return val;
 }
 
-static std::string to_hex(const char* data, size_t len) {
-    static const char hex[] = "0123456789abcdef";
-    std::string out;
-    out.reserve(len * 2);
-    for (size_t i = 0; i < len; i++) {
-        unsigned char c = static_cast<unsigned char>(data[i]);
-        out += hex[c >> 4];
-        out += hex[c & 0x0f];
-    }
-    return out;
-}
-
-static std::vector<char> from_hex(const std::string &hex) {
-    std::vector<char> out;
-    out.reserve(hex.size() / 2);
-    for (size_t i = 0; i + 1 < hex.size(); i += 2) {
-        unsigned char hi = 0, lo = 0;
-        if (hex[i] >= '0' && hex[i] <= '9') hi = hex[i] - '0';
-        else if (hex[i] >= 'a' && hex[i] <= 'f') hi = hex[i] - 'a' + 10;
-        else if (hex[i] >= 'A' && hex[i] <= 'F') hi = hex[i] - 'A' + 10;
-        if (hex[i+1] >= '0' && hex[i+1] <= '9') lo = hex[i+1] - '0';
-        else if (hex[i+1] >= 'a' && hex[i+1] <= 'f') lo = hex[i+1] - 'a' + 10;
-        else if (hex[i+1] >= 'A' && hex[i+1] <= 'F') lo = hex[i+1] - 'A' + 10;
-        out.push_back(static_cast<char>((hi << 4) | lo));
-    }
-    return out;
-}
-
 static std::string escape_json(const std::string &s) {
     std::string out;
     for (char c : s) {
@@ -88,10 +65,32 @@ static void respond_ok(const std::string &extra = "") {
         respond("{\"status\":\"ok\"," + extra + "}");
 }
 
+// Header line announcing N raw bytes, then the bytes themselves
+static void respond_blob(const std::string &extra, const char *data, size_t len) {
+    std::cout << "{\"status\":\"ok\"," << extra
+              << ",\"nbytes\":" << len << "}\n";
+    std::cout.write(data, len);
+    std::cout.flush();
+}
+
 static void respond_error(const std::string &msg) {
     respond("{\"status\":\"error\",\"message\":\"" + escape_json(msg) + "\"}");
 }
 
+// Strict unsigned parse for framing fields ("nbytes", "count").  When one of
+// these is missing or malformed the amount of input that follows is unknown,
+// so the caller must not keep reading commands from the stream.
+static bool parse_size(const std::string &s, size_t &out) {
+    if (s.empty() || s.find_first_not_of("0123456789") != std::string::npos)
+        return false;
+    try {
+        out = std::stoull(s);
+    } catch (const std::out_of_range &) {
+        return false;
+    }
+    return true;
+}
+
 int main() {
     // Initialize CTE client (connects to running Chimaera runtime)
     try {
@@ -124,9 +123,11 @@ int main() {
 
     respond("{\"status\":\"ready\"," + init_info + "}");
 
-    // Process commands from stdin
+    // Process commands from stdin.  A framing error (bad "nbytes"/"count")
+    // leaves the stream position unknown: reply, then end the session.
     std::string line;
-    while (std::getline(std::cin, line)) {
+    bool desync = false;
+    while (!desync && std::getline(std::cin, line)) {
         if (line.empty() || line[0] == '#') continue;
 
         std::string cmd = json_get(line, "cmd");
@@ -135,18 +136,72 @@ int main() {
             if (cmd == "put") {
                 std::string tag_name = json_get(line, "tag");
                 std::string blob_name = json_get(line, "blob");
-                std::string hex_data = json_get(line, "data");
+                size_t nbytes = 0;
+                if (!parse_size(json_get(line, "nbytes"), nbytes)) {
+                    respond_error("put requires a numeric nbytes; closing session");
+                    desync = true;
+                    continue;
+                }
+
+                // Consume the raw payload before any validation so the
+                // stream stays in sync even when the put is rejected
+                std::vector<char> data(nbytes);
+                std::cin.read(data.data(), data.size());
 
                 if (tag_name.empty() || blob_name.empty()) {
                     respond_error("put requires tag and blob");
                     continue;
                 }
 
-                auto data = from_hex(hex_data);
                 wrp_cte::core::Tag tag(tag_name);
                 tag.PutBlob(blob_name, data.data(), data.size());
                 respond_ok("\"size\":" + std::to_string(data.size()));
 
+            } else if (cmd == "put_many") {
+                // "count":K, then K put-style lines: {"tag","blob","nbytes"}
+                // each followed by its raw payload.  One reply for the batch.
+                size_t count = 0;
+                if (!parse_size(json_get(line, "count"), count)) {
+                    respond_error("put_many requires a numeric count; closing session");
+                    desync = true;
+                    continue;
+                }
+                size_t stored = 0;
+                std::string oks = "[";
+                std::string item;
+                size_t i = 0;
+                for (; i < count && std::getline(std::cin, item); i++) {
+                    std::string tag_name = json_get(item, "tag");
+                    std::string blob_name = json_get(item, "blob");
+                    size_t nbytes = 0;
+                    if (!parse_size(json_get(item, "nbytes"), nbytes)) {
+                        desync = true;
+                        break;
+                    }
+                    std::vector<char> data(nbytes);
+                    std::cin.read(data.data(), data.size());
+
+                    bool ok = !tag_name.empty() && !blob_name.empty();
+                    if (ok) {
+                        try {
+                            wrp_cte::core::Tag tag(tag_name);
+                            tag.PutBlob(blob_name, data.data(), data.size());
+                        } catch (...) {
+                            ok = false;
+                        }
+                    }
+                    stored += ok;
+                    if (i > 0) oks += ",";
+                    oks += ok ? "1" : "0";
+                }
+                if (desync) {
+                    respond_error("put_many item " + std::to_string(i) +
+                                  " requires a numeric nbytes; closing session");
+                    continue;
+                }
+                oks += "]";
+                respond_ok("\"stored\":" + std::to_string(stored) + ",\"ok\":" + oks);
+
             } else if (cmd == "get") {
                 std::string tag_name = json_get(line, "tag");
                 std::string blob_name = json_get(line, "blob");
@@ -165,8 +220,7 @@ int main() {
 
                 std::vector<char> buf(size);
                 tag.GetBlob(blob_name, buf.data(), size);
-                respond_ok("\"size\":" + std::to_string(size) +
-                          ",\"data\":\"" + to_hex(buf.data(), size) + "\"");
+                respond_blob("\"size\":" + std::to_string(size), buf.data(), size);
 
             } else if (cmd == "get_size") {
                 std::string tag_name = json_get(line, "tag");
@@ -190,6 +244,23 @@ int main() {
                 arr += "]";
                 respond_ok("\"blobs\":" + arr);
 
+            } else if (cmd == "list_blobs_with_sizes") {
+                // list_blobs plus one GetBlobSize each, in a single reply
+                std::string tag_name = json_get(line, "tag");
+
+                wrp_cte::core::Tag tag(tag_name);
+                auto blobs = tag.GetContainedBlobs();
+
+                std::string arr = "[";
+                for (size_t i = 0; i < blobs.size(); i++) {
+                    if (i > 0) arr += ",";
+                    chi::u64 size = tag.GetBlobSize(blobs[i]);
+                    arr += "{\"name\":\"" + escape_json(blobs[i]) +
+                           "\",\"size\":" + std::to_string(size) + "}";
+                }
+                arr += "]";
+                respond_ok("\"blobs\":" + arr);
+
             } else if (cmd == "tag_query") {
                 std::string pattern = json_get(line, "pattern");
                 if (pattern.empty()) pattern = ".*";
@@ -5,16 +5,22 @@ Uses the cte_helper C++ binary (subprocess) to communicate with the real
 IOWarp CTE runtime. The nanobind Python extension (wrp_cte_core_ext) has an
 ABI conflict (libc++ vs libstdc++) causing std::bad_cast on import, so we
 bypass it entirely by talking to a long-running C++ helper process via
-stdin/stdout JSON lines.
+stdin/stdout JSON lines.  Blob bytes never go through JSON: a header line
+carrying ``"nbytes": N`` is followed by exactly N raw bytes.
 
 Falls back to in-memory stub when cte_helper is unavailable.
 """
+import collections
+import functools
 import json
 import os
 import logging
+import mmap
+import re
 import subprocess
 import threading
 import fnmatch
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
 logger = logging.getLogger("wrp_cee")
 
@@ -23,23 +29,42 @@ logger = logging.getLogger("wrp_cee")
 # ---------------------------------------------------------------------------
 _CTE_HELPER_PATH = "/usr/local/bin/cte_helper"
 
+# Binary pipes with large buffers: a command batch goes out in a few big
+# writes (flushed explicitly) and replies are read in big chunks.
+_PIPE_BUFFER_SIZE = 1 << 20
+
+# How long cte_helper may take to connect to the runtime and report ready
+_STARTUP_TIMEOUT_S = 60
+
 _helper_proc = None
+# Held only while writing commands; replies are collected by _reader_loop
 _helper_lock = threading.Lock()
-_initialized = False
-_use_stub = False
+# Futures for commands written but not yet answered, in write order
+_pending = collections.deque()
+_init_lock = threading.Lock()
+# _HelperBackend or _StubBackend once initialised; the public functions
+# delegate straight to it
+_backend = None
 
 
 def _ensure_initialized():
-    """Start the cte_helper subprocess if not already running."""
-    global _helper_proc, _initialized, _use_stub
+    """Start the cte_helper subprocess if not already running.
 
-    if _initialized:
-        return
+    Returns the backend the public functions should use.
+    """
+    # The bridge dispatches requests from a thread pool
+    with _init_lock:
+        if _backend is None:
+            _start_helper()
+    return _backend
+
+
+def _start_helper():
+    global _helper_proc, _backend
 
     if not os.path.isfile(_CTE_HELPER_PATH):
         logger.warning(f"cte_helper not found at {_CTE_HELPER_PATH} - using stub")
-        _initialized = True
-        _use_stub = True
+        _backend = _StubBackend
         return
 
     try:
@@ -48,25 +73,22 @@ def _ensure_initialized():
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
-            text=True,
-            bufsize=1,  # line-buffered
+            bufsize=_PIPE_BUFFER_SIZE,
         )
 
-        # Read lines until we get the JSON ready message
-        # (cte_helper may emit C++ log lines before the JSON)
-        ready = None
-        for _ in range(50):  # max 50 lines of log output
-            ready_line = _helper_proc.stdout.readline().strip()
-            if not ready_line:
-                continue
-            if ready_line.startswith("{"):
-                ready = json.loads(ready_line)
-                break
-            else:
-                logger.debug(f"cte_helper startup: {ready_line}")
-
-        if ready is None:
-            raise RuntimeError("cte_helper produced no JSON ready message")
+        # The reader thread owns stdout from the start: it skips the C++ log
+        # lines, hands over the JSON ready message, then reads replies
+        ready_future = Future()
+        threading.Thread(
+            target=_reader_loop, args=(_helper_proc, ready_future),
+            name="cte_helper-reader", daemon=True,
+        ).start()
+        try:
+            ready = ready_future.result(timeout=_STARTUP_TIMEOUT_S)
+        except FutureTimeoutError:
+            raise RuntimeError(
+                f"cte_helper not ready after {_STARTUP_TIMEOUT_S}s"
+            ) from None
         if ready.get("status") != "ready":
             raise RuntimeError(f"cte_helper init failed: {ready}")
 
@@ -77,59 +99,242 @@ def _ensure_initialized():
         if target_count == 0:
             logger.warning("No storage targets - CTE operations may fail")
 
-        _initialized = True
-        _use_stub = False
+        _backend = _HelperBackend
 
     except Exception as e:
         logger.warning(f"cte_helper init failed: {e} - using stub")
         if _helper_proc and _helper_proc.poll() is None:
             _helper_proc.kill()
         _helper_proc = None
-        _initialized = True
-        _use_stub = True
+        _backend = _StubBackend
+
+
+# Most blobs sent to cte_helper in one put_many; bounds how many files are
+# held open at once.
+_BATCH_SIZE = 64
 
 
 def _send_command(cmd_dict):
     """Send a JSON command to cte_helper and return the parsed response."""
-    global _helper_proc, _use_stub
+    return _send_commands([cmd_dict])[0]
+
+
+# Command headers and reply lines go through msgspec's C JSON codec when it
+# is installed.  Otherwise keep one compact stdlib encoder: json.dumps()
+# builds a new JSONEncoder whenever non-default options are passed.
+try:
+    import msgspec
+
+    _encode_header = msgspec.json.Encoder().encode
+    _decode_line = msgspec.json.Decoder().decode
+except ImportError:  # optional dependency
+    _encode_header_str = json.JSONEncoder(separators=(',', ':')).encode
+
+    def _encode_header(obj):
+        return _encode_header_str(obj).encode()
+
+    _decode_line = json.loads
+
+
+def _write_command(stream, cmd):
+    """Write one command; a bytes ``data`` field follows the header raw.
+
+    A ``file`` field (an open binary file) is sent instead of ``data``:
+    its first ``nbytes`` bytes go straight from the page cache to the pipe
+    with os.sendfile, without passing through Python.
+
+    A command with ``items`` (put_many) is written as its header with a
+    ``count``, followed by each item written the same way.
+    """
+    write = stream.write
+    data = cmd.get("data")
+    src = cmd.get("file")
+    items = cmd.get("items")
+    if data is None and src is None and items is None:
+        write(_encode_header(cmd) + b"\n")
+        return
+    header = {k: v for k, v in cmd.items() if k not in ("data", "file", "items")}
+    if items is not None:
+        header["count"] = len(items)
+        write(_encode_header(header) + b"\n")
+        for item in items:
+            _write_command(stream, item)
+        return
+    if src is None:
+        header["nbytes"] = len(data)
+        write(_encode_header(header) + b"\n")
+        write(data)
+        return
+    write(_encode_header(header) + b"\n")
+    # Buffered header bytes must reach the pipe before the sendfile payload
+    stream.flush()
+    _sendfile(stream.fileno(), src, header["nbytes"])
+
+
+def _sendfile(out_fd, src, count):
+    """Copy exactly *count* bytes of *src* to *out_fd*."""
+    offset = 0
+    try:
+        while offset < count:
+            sent = os.sendfile(out_fd, src.fileno(), offset, count - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except (AttributeError, OSError):
+        # No sendfile for this fd pair; copy the remainder through Python
+        src.seek(offset)
+        while offset < count:
+            chunk = src.read(min(count - offset, 1 << 20))
+            if not chunk:
+                break
+            os.write(out_fd, chunk)
+            offset += len(chunk)
+    if offset != count:
+        # The helper is still waiting for the rest of the payload
+        raise RuntimeError(f"{src.name} shrank while being sent")
 
+
+def _send_commands(cmd_dicts):
+    """Pipeline several commands to cte_helper in one write.
+
+    The lock only covers the write, so callers on other threads can queue
+    their commands while the helper is still working on these.  Returns
+    one parsed response (or None on failure) per command, in order.
+    """
+    global _helper_proc, _backend
+
+    futures = [Future() for _ in cmd_dicts]
     with _helper_lock:
         if _helper_proc is None or _helper_proc.poll() is not None:
             # Helper died — mark as stub
             logger.error("cte_helper process died - falling back to stub")
-            _use_stub = True
+            _backend = _StubBackend
             _helper_proc = None
-            return None
+            return [None] * len(cmd_dicts)
 
+        # cte_helper answers strictly in order, so registering the futures
+        # in write order is enough to pair them with their replies
+        _pending.extend(futures)
         try:
-            line = json.dumps(cmd_dict, separators=(',', ':'))
-            _helper_proc.stdin.write(line + "\n")
-            _helper_proc.stdin.flush()
+            stdin = _helper_proc.stdin
+            for cmd in cmd_dicts:
+                _write_command(stdin, cmd)
+            stdin.flush()
+        except Exception as e:
+            logger.error(f"cte_helper communication error: {e}")
+            # The reader sees EOF and fails every pending command
+            _stop_helper()
+            return [None] * len(cmd_dicts)
 
-            resp_line = _helper_proc.stdout.readline().strip()
-            if not resp_line:
-                raise RuntimeError("Empty response from cte_helper")
+    return [f.result() for f in futures]
 
-            return json.loads(resp_line)
-        except Exception as e:
+
+def _reader_loop(proc, ready):
+    """Resolve *ready* with the startup message, then pair replies with commands.
+
+    Each reply goes to the oldest pending command; a reply announcing
+    ``nbytes`` gets those raw bytes as its ``data``.
+    """
+    readline = proc.stdout.readline
+    read = proc.stdout.read
+    try:
+        # cte_helper may emit C++ log lines before the JSON ready message
+        while True:
+            line = readline()
+            if not line:
+                raise RuntimeError("cte_helper produced no JSON ready message")
+            line = line.strip()
+            if line.startswith(b"{"):
+                ready.set_result(_decode_line(line))
+                break
+            if line:
+                logger.debug(f"cte_helper startup: {line.decode(errors='replace')}")
+
+        while True:
+            # Decoders skip the trailing newline themselves; no strip() copy
+            resp_line = readline()
+            if not resp_line:
+                raise RuntimeError("cte_helper closed its stdout")
+            resp = _decode_line(resp_line)
+            nbytes = resp.get("nbytes")
+            if nbytes is not None:
+                resp["data"] = read(nbytes)
+                if len(resp["data"]) != nbytes:
+                    raise RuntimeError("Truncated blob from cte_helper")
+            _pending.popleft().set_result(resp)
+    except Exception as e:
+        if not ready.done():
+            ready.set_exception(e)
+            return
+        if proc.poll() is None:
             logger.error(f"cte_helper communication error: {e}")
-            _use_stub = True
-            if _helper_proc and _helper_proc.poll() is None:
-                _helper_proc.kill()
-            _helper_proc = None
-            return None
+            # Kill first so a writer blocked on a full pipe is released
+            proc.kill()
+        with _helper_lock:
+            if _helper_proc is proc:
+                _stop_helper()
+            while _pending:
+                _pending.popleft().set_result(None)
+
+
+def _stop_helper():
+    """Kill cte_helper and fall back to the stub.  Caller holds _helper_lock."""
+    global _helper_proc, _backend
+    _backend = _StubBackend
+    if _helper_proc and _helper_proc.poll() is None:
+        _helper_proc.kill()
+    _helper_proc = None
 
 
 # ---------------------------------------------------------------------------
 # Stub storage (fallback when C++ helper unavailable)
 # ---------------------------------------------------------------------------
+# tag -> {blob_name: anonymous mmap holding a snapshot of the source file}.
+# The bytes are copied at put time: a map of the file itself would change
+# when the file is edited and raise SIGBUS once it is truncated.
 _stub_storage = {}
+# Byte totals per tag and overall, kept current on every store/destroy so
+# get_stub_state never has to walk the blobs.
+_stub_tag_sizes = {}
+_stub_total_size = 0
+# The bridge calls in from several worker threads
+_stub_lock = threading.Lock()
+
+
+def _stub_map(f):
+    size = os.fstat(f.fileno()).st_size
+    if not size:  # empty maps are not allowed
+        return b""
+    blob = mmap.mmap(-1, size)
+    n = f.readinto(blob)
+    if n < size:  # the file shrank since fstat
+        short = blob[:n]
+        blob.close()
+        return short
+    return blob
+
+
+def _stub_release(blob):
+    if isinstance(blob, mmap.mmap):
+        blob.close()
+
+
+def _stub_store(tag, blob_name, content):
+    global _stub_total_size
+    with _stub_lock:
+        old = _stub_storage.setdefault(tag, {}).get(blob_name, b"")
+        _stub_storage[tag][blob_name] = content
+        delta = len(content) - len(old)
+        _stub_tag_sizes[tag] = _stub_tag_sizes.get(tag, 0) + delta
+        _stub_total_size += delta
+    _stub_release(old)
 
 
 def _stub_context_bundle(src, dst, format="arrow"):
     sources = [src] if isinstance(src, str) else src
-    if dst not in _stub_storage:
-        _stub_storage[dst] = {}
+    with _stub_lock:
+        _stub_storage.setdefault(dst, {})
+        _stub_tag_sizes.setdefault(dst, 0)
 
     stored_count = 0
     for source in sources:
@@ -137,9 +342,9 @@ def _stub_context_bundle(src, dst, format="arrow"):
             path = source[6:]
             try:
                 with open(path, 'rb') as f:
-                    blob_name = path.split('/')[-1]
-                    content = f.read()
-                    _stub_storage[dst][blob_name] = content
+                    blob_name = os.path.basename(path)
+                    content = _stub_map(f)
+                    _stub_store(dst, blob_name, content)
                     stored_count += 1
                     logger.info(f"[STUB] Stored {blob_name} in tag '{dst}' ({len(content)} bytes)")
             except Exception as e:
@@ -150,11 +355,12 @@ def _stub_context_bundle(src, dst, format="arrow"):
 
 def _stub_context_query(tag_pattern="*", blob_pattern="*"):
     results = []
-    for tag_name, blobs in _stub_storage.items():
-        if not fnmatch.fnmatch(tag_name, tag_pattern):
-            continue
-        for blob_name in blobs.keys():
-            if fnmatch.fnmatch(blob_name, blob_pattern):
+    tag_match = _compile_glob(tag_pattern).match
+    blob_match = _compile_glob(blob_pattern).match
+    with _stub_lock:
+        for tag_name in filter(tag_match, _stub_storage):
+            blobs = _stub_storage[tag_name]
+            for blob_name in filter(blob_match, blobs):
                 results.append({
                     "tag": tag_name,
                     "blob": blob_name,
@@ -164,88 +370,231 @@ def _stub_context_query(tag_pattern="*", blob_pattern="*"):
 
 
 def _stub_context_retrieve(tag, blob_name):
-    if tag in _stub_storage and blob_name in _stub_storage[tag]:
-        return _stub_storage[tag][blob_name]
-    return None
+    blob = _stub_storage.get(tag, {}).get(blob_name)
+    if blob is None:
+        return None
+    try:
+        return bytes(blob)
+    except ValueError:  # unmapped by a concurrent destroy
+        return None
 
 
 def _stub_context_destroy(tags):
+    global _stub_total_size
     tag_list = [tags] if isinstance(tags, str) else tags
     for tag in tag_list:
-        if tag in _stub_storage:
-            del _stub_storage[tag]
+        with _stub_lock:
+            blobs = _stub_storage.pop(tag, {})
+            _stub_total_size -= _stub_tag_sizes.pop(tag, 0)
+        for blob in blobs.values():
+            _stub_release(blob)
     return {"status": "ok", "destroyed": tag_list, "stub": True}
 
 
+def _stub_context_retrieve_many(items):
+    return [_stub_context_retrieve(item["tag"], item["blob_name"]) for item in items]
+
+
+def _stub_context_bundle_many(items):
+    return [
+        _stub_context_bundle(item["src"], item["dst"], item.get("format", "arrow"))
+        for item in items
+    ]
+
+
+def _stub_state():
+    with _stub_lock:
+        return {
+            "backend": "stub",
+            "tags": list(_stub_storage.keys()),
+            "blobs": {tag: list(blobs.keys()) for tag, blobs in _stub_storage.items()},
+            "total_size": _stub_total_size,
+        }
+
+
 # ---------------------------------------------------------------------------
-# Public API
+# Pattern helpers
 # ---------------------------------------------------------------------------
 
-def context_bundle(src, dst, format="arrow"):
-    """Ingest data into IOWarp storage.
+# Regex metacharacters that are literal in a glob.  They are escaped as
+# one-character classes because cte_helper does not unescape JSON strings,
+# so a backslash escape would not survive the trip to std::regex.
+_GLOB_LITERALS = frozenset(".^$+(){}|")
 
-    Args:
-        src: str or list[str] - source path(s) with scheme (file::, folder::)
-        dst: str - destination tag name
-        format: str - data format (arrow, binary, etc.)
 
-    Returns:
-        dict with status and tag info
+@functools.lru_cache(maxsize=256)
+def _glob_to_regex(pattern):
+    """Translate a glob into the std::regex syntax cte_helper's TagQuery uses."""
+    out = []
+    for c in pattern:
+        if c == "*":
+            out.append(".*")
+        elif c == "?":
+            out.append(".")
+        elif c in _GLOB_LITERALS:
+            out.append(f"[{c}]")
+        else:
+            out.append(c)
+    return "".join(out).replace("[!", "[^")
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern):
+    """Compiled, anchored Python regex for a glob (fnmatch semantics)."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+# ---------------------------------------------------------------------------
+# Retrieved-blob cache
+# ---------------------------------------------------------------------------
+
+class _BlobLRU:
+    """Byte-bounded LRU of retrieved blobs, keyed by (tag, blob_name).
+
+    Writes to a tag bump its version and drop its entries; a retrieve only
+    caches its result if the tag's version did not change while the get
+    was in flight, so a racing put can never leave stale bytes behind.
     """
-    _ensure_initialized()
 
-    if _use_stub:
-        return _stub_context_bundle(src, dst, format)
+    def __init__(self, max_bytes):
+        self._max_bytes = max_bytes
+        self._nbytes = 0
+        self._blobs = collections.OrderedDict()
+        self._versions = {}
+        self._lock = threading.Lock()
+
+    def get(self, tag, blob_name):
+        with self._lock:
+            data = self._blobs.get((tag, blob_name))
+            if data is not None:
+                self._blobs.move_to_end((tag, blob_name))
+            return data
+
+    def version(self, tag):
+        return self._versions.get(tag, 0)
+
+    def put(self, tag, blob_name, data, version):
+        if len(data) > self._max_bytes:
+            return
+        with self._lock:
+            if self._versions.get(tag, 0) != version:
+                return
+            old = self._blobs.pop((tag, blob_name), None)
+            if old is not None:
+                self._nbytes -= len(old)
+            self._blobs[(tag, blob_name)] = data
+            self._nbytes += len(data)
+            while self._nbytes > self._max_bytes:
+                _, evicted = self._blobs.popitem(last=False)
+                self._nbytes -= len(evicted)
+
+    def invalidate(self, tag):
+        with self._lock:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+            for key in [k for k in self._blobs if k[0] == tag]:
+                self._nbytes -= len(self._blobs.pop(key))
+
+
+_blob_cache = _BlobLRU(int(os.environ.get("WRP_CEE_BLOB_CACHE_BYTES", 64 << 20)))
 
+
+# ---------------------------------------------------------------------------
+# CTE backend (cte_helper)
+# ---------------------------------------------------------------------------
+
+def _cte_context_bundle(src, dst, format="arrow"):
     sources = [src] if isinstance(src, str) else src
-    stored_count = 0
+    stored = _put_files([(0, dst, s[6:]) for s in sources if s.startswith("file::")])
+    return {"status": "ok", "tag": dst, "stored": stored.get(0, 0)}
 
-    for source in sources:
-        if source.startswith("file::"):
-            path = source[6:]
-            try:
-                with open(path, 'rb') as f:
-                    data = f.read()
-                blob_name = os.path.basename(path)
-                hex_data = data.hex()
 
-                resp = _send_command({
-                    "cmd": "put",
-                    "tag": dst,
-                    "blob": blob_name,
-                    "data": hex_data,
-                })
+def _cte_context_bundle_many(items):
+    files = []
+    for i, item in enumerate(items):
+        sources = [item["src"]] if isinstance(item["src"], str) else item["src"]
+        files.extend((i, item["dst"], s[6:]) for s in sources if s.startswith("file::"))
+    stored = _put_files(files)
+    return [
+        {"status": "ok", "tag": item["dst"], "stored": stored.get(i, 0)}
+        for i, item in enumerate(items)
+    ]
 
-                if resp and resp.get("status") == "ok":
-                    stored_count += 1
-                    logger.info(f"[CTE] Stored {blob_name} in tag '{dst}' ({len(data)} bytes)")
-                else:
-                    err = resp.get("message", "unknown") if resp else "no response"
-                    logger.error(f"[CTE] Failed to store {blob_name}: {err}")
-            except Exception as e:
-                logger.error(f"[CTE] Failed to store {path}: {e}")
 
-    return {"status": "ok", "tag": dst, "stored": stored_count}
+def _prefetch(f, size):
+    """Ask the kernel to start reading *f* now.
 
+    Every file in a batch is opened before the first one is sent, so cold
+    files are read from disk concurrently in the background while earlier
+    ones are still being sendfile'd, instead of one after another.
+    """
+    if size and hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, size, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
 
-def context_query(tag_pattern="*", blob_pattern="*"):
-    """Query for blobs matching patterns.
 
-    Args:
-        tag_pattern: str - glob pattern for tags
-        blob_pattern: str - glob pattern for blob names
+def _put_files(files):
+    """Store (key, tag, path) entries with batched put_many commands.
 
-    Returns:
-        list of dicts with tag/blob/size info
+    Returns {key: stored_count}.
     """
-    _ensure_initialized()
+    stored = {}
 
-    if _use_stub:
-        return _stub_context_query(tag_pattern, blob_pattern)
+    # One put_many (one helper reply) per batch instead of one put per file
+    for i in range(0, len(files), _BATCH_SIZE):
+        puts = []  # (key, tag, blob_name, size, item)
+        for key, dst, path in files[i:i + _BATCH_SIZE]:
+            try:
+                f = open(path, 'rb')
+            except Exception as e:
+                logger.error(f"[CTE] Failed to store {path}: {e}")
+                continue
+            try:
+                size = os.fstat(f.fileno()).st_size
+            except Exception as e:
+                f.close()
+                logger.error(f"[CTE] Failed to store {path}: {e}")
+                continue
+            _prefetch(f, size)
+            blob_name = os.path.basename(path)
+            # Contents are sendfile'd from the open file, never read here
+            puts.append((key, dst, blob_name, size, {
+                "tag": dst,
+                "blob": blob_name,
+                "nbytes": size,
+                "file": f,
+            }))
+        if not puts:
+            continue
 
-    # Convert glob to regex for CTE
-    tag_regex = tag_pattern.replace("*", ".*").replace("?", ".")
-    blob_regex = blob_pattern.replace("*", ".*").replace("?", ".")
+        try:
+            resp = _send_command({"cmd": "put_many", "items": [item for *_, item in puts]})
+        finally:
+            for *_, item in puts:
+                item["file"].close()
+            for dst in {dst for _, dst, *_ in puts}:
+                _blob_cache.invalidate(dst)
+        if not resp or resp.get("status") != "ok":
+            err = resp.get("message", "unknown") if resp else "no response"
+            logger.error(f"[CTE] put_many of {len(puts)} blob(s) failed: {err}")
+            continue
+        for (key, dst, blob_name, size, _), ok in zip(puts, resp.get("ok", [])):
+            if ok:
+                stored[key] = stored.get(key, 0) + 1
+                logger.info(f"[CTE] Stored {blob_name} in tag '{dst}' ({size} bytes)")
+            else:
+                logger.error(f"[CTE] Failed to store {blob_name}")
+
+    return stored
+
+
+def _cte_context_query(tag_pattern="*", blob_pattern="*"):
+    # TagQuery narrows the tags on the helper side; the compiled globs
+    # give the exact fnmatch result locally
+    tag_regex = _glob_to_regex(tag_pattern)
+    tag_match = _compile_glob(tag_pattern).match
+    blob_match = _compile_glob(blob_pattern).match
 
     results = []
     try:
@@ -254,50 +603,63 @@ def context_query(tag_pattern="*", blob_pattern="*"):
         if not resp or resp.get("status") != "ok":
             return results
 
-        tag_names = resp.get("tags", [])
+        tag_names = list(filter(tag_match, resp.get("tags", [])))
 
-        # For each tag, list blobs and filter
-        import re
-        for tag_name in tag_names:
-            blob_resp = _send_command({"cmd": "list_blobs", "tag": tag_name})
-            if not blob_resp or blob_resp.get("status") != "ok":
-                continue
-
-            for blob_name in blob_resp.get("blobs", []):
-                if re.match(blob_regex, blob_name):
-                    # Get blob size
-                    size_resp = _send_command({
-                        "cmd": "get_size",
-                        "tag": tag_name,
-                        "blob": blob_name,
-                    })
-                    size = size_resp.get("size", 0) if size_resp else 0
-                    results.append({
-                        "tag": tag_name,
-                        "blob": blob_name,
-                        "size": int(size),
-                    })
+        # One listing per tag, all pipelined, then filter locally
+        for tag_name, sizes in zip(tag_names, _list_blobs_with_sizes(tag_names)):
+            for blob_name in filter(blob_match, sizes):
+                results.append({
+                    "tag": tag_name,
+                    "blob": blob_name,
+                    "size": int(sizes[blob_name]),
+                })
     except Exception as e:
         logger.error(f"[CTE] Query failed: {e}")
 
     return results
 
 
-def context_retrieve(tag, blob_name):
-    """Retrieve blob data from IOWarp storage.
-
-    Args:
-        tag: str - tag name
-        blob_name: str - blob identifier
+def _list_blobs_with_sizes(tag_names):
+    """Return a {blob_name: size} dict for each tag, in order.
 
-    Returns:
-        bytes - blob data, or None if not found
+    Falls back to list_blobs + get_size for tags the helper cannot list
+    with sizes (an older cte_helper without list_blobs_with_sizes).
     """
-    _ensure_initialized()
-
-    if _use_stub:
-        return _stub_context_retrieve(tag, blob_name)
+    responses = _send_commands([
+        {"cmd": "list_blobs_with_sizes", "tag": tag_name} for tag_name in tag_names
+    ])
+    listings = []
+    for tag_name, resp in zip(tag_names, responses):
+        if resp and resp.get("status") == "ok":
+            listings.append({b["name"]: b["size"] for b in resp.get("blobs", [])})
+        elif resp:
+            listings.append(_list_blobs_then_sizes(tag_name))
+        else:
+            listings.append({})
+    return listings
+
+
+def _list_blobs_then_sizes(tag_name):
+    blob_resp = _send_command({"cmd": "list_blobs", "tag": tag_name})
+    if not blob_resp or blob_resp.get("status") != "ok":
+        return {}
+    blob_names = blob_resp.get("blobs", [])
+    size_resps = _send_commands([
+        {"cmd": "get_size", "tag": tag_name, "blob": blob_name}
+        for blob_name in blob_names
+    ])
+    return {
+        blob_name: r.get("size", 0) if r else 0
+        for blob_name, r in zip(blob_names, size_resps)
+    }
+
+
+def _cte_context_retrieve(tag, blob_name):
+    data = _blob_cache.get(tag, blob_name)
+    if data is not None:
+        return data
 
+    version = _blob_cache.version(tag)
     try:
         resp = _send_command({"cmd": "get", "tag": tag, "blob": blob_name})
 
@@ -306,9 +668,9 @@ def context_retrieve(tag, blob_name):
             logger.warning(f"[CTE] Retrieve '{tag}/{blob_name}' failed: {err}")
             return None
 
-        hex_data = resp.get("data", "")
-        data = bytes.fromhex(hex_data)
+        data = resp.get("data", b"")
         logger.info(f"[CTE] Retrieved {len(data)} bytes from '{tag}/{blob_name}'")
+        _blob_cache.put(tag, blob_name, data, version)
         return data
 
     except Exception as e:
@@ -316,26 +678,39 @@ def context_retrieve(tag, blob_name):
         return None
 
 
-def context_destroy(tags):
-    """Destroy context tag(s) and all their blobs.
-
-    Args:
-        tags: str or list[str] - tag(s) to destroy
-
-    Returns:
-        dict with status info
-    """
-    _ensure_initialized()
+def _cte_context_retrieve_many(items):
+    results = [_blob_cache.get(item["tag"], item["blob_name"]) for item in items]
+    misses = [i for i, data in enumerate(results) if data is None]
+    if not misses:
+        return results
+
+    # Versions are read before the gets, as in _cte_context_retrieve
+    versions = {items[i]["tag"]: _blob_cache.version(items[i]["tag"]) for i in misses}
+    resps = _send_commands([
+        {"cmd": "get", "tag": items[i]["tag"], "blob": items[i]["blob_name"]}
+        for i in misses
+    ])
+    for i, resp in zip(misses, resps):
+        tag, blob_name = items[i]["tag"], items[i]["blob_name"]
+        if not resp or resp.get("status") != "ok":
+            err = resp.get("message", "unknown") if resp else "no response"
+            logger.warning(f"[CTE] Retrieve '{tag}/{blob_name}' failed: {err}")
+            continue
+        data = resp.get("data", b"")
+        _blob_cache.put(tag, blob_name, data, versions[tag])
+        results[i] = data
+    logger.info(f"[CTE] Retrieved {len(misses)} blob(s) in one pipelined batch")
+    return results
 
-    if _use_stub:
-        return _stub_context_destroy(tags)
 
+def _cte_context_destroy(tags):
     tag_list = [tags] if isinstance(tags, str) else tags
     destroyed = []
 
     for tag_name in tag_list:
         try:
             resp = _send_command({"cmd": "del_tag", "tag": tag_name})
+            _blob_cache.invalidate(tag_name)
             if resp and resp.get("status") == "ok":
                 destroyed.append(tag_name)
                 logger.info(f"[CTE] Destroyed tag '{tag_name}'")
@@ -348,18 +723,7 @@ def context_destroy(tags):
     return {"status": "ok", "destroyed": destroyed}
 
 
-def get_stub_state():
-    """Debug function to inspect storage state."""
-    _ensure_initialized()
-
-    if _use_stub:
-        return {
-            "backend": "stub",
-            "tags": list(_stub_storage.keys()),
-            "blobs": {tag: list(blobs.keys()) for tag, blobs in _stub_storage.items()},
-            "total_size": sum(sum(len(v) for v in blobs.values()) for blobs in _stub_storage.values())
-        }
-
+def _cte_state():
     # Real backend - query CTE for state via helper
     try:
         resp = _send_command({"cmd": "tag_query", "pattern": ".*"})
@@ -377,4 +741,109 @@ def get_stub_state():
         return {"backend": "cte", "error": str(e)}
 
 
-__all__ = ['context_bundle', 'context_query', 'context_retrieve', 'context_destroy', 'get_stub_state']
+class _HelperBackend:
+    bundle = staticmethod(_cte_context_bundle)
+    bundle_many = staticmethod(_cte_context_bundle_many)
+    query = staticmethod(_cte_context_query)
+    retrieve = staticmethod(_cte_context_retrieve)
+    retrieve_many = staticmethod(_cte_context_retrieve_many)
+    destroy = staticmethod(_cte_context_destroy)
+    state = staticmethod(_cte_state)
+
+
+class _StubBackend:
+    bundle = staticmethod(_stub_context_bundle)
+    bundle_many = staticmethod(_stub_context_bundle_many)
+    query = staticmethod(_stub_context_query)
+    retrieve = staticmethod(_stub_context_retrieve)
+    retrieve_many = staticmethod(_stub_context_retrieve_many)
+    destroy = staticmethod(_stub_context_destroy)
+    state = staticmethod(_stub_state)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def context_bundle(src, dst, format="arrow"):
+    """Ingest data into IOWarp storage.
+
+    Args:
+        src: str or list[str] - source path(s) with scheme (file::, folder::)
+        dst: str - destination tag name
+        format: str - data format (arrow, binary, etc.)
+
+    Returns:
+        dict with status and tag info
+    """
+    return (_backend or _ensure_initialized()).bundle(src, dst, format)
+
+
+def context_bundle_many(items):
+    """Ingest several (src, dst, format) bundles in one call.
+
+    Args:
+        items: list[dict] - each with src, dst and optional format keys
+
+    Returns:
+        list of per-item dicts, as context_bundle would return them
+    """
+    return (_backend or _ensure_initialized()).bundle_many(items)
+
+
+def context_query(tag_pattern="*", blob_pattern="*"):
+    """Query for blobs matching patterns.
+
+    Args:
+        tag_pattern: str - glob pattern for tags
+        blob_pattern: str - glob pattern for blob names
+
+    Returns:
+        list of dicts with tag/blob/size info
+    """
+    return (_backend or _ensure_initialized()).query(tag_pattern, blob_pattern)
+
+
+def context_retrieve(tag, blob_name):
+    """Retrieve blob data from IOWarp storage.
+
+    Args:
+        tag: str - tag name
+        blob_name: str - blob identifier
+
+    Returns:
+        bytes - blob data, or None if not found
+    """
+    return (_backend or _ensure_initialized()).retrieve(tag, blob_name)
+
+
+def context_retrieve_many(items):
+    """Retrieve several blobs in one call.
+
+    Args:
+        items: list[dict] - each with tag and blob_name keys
+
+    Returns:
+        list of bytes (or None if not found), one per item, in order
+    """
+    return (_backend or _ensure_initialized()).retrieve_many(items)
+
+
+def context_destroy(tags):
+    """Destroy context tag(s) and all their blobs.
+
+    Args:
+        tags: str or list[str] - tag(s) to destroy
+
+    Returns:
+        dict with status info
+    """
+    return (_backend or _ensure_initialized()).destroy(tags)
+
+
+def get_stub_state():
+    """Debug function to inspect storage state."""
+    return (_backend or _ensure_initialized()).state()
+
+
+__all__ = ['context_bundle', 'context_bundle_many', 'context_query', 'context_retrieve', 'context_retrieve_many', 'context_destroy', 'get_stub_state']
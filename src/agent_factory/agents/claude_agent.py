@@ -10,6 +10,12 @@ a JSON response with {thought, action, params}, and converts it into an
 Action the environment can execute — exactly the same interface as
 IOWarpAgent and LLMAgent.
 
+One ``claude`` process is kept running in stream-json mode and fed one
+user message per observation, so CLI startup and system-prompt loading
+are paid once per session instead of once per turn.  The session is
+restarted after ``MAX_SESSION_TURNS`` turns to bound its context, and
+whenever the process dies or times out.
+
 Requires:
     Claude Code CLI installed and authenticated (``claude --version``).
 """
@@ -18,14 +24,26 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+import re
 import shutil
 import subprocess
+import threading
 from typing import Any
 
 from agent_factory.core.types import Action, Observation
 
 log = logging.getLogger(__name__)
 
+try:
+    import msgspec
+
+    _decode_json = msgspec.json.Decoder().decode
+    _JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError, msgspec.DecodeError)
+except ImportError:  # optional dependency
+    _decode_json = json.loads
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
 SYSTEM_PROMPT = """\
 You are an intelligent data management agent. You interact with a data storage
 system called IOWarp through an environment that understands these actions:
@@ -74,17 +92,124 @@ no explanation outside the JSON.
 """
 
 
+# An opening fence line (```json) or a closing fence at the very end
+_FENCE_RE = re.compile(r"\A```[^\n]*\n|\n?```\Z")
+
+
 def _parse_response(raw: str) -> dict[str, Any]:
     """Extract JSON from the Claude Code response, handling common quirks."""
     text = raw.strip()
 
-    # Strip markdown code fences if present
+    # Strip markdown code fences if present; fences inside the JSON survive
     if text.startswith("```"):
-        lines = text.split("\n")
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines).strip()
+        text = _FENCE_RE.sub("", text).strip()
+
+    return _decode_json(text)
+
+
+def session_argv(cli: str, model: str, system_prompt: str) -> tuple[str, ...]:
+    """``claude -p`` arguments for a stream-json session with no tools."""
+    return (
+        cli,
+        "-p",
+        "--model", model,
+        "--system-prompt", system_prompt,
+        "--tools", "",
+        "--no-session-persistence",
+        "--input-format", "stream-json",
+        "--output-format", "stream-json",
+        "--verbose",
+    )
 
-    return json.loads(text)
+
+class ClaudeSession:
+    """One long-lived ``claude -p`` process fed user turns over stream-json.
+
+    The process is started on the first turn and replaced after
+    *max_turns* turns, or whenever it dies or a turn fails.  Thread-safe.
+    """
+
+    def __init__(self, argv: tuple[str, ...], max_turns: int, timeout_s: float) -> None:
+        # Fixed for the session's lifetime; the system prompt crosses argv
+        # once per process, never per turn
+        self._argv = argv
+        self._max_turns = max_turns
+        self._timeout_s = timeout_s
+        self._proc: subprocess.Popen | None = None
+        self._lines: queue.Queue[str | None] = queue.Queue()
+        self._turns = 0
+        self._lock = threading.Lock()
+
+    def send(self, user_text: str) -> dict[str, Any]:
+        """Send one user message and return its ``result`` event."""
+        with self._lock:
+            return self._send_turn(user_text)
+
+    def close(self) -> None:
+        """Stop the background ``claude`` process, if any."""
+        with self._lock:
+            self._stop()
+
+    def _start(self) -> subprocess.Popen:
+        proc = subprocess.Popen(
+            self._argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1 << 16,
+        )
+        # A reader thread lets a turn wait on the reply with a timeout
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump, args=(proc.stdout, self._lines), daemon=True,
+        ).start()
+        self._turns = 0
+        return proc
+
+    @staticmethod
+    def _pump(stdout: Any, lines: queue.Queue[str | None]) -> None:
+        for line in stdout:
+            lines.put(line)
+        lines.put(None)  # EOF
+
+    def _stop(self) -> None:
+        if self._proc is not None:
+            if self._proc.poll() is None:
+                self._proc.kill()
+            self._proc = None
+
+    def _send_turn(self, user_text: str) -> dict[str, Any]:
+        if (
+            self._proc is None
+            or self._proc.poll() is not None
+            or self._turns >= self._max_turns
+        ):
+            self._stop()
+            self._proc = self._start()
+        self._turns += 1
+
+        message = {"type": "user", "message": {"role": "user", "content": user_text}}
+        try:
+            self._proc.stdin.write(json.dumps(message) + "\n")
+            self._proc.stdin.flush()
+
+            while True:
+                try:
+                    line = self._lines.get(timeout=self._timeout_s)
+                except queue.Empty:
+                    raise subprocess.TimeoutExpired(self._argv[0], self._timeout_s) from None
+                if line is None:
+                    raise RuntimeError("Claude CLI exited unexpectedly")
+                if not line.strip():
+                    continue
+                event = _decode_json(line)
+                if event.get("type") == "result":
+                    return event
+        except Exception:
+            # The session is out of step with us; start a fresh one next turn
+            self._stop()
+            raise
 
 
 class ClaudeAgent:
@@ -97,6 +222,11 @@ class ClaudeAgent:
     is handled by the existing Claude Code session.
     """
 
+    #: Turns sent to one ``claude`` process before it is replaced.
+    MAX_SESSION_TURNS = 20
+    #: Seconds to wait for the reply to one turn.
+    TIMEOUT_S = 60
+
     def __init__(self, model: str = "sonnet") -> None:
         cli = shutil.which("claude")
         if cli is None:
@@ -106,6 +236,11 @@ class ClaudeAgent:
             )
         self._cli = cli
         self._model = model
+        self._session = ClaudeSession(
+            session_argv(cli, model, SYSTEM_PROMPT),
+            max_turns=self.MAX_SESSION_TURNS,
+            timeout_s=self.TIMEOUT_S,
+        )
         self._last_response: dict[str, Any] = {}
 
     def think(self, observation: Observation) -> str:
@@ -136,41 +271,33 @@ class ClaudeAgent:
 
         return Action(name=action_name, params=params)
 
+    def close(self) -> None:
+        """Stop the background ``claude`` process, if any."""
+        self._session.close()
+
     def _call_claude(self, user_text: str) -> dict[str, Any]:
         """Send the observation to Claude Code CLI and parse the JSON response."""
         try:
-            result = subprocess.run(
-                [
-                    self._cli,
-                    "-p",
-                    "--model", self._model,
-                    "--system-prompt", SYSTEM_PROMPT,
-                    "--tools", "",
-                    "--no-session-persistence",
-                    user_text,
-                ],
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
+            result = self._session.send(user_text)
 
-            if result.returncode != 0:
-                log.warning("Claude CLI exited with code %d: %s", result.returncode, result.stderr)
+            if result.get("is_error") or result.get("subtype") != "success":
+                error = result.get("result") or result.get("subtype", "unknown error")
+                log.warning("Claude CLI turn failed: %s", error)
                 self._last_response = {
-                    "thought": f"Claude CLI error: {result.stderr.strip()}",
+                    "thought": f"Claude CLI error: {error}",
                     "action": "query",
                     "params": {"tag_pattern": "*"},
                 }
                 return self._last_response
 
-            raw = result.stdout
+            raw = result.get("result", "")
             log.debug("Claude CLI raw response: %s", raw)
 
             parsed = _parse_response(raw)
             self._last_response = parsed
             return parsed
 
-        except json.JSONDecodeError as exc:
+        except _JSON_ERRORS as exc:
             log.warning("Claude returned invalid JSON: %s", exc)
             self._last_response = {
                 "thought": f"Failed to parse Claude response: {exc}",
@@ -180,7 +307,7 @@ class ClaudeAgent:
             return self._last_response
 
         except subprocess.TimeoutExpired:
-            log.error("Claude CLI timed out after 60s")
+            log.error("Claude CLI timed out after %ds", self.TIMEOUT_S)
             self._last_response = {
                 "thought": "Claude CLI timed out",
                 "action": "query",
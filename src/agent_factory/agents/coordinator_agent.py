@@ -6,18 +6,59 @@ delegate to the appropriate specialized agent (IngestorAgent or RetrieverAgent).
 The coordinator enables natural language multi-agent interaction without
 predefined pipelines. You can say "ingest folder://data as research_docs"
 and the coordinator will parse the intent, route to IngestorAgent, and execute.
+
+Routing calls go through one process-wide ``anthropic.Anthropic`` client
+(pooled keep-alive connections, no process spawn) when the ``anthropic``
+package is installed and ``ANTHROPIC_API_KEY`` is set; otherwise they go
+to one long-lived ``claude`` CLI process in stream-json mode, which needs
+no API key.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-from typing import Any
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
 
 from agent_factory.core.types import Action, Observation
 
 log = logging.getLogger(__name__)
 
+try:
+    import anthropic
+
+    HAS_ANTHROPIC = True
+except ImportError:  # optional dependency
+    HAS_ANTHROPIC = False
+
+try:
+    import msgspec
+
+    _decode_json = msgspec.json.Decoder().decode
+    _JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError, msgspec.DecodeError)
+except ImportError:  # optional dependency
+    _decode_json = json.loads
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
+#: Routing only picks an agent, so a small fast model is enough; the
+#: delegated agents keep their own (larger) models.
+ROUTER_MODEL = "haiku"
+#: Model used for routing through the Anthropic SDK.
+SDK_MODEL = "claude-haiku-4-5"
+# The claude CLI's model aliases as Messages API model ids
+_SDK_MODEL_IDS = {
+    "haiku": "claude-haiku-4-5",
+    "sonnet": "claude-sonnet-4-5",
+    "opus": "claude-opus-4-1",
+}
+_TIMEOUT_S = 30
+# Routing turns per claude process; earlier commands stay in its context
+_SESSION_TURNS = 20
+_sdk: Any = None
+
 COORDINATOR_SYSTEM_PROMPT = """\
 You are a coordinator agent that routes user commands to specialized agents.
 
@@ -65,10 +106,122 @@ RESPONSE FORMAT (JSON only):
   "instruction": "simplified command for the chosen agent"
 }
 
+For a command with several independent parts (e.g. "ingest X and ingest Y"),
+also add parallel lists, one entry per part, in the order they should run:
+  "agents": ["ingestor", "ingestor"],
+  "instructions": ["assimilate X ...", "assimilate Y ..."]
+
 IMPORTANT: Respond with ONLY the JSON object. No markdown, no code fences.
 """
 
 
+# Agent that owns each rule-matched action (see the routing prompt above)
+_ACTION_AGENTS = {
+    "assimilate": "ingestor",
+    "query": "retriever",
+    "retrieve": "retriever",
+    "list_blobs": "retriever",
+    "destroy": "retriever",
+    "prune": "retriever",
+}
+
+# Delegation for compound commands; sub-agents mostly wait on LLM calls
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Routing decisions by normalised command, shared by every coordinator so a
+# repeated command skips the LLM round trip entirely.
+_ROUTE_CACHE_SIZE = 512
+_route_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+
+# SDK routing is forced through this one tool, so the reply is already a
+# schema-shaped dict rather than text to parse.
+_ROUTE_TOOL = {
+    "name": "route",
+    "description": "Route the user command to one specialized agent.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "thought": {"type": "string"},
+            "agent": {"type": "string"},
+            "instruction": {"type": "string"},
+            "agents": {"type": "array", "items": {"type": "string"}},
+            "instructions": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["thought", "agent", "instruction"],
+        "additionalProperties": False,
+    },
+}
+
+# The system prompt is a static cache breakpoint: the command only ever goes
+# in the user turn, so the prefix is identical on every call.
+_SYSTEM_BLOCKS = [
+    {"type": "text", "text": COORDINATOR_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}},
+]
+
+
+def _sdk_client() -> Any:
+    """The shared Anthropic client, or None to fall back to the claude CLI."""
+    global _sdk
+    if _sdk is None and HAS_ANTHROPIC and os.environ.get("ANTHROPIC_API_KEY"):
+        _sdk = anthropic.Anthropic(timeout=_TIMEOUT_S)
+    return _sdk
+
+
+def _first_json_object(stream: Iterable[str]) -> str | None:
+    """Read lines from *stream* until one top-level JSON object is complete.
+
+    Returns the object's text, or None if the stream ends first.  Anything
+    before the opening brace (code fences, preamble) is skipped.
+    """
+    parts: list[str] = []
+    depth = 0
+    in_str = escaped = False
+    for line in stream:
+        start = 0
+        if depth == 0:
+            start = line.find("{")
+            if start < 0:
+                continue
+        for i in range(start, len(line)):
+            ch = line[i]
+            if in_str:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_str = False
+            elif ch == '"':
+                in_str = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}":
+                depth -= 1
+                if depth == 0:
+                    parts.append(line[start:i + 1])
+                    return "".join(parts)
+        parts.append(line[start:])
+    return None
+
+
+def _normalize(text: str) -> str:
+    """Cache key for a command: lowercased, whitespace collapsed."""
+    return " ".join(text.lower().split())
+
+
+def _describe(routing: dict[str, Any]) -> str:
+    agents = routing.get("agents")
+    if isinstance(agents, list) and agents:
+        target = ", ".join(map(str, agents))
+    else:
+        target = routing.get("agent", "retriever")
+    return (
+        f"Coordinator decision: Route to '{target}'\n"
+        f"Reasoning: {routing.get('thought', 'No reasoning provided')}"
+    )
+
+
 class CoordinatorAgent:
     """Routes natural language commands to specialized agents.
 
@@ -84,24 +237,50 @@ class CoordinatorAgent:
         self,
         backend: Any,  # LLM agent (ClaudeAgent, LLMAgent, etc.)
         agents: dict[str, Any],  # {"ingestor": BuiltAgent, "retriever": BuiltAgent}
+        router_model: str | None = None,
     ) -> None:
         """Initialize coordinator with an LLM backend and specialized agents.
         
         Args:
             backend: LLM agent for parsing commands (typically ClaudeAgent)
             agents: Dictionary mapping agent names to BuiltAgent instances
+            router_model: Model that makes the routing call (defaults to
+                ``ROUTER_MODEL`` for the CLI, ``SDK_MODEL`` for the SDK).
+                CLI aliases such as ``haiku`` are mapped to API model ids
+                for the SDK.
         """
         self._backend = backend
+        self._router_model = router_model
         self._agents = agents
         self._last_routing: dict[str, Any] = {}
+        self._session: Any = None  # ClaudeSession, started on first CLI routing
 
     def think(self, observation: Observation) -> str:
         """Parse command using LLM and decide routing."""
-        # Build prompt for LLM to parse routing decision
-        routing_prompt = f"{COORDINATOR_SYSTEM_PROMPT}\n\nUser command: {observation.text}"
-        
+        key = _normalize(observation.text)
+        cached = _route_cache.get(key)
+        if cached is not None:
+            _route_cache.move_to_end(key)
+            self._last_routing = dict(cached)
+            return _describe(cached)
+
+        # Cascade: when the keyword rules point at exactly one registered
+        # agent, that is the routing and the LLM is not needed at all
+        agent = self._rule_route(observation.text)
+        if agent is not None:
+            self._last_routing = {
+                "thought": "rule-matched",
+                "agent": agent,
+                "instruction": observation.text,
+            }
+            return _describe(self._last_routing)
+
+        client = _sdk_client()
+        if client is not None:
+            model = _SDK_MODEL_IDS.get(self._router_model, self._router_model) or SDK_MODEL
+            return self._route(key, observation, lambda: self._ask_sdk(client, model, observation))
+
         # Call Claude CLI directly with our custom system prompt
-        import subprocess
         import shutil
         
         cli = shutil.which("claude")
@@ -113,54 +292,114 @@ class CoordinatorAgent:
                 "thought": "Claude CLI not available"
             }
             return "Coordinator: Claude CLI not available, defaulting to retriever"
-        
-        try:
-            result = subprocess.run(
-                [
-                    cli,
-                    "-p",
-                    "--model", "sonnet",
-                    "--system-prompt", COORDINATOR_SYSTEM_PROMPT,
-                    "--tools", "",
-                    "--no-session-persistence",
-                    f"User command: {observation.text}",
-                ],
-                capture_output=True,
-                text=True,
-                timeout=30,
+
+        return self._route(key, observation, lambda: self._ask_cli(cli, observation.text))
+
+    def _ask_cli(self, cli: str, text: str) -> str | None:
+        """Ask the ``claude`` CLI to route *text*; None if the call failed."""
+        result = self._cli_session(cli).send(f"User command: {text}")
+        if result.get("is_error") or result.get("subtype") != "success":
+            log.warning(f"Claude CLI error: {result.get('result') or result.get('subtype')}")
+            return None
+        # Keep only the routing object, dropping any preamble or fences
+        reply = result.get("result", "")
+        return _first_json_object(reply.splitlines(keepends=True)) or reply
+
+    def _cli_argv(self, cli: str) -> tuple[str, ...]:
+        """``claude`` arguments for this coordinator's routing session."""
+        from agent_factory.agents.claude_agent import session_argv
+
+        return session_argv(cli, self._router_model or ROUTER_MODEL, COORDINATOR_SYSTEM_PROMPT)
+
+    def _cli_session(self, cli: str) -> Any:
+        """This coordinator's persistent ``claude`` routing session."""
+        if self._session is None:
+            from agent_factory.agents.claude_agent import ClaudeSession
+
+            self._session = ClaudeSession(
+                self._cli_argv(cli),
+                max_turns=_SESSION_TURNS,
+                timeout_s=_TIMEOUT_S,
             )
-            
-            if result.returncode != 0:
-                log.warning(f"Claude CLI error: {result.stderr}")
+        return self._session
+
+    def close(self) -> None:
+        """Stop the background ``claude`` routing process, if any."""
+        if self._session is not None:
+            self._session.close()
+
+    def _rule_route(self, text: str) -> str | None:
+        """The one agent the keyword rules route *text* to, else None."""
+        from agent_factory.agents.iowarp_agent import matched_actions
+
+        agents = {_ACTION_AGENTS[a] for a in matched_actions(text)}
+        if len(agents) == 1:
+            (agent,) = agents
+            if agent in self._agents:
+                return agent
+        return None
+
+    @staticmethod
+    def _ask_sdk(client: Any, model: str, observation: Observation) -> dict[str, Any] | str:
+        message = client.messages.create(
+            model=model,
+            max_tokens=256,
+            system=_SYSTEM_BLOCKS,
+            tools=[_ROUTE_TOOL],
+            tool_choice={"type": "tool", "name": "route"},
+            messages=[{"role": "user", "content": f"User command: {observation.text}"}],
+        )
+        for block in message.content:
+            if block.type == "tool_use":
+                return dict(block.input)
+        return "".join(b.text for b in message.content if b.type == "text")
+
+    def _route(
+        self,
+        key: str,
+        observation: Observation,
+        ask: Callable[[], dict[str, Any] | str | None],
+    ) -> str:
+        """Run *ask* for the LLM's reply and turn it into a routing.
+
+        *ask* returns the routing dict itself (SDK tool use), reply text
+        to parse, or None when the LLM call itself failed.
+        """
+        response_text = ""
+        try:
+            reply = ask()
+            if reply is None:
                 self._last_routing = {
                     "agent": "retriever",
                     "instruction": observation.text,
                     "thought": "Claude CLI error"
                 }
                 return "Coordinator: Claude CLI error, defaulting to retriever"
-            
-            response_text = result.stdout.strip()
-            log.debug(f"Claude response: {response_text}")
-            
-            # Parse JSON from response
-            if response_text.startswith("```"):
-                # Strip markdown code fences
-                lines = response_text.split("\n")
-                lines = [l for l in lines if not l.strip().startswith("```")]
-                response_text = "\n".join(lines).strip()
-            
-            routing = json.loads(response_text)
+
+            if isinstance(reply, dict):
+                routing = reply
+            else:
+                response_text = reply.strip()
+                log.debug(f"Claude response: {response_text}")
+
+                # Parse JSON from response
+                if response_text.startswith("```"):
+                    # Strip markdown code fences
+                    lines = response_text.split("\n")
+                    lines = [l for l in lines if not l.strip().startswith("```")]
+                    response_text = "\n".join(lines).strip()
+
+                routing = _decode_json(response_text)
             self._last_routing = routing
+
+            # Only real LLM decisions are cached, never the fallbacks
+            _route_cache[key] = dict(routing)
+            if len(_route_cache) > _ROUTE_CACHE_SIZE:
+                _route_cache.popitem(last=False)
+
+            return _describe(routing)
             
-            agent_name = routing.get("agent", "retriever")
-            routing_thought = routing.get("thought", "No reasoning provided")
-            
-            return (
-                f"Coordinator decision: Route to '{agent_name}'\n"
-                f"Reasoning: {routing_thought}"
-            )
-            
-        except json.JSONDecodeError as exc:
+        except _JSON_ERRORS as exc:
             log.warning(f"Failed to parse routing JSON: {exc}")
             log.warning(f"Response was: {response_text}")
             # Default to retriever for read operations
@@ -179,6 +418,11 @@ class CoordinatorAgent:
             }
             return f"Coordinator error: {exc}"
 
+    def step(self, observation: Observation) -> tuple[str, Action]:
+        """Route and delegate in one go (a single routing call)."""
+        thought = self.think(observation)
+        return thought, self.act(observation)
+
     def act(self, observation: Observation) -> Action:
         """Delegate to the chosen specialized agent."""
         if not self._last_routing:
@@ -187,10 +431,41 @@ class CoordinatorAgent:
         
         routing = self._last_routing
         self._last_routing = {}
-        
-        agent_name = routing.get("agent", "retriever")
-        instruction = routing.get("instruction", observation.text)
-        
+
+        agent_names = routing.get("agents")
+        if isinstance(agent_names, list) and agent_names:
+            # Compound command: delegate the parts concurrently, but keep
+            # the sub-actions in routing order for the environment
+            instructions = routing.get("instructions") or []
+            tasks = [
+                (name, instructions[i] if i < len(instructions) else observation.text)
+                for i, name in enumerate(agent_names)
+            ]
+            # Sub-agents keep per-call state between think() and act(), so
+            # each agent works through its own tasks in order and only
+            # different agents run at the same time
+            groups: dict[int, list[int]] = {}
+            for i, (name, _) in enumerate(tasks):
+                target = self._agents.get(name) or self._agents.get("retriever")
+                groups.setdefault(id(target), []).append(i)
+
+            def run(indices: list[int]) -> list[tuple[int, Action]]:
+                return [(i, self._delegate(*tasks[i], observation)) for i in indices]
+
+            actions: list[Action | None] = [None] * len(tasks)
+            for future in [_EXECUTOR.submit(run, indices) for indices in groups.values()]:
+                for i, action in future.result():
+                    actions[i] = action
+            return Action(name="batch", params={"actions": actions})
+
+        return self._delegate(
+            routing.get("agent", "retriever"),
+            routing.get("instruction", observation.text),
+            observation,
+        )
+
+    def _delegate(self, agent_name: str, instruction: str, observation: Observation) -> Action:
+        """Ask one specialized agent to act on *instruction*."""
         # Get the specialized BuiltAgent
         built_agent = self._agents.get(agent_name)
         if built_agent is None:
@@ -209,9 +484,7 @@ class CoordinatorAgent:
             done=observation.done,
         )
         
-        log.info(f"Coordinator: Routing to {agent_name} with instruction: {instruction}")
-        print(f"\n  \033[36m→ Coordinator routing to '{agent_name}' agent\033[0m")
-        print(f"    Instruction: {instruction}\n")
+        log.info("Coordinator: Routing to %s with instruction: %s", agent_name, instruction)
         
         # Delegate to the specialized agent (extract .agent from BuiltAgent)
         return built_agent.agent.act(agent_obs)
@@ -9,6 +9,7 @@ best-effort parameter extraction from the observation text.
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from typing import Any
 
 from agent_factory.agents.iowarp_agent import IOWarpAgent
@@ -39,25 +40,41 @@ class IngestorAgent:
         self._backend = backend
         self._default_tag = default_tag
         self._default_format = default_format
+        # (observation, augmented) from think(), reused by the matching act()
+        self._pending: tuple[Observation, Observation] | None = None
 
     def think(self, observation: Observation) -> str:
         """Prepend ingestor context and delegate to backend."""
-        augmented = Observation(
-            text=_INGESTOR_PREFIX + observation.text,
-            data=observation.data,
-            done=observation.done,
-        )
-        return self._backend.think(augmented)
+        return self._backend.think(self._augment(observation))
 
     def act(self, observation: Observation) -> Action:
         """Delegate to backend; override to ``assimilate`` if needed."""
-        augmented = Observation(
-            text=_INGESTOR_PREFIX + observation.text,
-            data=observation.data,
-            done=observation.done,
-        )
-        action = self._backend.act(augmented)
+        action = self._backend.act(self._augment(observation))
+        self._pending = None
+        return self._constrain(action, observation)
+
+    def step(self, observation: Observation) -> tuple[str, Action]:
+        """Think and act together, in one backend call when it has ``step()``."""
+        augmented = self._augment(observation)
+        self._pending = None
+        if hasattr(type(self._backend), "step"):
+            thought, action = self._backend.step(augmented)
+        else:
+            thought = self._backend.think(augmented)
+            action = self._backend.act(augmented)
+        return thought, self._constrain(action, observation)
+
+    def _augment(self, observation: Observation) -> Observation:
+        """The observation with the ingestor prefix, built once per think/act pair."""
+        pending = self._pending
+        if pending is not None and pending[0] is observation:
+            return pending[1]
+        augmented = replace(observation, text=_INGESTOR_PREFIX + observation.text)
+        self._pending = (observation, augmented)
+        return augmented
 
+    def _constrain(self, action: Action, observation: Observation) -> Action:
+        """Pass ``assimilate`` through with defaults, override anything else."""
         if action.name == "assimilate":
             # Ensure defaults are filled in
             params = dict(action.params)
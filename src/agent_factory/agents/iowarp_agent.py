@@ -7,8 +7,10 @@ agent later with the same think()/act() interface.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -18,123 +20,123 @@ log = logging.getLogger(__name__)
 
 # Keyword → action mapping (order matters — first match wins).
 # Matched with word boundaries so "ingestion" won't match "ingest".
-_RULES: list[tuple[re.Pattern[str], str]] = [
-    (re.compile(r"\bingest\b"), "assimilate"),
-    (re.compile(r"\bassimilate\b"), "assimilate"),
-    (re.compile(r"\bimport\b"), "assimilate"),
-    (re.compile(r"\bload\b"), "assimilate"),
-    (re.compile(r"\bfind\b"), "query"),
-    (re.compile(r"\bsearch\b"), "query"),
-    (re.compile(r"\bquery\b"), "query"),
-    (re.compile(r"\blist\b"), "list_blobs"),
-    (re.compile(r"\bget\b"), "retrieve"),
-    (re.compile(r"\bretrieve\b"), "retrieve"),
-    (re.compile(r"\bfetch\b"), "retrieve"),
-    (re.compile(r"\bread\b"), "retrieve"),
-    (re.compile(r"\bdestroy\b"), "destroy"),  # Permanent deletion (tag-level)
-    (re.compile(r"\bprune\b"), "prune"),      # Cache eviction (blob-level)
-    (re.compile(r"\bevict\b"), "prune"),
-    (re.compile(r"\bdelete\b"), "destroy"),   # Default to permanent
-    (re.compile(r"\bremove\b"), "destroy"),
+_RULES: list[tuple[str, str]] = [
+    ("ingest", "assimilate"),
+    ("assimilate", "assimilate"),
+    ("import", "assimilate"),
+    ("load", "assimilate"),
+    ("find", "query"),
+    ("search", "query"),
+    ("query", "query"),
+    ("list", "list_blobs"),
+    ("get", "retrieve"),
+    ("retrieve", "retrieve"),
+    ("fetch", "retrieve"),
+    ("read", "retrieve"),
+    ("destroy", "destroy"),  # Permanent deletion (tag-level)
+    ("prune", "prune"),      # Cache eviction (blob-level)
+    ("evict", "prune"),
+    ("delete", "destroy"),   # Default to permanent
+    ("remove", "destroy"),
 ]
-
-
-class IOWarpAgent:
-    """Rule-based agent that maps observation keywords to IOWarp actions.
-
-    Satisfies the ``Agent`` protocol from ``agent_factory.core.protocols``.
+_ACTIONS = dict(_RULES)
+
+# All rules in one regex.  Each branch is an anchored lookahead, so the
+# alternation is tried in rule order (not text order) and ``lastgroup``
+# names the first rule whose keyword occurs anywhere in the text.
+_COMBINED = re.compile(
+    "|".join(rf"\A(?=.*?(?P<{kw}>\b{kw}\b))" for kw, _ in _RULES),
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Every keyword at once, for finding all the actions a text mentions
+_KEYWORD_RE = re.compile(
+    r"\b(" + "|".join(kw for kw, _ in _RULES) + r")\b",
+    re.IGNORECASE,
+)
+
+
+def matched_actions(text: str) -> set[str]:
+    """All actions whose keywords occur in *text* (empty if none)."""
+    return {_ACTIONS[kw.lower()] for kw in _KEYWORD_RE.findall(text)}
+
+
+# Explicit URI schemes, tried in this order (like _COMBINED, each branch is
+# an anchored lookahead so scheme order wins over position in the text)
+_URI_SCHEME_RE = re.compile(
+    "|".join(
+        rf"\A(?=.*?({re.escape(scheme)}\S+))"
+        for scheme in ("file::", "folder::", "mem::", "hdf5::")
+    ),
+    re.DOTALL,
+)
+_PATH_RE = re.compile(r"((?:\./|/|\.\./)[\w./-]+)")
+
+_TAG_EXPLICIT_RE = re.compile(r"tag[:\s=]+['\"]?(\w+)")
+_TAG_FROM_RE = re.compile(r"\bfrom\s+['\"]?(\w+)")
+_TAG_INTO_RE = re.compile(r"(?:into|as)\s+['\"]?(\w+)")
+_TAG_VERB_RE = re.compile(
+    r"\b(?:destroy|delete|remove|query|find|search|list)\s+['\"]?(\w+)",
+    re.IGNORECASE,
+)
+# Words after a verb that are never a tag name
+_SKIP_WORDS = frozenset({"the", "all", "a", "an", "this", "that", "it", "from", "in"})
+
+_BLOB_EXPLICIT_RE = re.compile(r"blob[:\s=]+['\"]?([\w.-]+)")
+_BLOB_VERB_RE = re.compile(r"(?:prune|get|evict|retrieve)\s+['\"]?([\w.-]+\.[\w]+)\s+from")
+_PATTERN_RE = re.compile(r"pattern[:\s=]+['\"]?(\S+)")
+
+# Phrases that ask retrieve to bypass the blob cache
+_SKIP_CACHE_RE = re.compile(
+    r"\bforce\b|\bbypass\s+cache\b|\bskip\s+cache\b"
+    r"|\bfrom\s+iowarp\b|\bdirect(?:ly)?\b|\bno\s+cache\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass(frozen=True)
+class _ParsedText:
+    """Observation text whose matched keyword and extracted fields are each
+    computed at most once, on first use, and shared by every caller.
+
+    Only pure text parsing is cached; ``uri`` re-checks the filesystem.
     """
 
-    def __init__(self, default_params: dict[str, Any] | None = None) -> None:
-        self._default_params = default_params or {}
-
-    def think(self, observation: Observation) -> str:
-        """Produce a reasoning trace from an observation."""
-        text = observation.text.lower()
-
-        for pattern, action_name in _RULES:
-            if pattern.search(text):
-                return (
-                    f"Observation matches '{pattern.pattern}' → "
-                    f"will perform '{action_name}'."
-                )
-
-        return "No matching keyword found — defaulting to query."
-
-    def act(self, observation: Observation) -> Action:
-        """Choose an action given an observation."""
-        text = observation.text.lower()
-        # Keep original text for path extraction (case-sensitive)
-        original_text = observation.text
-
-        for pattern, action_name in _RULES:
-            if pattern.search(text):
-                params = self._extract_params(original_text, action_name)
-                return Action(name=action_name, params=params)
+    text: str
 
-        # Default: query everything
-        return Action(name="query", params={"tag_pattern": "*"})
+    @functools.cached_property
+    def keyword(self) -> str | None:
+        """The first rule keyword present in the text, in rule order."""
+        m = _COMBINED.match(self.text)
+        return m.lastgroup if m else None
 
-    def _extract_params(self, text: str, action_name: str) -> dict[str, Any]:
-        """Best-effort parameter extraction from observation text.
-        
-        Note: text should be original case-sensitive text to preserve paths.
-        We do case-insensitive matching for keywords only.
-        """
-        params: dict[str, Any] = dict(self._default_params)
-
-        if action_name == "assimilate":
-            params.setdefault("src", self._extract_uri(text))
-            params.setdefault("dst", self._extract_tag(text))
-            params.setdefault("format", "arrow")
+    @functools.cached_property
+    def explicit_uri(self) -> str | None:
+        """The first URI with an explicit scheme, in scheme order."""
+        match = _URI_SCHEME_RE.match(self.text)
+        return match.group(match.lastindex) if match else None
 
-        elif action_name == "query":
-            params.setdefault("tag_pattern", self._extract_pattern(text) or "*")
+    @functools.cached_property
+    def path(self) -> str | None:
+        """The first plain (absolute or relative) file path."""
+        match = _PATH_RE.search(self.text)
+        return match.group(1) if match else None
 
-        elif action_name == "retrieve":
-            params.setdefault("tag", self._extract_tag(text))
-            params.setdefault("blob_name", self._extract_blob(text))
-            # Check for skip_cache keywords
-            skip = self._should_skip_cache(text)
-            log.debug(f"_should_skip_cache('{text}') = {skip}")
-            if skip:
-                params["skip_cache"] = True
-
-        elif action_name == "prune":
-            # Prune = cache eviction (requires blob_names)
-            params.setdefault("tag", self._extract_tag(text))
-            blob = self._extract_blob(text)
-            if blob and blob != "*":
-                params["blob_names"] = [blob]
-
-        elif action_name == "destroy":
-            # Destroy = permanent deletion (tag-level)
-            params.setdefault("tags", self._extract_tag(text))
-
-        elif action_name == "list_blobs":
-            params.setdefault("tag_pattern", self._extract_pattern(text) or "*")
-
-        return params
-
-    # -- simple extractors (placeholder for LLM) ----------------------------
-
-    @staticmethod
-    def _extract_uri(text: str) -> str:
+    @property
+    def uri(self) -> str:
         """Try to pull a URI from the text.
         
         Auto-detects if a plain path is a folder or file and adds the appropriate scheme.
+        The path is checked on every access, since it may have changed.
         """
         # First, check for explicit URI schemes
-        for scheme in ("file::", "folder::", "mem::", "hdf5::"):
-            match = re.search(rf"{re.escape(scheme)}(\S+)", text)
-            if match:
-                return f"{scheme}{match.group(1)}"
+        if self.explicit_uri:
+            return self.explicit_uri
         
         # Fallback: look for file paths and auto-detect type
         # Match both absolute paths and relative paths
-        match = re.search(r"((?:\./|/|\.\./)[\w./-]+)", text)
-        if match:
-            path_str = match.group(1)
+        path_str = self.path
+        if path_str:
             # Auto-detect if it's a folder or file
             try:
                 path = Path(path_str)
@@ -154,34 +156,30 @@ class IOWarpAgent:
         
         return "file::."
 
-    @staticmethod
-    def _extract_tag(text: str) -> str:
+    @functools.cached_property
+    def tag(self) -> str:
         """Extract tag name from text.
 
         Patterns: "tag:X", "from X", "into X", "as X",
                   "destroy/delete/remove X"
         """
         # Try explicit tag: syntax first
-        match = re.search(r"tag[:\s=]+['\"]?(\w+)", text)
+        match = _TAG_EXPLICIT_RE.search(self.text)
         if match:
             return match.group(1).strip("'\"")
 
         # Try "from X" pattern
-        match = re.search(r"\bfrom\s+['\"]?(\w+)", text)
+        match = _TAG_FROM_RE.search(self.text)
         if match:
             return match.group(1).strip("'\"")
 
         # Try "into X" or "as X" pattern
-        match = re.search(r"(?:into|as)\s+['\"]?(\w+)", text)
+        match = _TAG_INTO_RE.search(self.text)
         if match:
             return match.group(1).strip("'\"")
 
         # Try "destroy/delete/remove X" — tag is the word after the action verb
-        _SKIP_WORDS = {"the", "all", "a", "an", "this", "that", "it", "from", "in"}
-        match = re.search(
-            r"\b(?:destroy|delete|remove|query|find|search|list)\s+['\"]?(\w+)",
-            text, re.IGNORECASE,
-        )
+        match = _TAG_VERB_RE.search(self.text)
         if match:
             word = match.group(1).strip("'\"")
             if word.lower() not in _SKIP_WORDS:
@@ -189,44 +187,143 @@ class IOWarpAgent:
 
         return "default"
 
-    @staticmethod
-    def _extract_blob(text: str) -> str:
+    @functools.cached_property
+    def blob(self) -> str:
         """Extract blob name from text.
         
         Patterns: "blob:X", "prune X from", "get X from", "evict X from"
         """
         # Try explicit blob: syntax first
-        match = re.search(r"blob[:\s=]+['\"]?([\w.-]+)", text)
+        match = _BLOB_EXPLICIT_RE.search(self.text)
         if match:
             return match.group(1).strip("'\"")
         
         # Try "prune/get/evict X from" pattern - blob name before "from"
-        match = re.search(r"(?:prune|get|evict|retrieve)\s+['\"]?([\w.-]+\.[\w]+)\s+from", text)
+        match = _BLOB_VERB_RE.search(self.text)
         if match:
             return match.group(1).strip("'\"")
         
         return "*"
 
-    @staticmethod
-    def _extract_pattern(text: str) -> str | None:
-        match = re.search(r"pattern[:\s=]+['\"]?(\S+)", text)
+    @functools.cached_property
+    def pattern(self) -> str | None:
+        match = _PATTERN_RE.search(self.text)
         if match:
             return match.group(1).strip("'\"")
         return None
 
-    @staticmethod
-    def _should_skip_cache(text: str) -> bool:
+    @functools.cached_property
+    def skip_cache(self) -> bool:
         """Check if text indicates bypassing cache.
         
         Keywords: "force", "bypass cache", "skip cache", "from iowarp", "direct"
         """
-        text_lower = text.lower()
-        skip_keywords = [
-            r"\bforce\b",
-            r"\bbypass\s+cache\b",
-            r"\bskip\s+cache\b",
-            r"\bfrom\s+iowarp\b",
-            r"\bdirect(?:ly)?\b",
-            r"\bno\s+cache\b",
-        ]
-        return any(re.search(pattern, text_lower) for pattern in skip_keywords)
+        return _SKIP_CACHE_RE.search(self.text) is not None
+
+
+@functools.lru_cache(maxsize=128)
+def _parse(text: str) -> _ParsedText:
+    """Shared parse of *text*, so think/act and wrappers reuse one result."""
+    return _ParsedText(text)
+
+
+class IOWarpAgent:
+    """Rule-based agent that maps observation keywords to IOWarp actions.
+
+    Satisfies the ``Agent`` protocol from ``agent_factory.core.protocols``.
+    """
+
+    def __init__(self, default_params: dict[str, Any] | None = None) -> None:
+        self._default_params = default_params or {}
+
+    def think(self, observation: Observation) -> str:
+        """Produce a reasoning trace from an observation."""
+        keyword = _parse(observation.text).keyword
+        if keyword:
+            return (
+                f"Observation matches '\\b{keyword}\\b' → "
+                f"will perform '{_ACTIONS[keyword]}'."
+            )
+
+        return "No matching keyword found — defaulting to query."
+
+    def act(self, observation: Observation) -> Action:
+        """Choose an action given an observation."""
+        # Keywords match case-insensitively; the original text is kept
+        # for path extraction (case-sensitive)
+        keyword = _parse(observation.text).keyword
+        if keyword:
+            action_name = _ACTIONS[keyword]
+            params = self._extract_params(observation.text, action_name)
+            return Action(name=action_name, params=params)
+
+        # Default: query everything
+        return Action(name="query", params={"tag_pattern": "*"})
+
+    def _extract_params(self, text: str, action_name: str) -> dict[str, Any]:
+        """Best-effort parameter extraction from observation text.
+        
+        Note: text should be original case-sensitive text to preserve paths.
+        We do case-insensitive matching for keywords only.
+        """
+        params: dict[str, Any] = dict(self._default_params)
+        parsed = _parse(text)
+
+        if action_name == "assimilate":
+            params.setdefault("src", parsed.uri)
+            params.setdefault("dst", parsed.tag)
+            params.setdefault("format", "arrow")
+
+        elif action_name == "query":
+            params.setdefault("tag_pattern", parsed.pattern or "*")
+
+        elif action_name == "retrieve":
+            params.setdefault("tag", parsed.tag)
+            params.setdefault("blob_name", parsed.blob)
+            # Check for skip_cache keywords
+            skip = parsed.skip_cache
+            log.debug(f"_should_skip_cache('{text}') = {skip}")
+            if skip:
+                params["skip_cache"] = True
+
+        elif action_name == "prune":
+            # Prune = cache eviction (requires blob_names)
+            params.setdefault("tag", parsed.tag)
+            blob = parsed.blob
+            if blob and blob != "*":
+                params["blob_names"] = [blob]
+
+        elif action_name == "destroy":
+            # Destroy = permanent deletion (tag-level)
+            params.setdefault("tags", parsed.tag)
+
+        elif action_name == "list_blobs":
+            params.setdefault("tag_pattern", parsed.pattern or "*")
+
+        return params
+
+    # -- simple extractors (placeholder for LLM) ----------------------------
+
+    @staticmethod
+    def _extract_uri(text: str) -> str:
+        """Try to pull a URI from the text (see ``_ParsedText.uri``)."""
+        return _parse(text).uri
+
+    @staticmethod
+    def _extract_tag(text: str) -> str:
+        """Extract tag name from text (see ``_ParsedText.tag``)."""
+        return _parse(text).tag
+
+    @staticmethod
+    def _extract_blob(text: str) -> str:
+        """Extract blob name from text (see ``_ParsedText.blob``)."""
+        return _parse(text).blob
+
+    @staticmethod
+    def _extract_pattern(text: str) -> str | None:
+        return _parse(text).pattern
+
+    @staticmethod
+    def _should_skip_cache(text: str) -> bool:
+        """Check if text indicates bypassing cache."""
+        return _parse(text).skip_cache
@@ -10,76 +10,165 @@ The LLM returns structured JSON so the environment can execute it.
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 import logging
+import threading
+from collections import OrderedDict
 from typing import Any
 
+import httpx
 import ollama
 
 from agent_factory.core.types import Action, Observation
 
 log = logging.getLogger(__name__)
 
+try:
+    import msgspec
+
+    _decode_json = msgspec.json.Decoder().decode
+    _JSON_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError, msgspec.DecodeError)
+except ImportError:  # optional dependency
+    _decode_json = json.loads
+    _JSON_ERRORS = (json.JSONDecodeError,)
+
 # The system prompt teaches the LLM what tools it has and how to respond.
+# Kept short: it is prefilled on every call.  The reply format is
+# enforced by _RESPONSE_SCHEMA, so no prose is spent on that.
 SYSTEM_PROMPT = """\
-You are an intelligent data management agent. You interact with a data storage
-system called IOWarp through an environment that understands these actions:
-
-ACTIONS YOU CAN TAKE:
-  assimilate  — Ingest files into the storage engine
-                params: src (URI string — COPY EXACTLY as given), dst (tag name), format (data format)
-                URI schemes: "file::path", "folder::path", "hdf5::path"
-  query       — Search for stored data by tag/blob patterns
-                params: tag_pattern (glob like "*" or "docs*")
-  retrieve    — Get a specific piece of data back
-                params: tag (tag name), blob_name (file name)
-  destroy     — Permanently delete entire tag(s) from storage and cache
-                params: tags (tag name or list of tag names)
-  prune       — Evict specific blobs from cache only (data stays in IOWarp)
-                params: tag (tag name), blob_names (list of blob names to evict)
-  list_blobs  — List everything stored under a tag
-                params: tag_pattern (glob like "*")
-
-CRITICAL RULES FOR URIs:
-1. URIs use DOUBLE COLON (::) not slashes. Examples:
-   - "file::data/sample.txt" NOT "file://data/sample.txt"
-   - "folder::/home/user/docs" NOT "folder:///home/user/docs"
-   - "hdf5::./data.h5" NOT "hdf5://./data.h5"
-
-2. When you see a URI in user input, copy it EXACTLY character-by-character.
-   Do NOT convert :: to ://
-   Do NOT remove ./
-   Do NOT add or remove any slashes
-   Do NOT normalize paths
-
-3. If the user says "folder::path", write "folder::path" NOT "folder:///path"
-
-HOW TO RESPOND:
-You must respond with ONLY a JSON object, no other text. The JSON must have:
-{
-  "thought": "your reasoning about what to do and why",
-  "action": "one of: assimilate, query, retrieve, destroy, prune, list_blobs",
-  "params": { ... action parameters ... }
-}
-
-IMPORTANT: Respond with ONLY the JSON object. No markdown, no code fences, no explanation outside the JSON.
+You are a data management agent for the IOWarp storage system.
+
+ACTIONS YOU CAN TAKE (action: params — purpose):
+  assimilate: src (URI), dst (tag), format — ingest files
+  query: tag_pattern (glob, e.g. "*") — search stored data
+  retrieve: tag, blob_name — get one blob back
+  destroy: tags (tag or list of tags) — permanently delete tags
+  prune: tag, blob_names (list) — evict blobs from cache only
+  list_blobs: tag_pattern (glob) — list blobs under matching tags
+
+Reply with one JSON object:
+{"thought": "<your reasoning>", "action": "<one action above>", "params": {...}}
 """
 
+# URI rules, appended to the user message only when it may need them
+_URI_HINT = """
+
+URIs look like scheme::path (file::, folder::, hdf5::). Copy any URI \
+above into src exactly, character for character: never turn :: into ://, \
+never add, drop or normalize slashes or ./"""
+
 
 def _parse_llm_response(raw: str) -> dict[str, Any]:
     """Extract JSON from the LLM response, handling common quirks."""
-    text = raw.strip()
-
-    # Strip markdown code fences if the LLM added them
+    # Structured output makes a bare object the normal case
+    try:
+        return _decode_json(raw)
+    except _JSON_ERRORS:
+        text = raw.strip()
+
+    # Strip markdown code fences if the LLM added them anyway: drop the
+    # opening line (```json) and everything from the closing ``` on
     if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first line (```json) and last line (```)
-        lines = [l for l in lines if not l.strip().startswith("```")]
-        text = "\n".join(lines).strip()
+        start = text.find("\n") + 1
+        end = text.rfind("```")
+        text = text[start:end] if end >= start else text[start:]
 
+    # stdlib json here keeps json.JSONDecodeError as the error type
     return json.loads(text)
 
 
+def _with_hints(user_text: str) -> str:
+    """*user_text*, plus the URI rules if it names a URI or asks to ingest."""
+    from agent_factory.agents.iowarp_agent import matched_actions
+
+    if "::" in user_text or "assimilate" in matched_actions(user_text):
+        return user_text + _URI_HINT
+    return user_text
+
+
+# Default model, pinned to its 4-bit (Q4_K_M) build: decoding streams
+# every weight per token, so fewer bytes per weight means faster replies.
+# Fetch it with ``ollama pull llama3.2:3b-instruct-q4_K_M``.
+DEFAULT_MODEL = "llama3.2:3b-instruct-q4_K_M"
+
+# How long Ollama keeps the model resident after a call
+_KEEP_ALIVE = "30m"
+# Output cap for one decision; the reply is a single small JSON object
+_NUM_PREDICT = 256
+# Fixed context window: a different num_ctx reloads the model and drops
+# its KV cache, so every call asks for the same one
+_NUM_CTX = 4096
+
+# Every action in SYSTEM_PROMPT (and IOWarpEnvironment.step)
+_VALID_ACTIONS = frozenset({"assimilate", "query", "retrieve", "destroy", "prune", "list_blobs"})
+
+# Structured-output schema for the reply: Ollama constrains decoding to
+# it, so the action is always one of _VALID_ACTIONS
+_RESPONSE_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "thought": {"type": "string"},
+        "action": {"type": "string", "enum": sorted(_VALID_ACTIONS)},
+        "params": {"type": "object"},
+    },
+    "required": ["thought", "action", "params"],
+}
+
+# Parsed replies by (model, system prompt, user text), shared by every
+# agent.  Only used at low temperature, where a repeat would be the same.
+_RESPONSE_CACHE_SIZE = 1024
+_MAX_CACHED_TEMPERATURE = 0.1
+_response_cache: OrderedDict[tuple[str, str, str], dict[str, Any]] = OrderedDict()
+_cache_stats = {"hits": 0, "misses": 0}
+
+
+# Supported inference servers.  "llamacpp" is llama.cpp's ``llama-server``
+# through its OpenAI-compatible chat endpoint.
+_BACKENDS = ("ollama", "llamacpp")
+_LLAMACPP_HOST = "http://localhost:8080"
+_LLAMACPP_CHAT = "/v1/chat/completions"
+
+# One client (and its pooled HTTP connections) per (backend, host, timeout),
+# shared by every agent in the process.
+_clients: dict[tuple[str, str | None, float | None], Any] = {}
+_clients_lock = threading.Lock()
+
+
+def _shared_client(backend: str, host: str | None, timeout: float | None) -> Any:
+    key = (backend, host, timeout)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = _new_client(backend, host, timeout)
+    return client
+
+
+def _new_client(
+    backend: str, host: str | None, timeout: float | None, *, asynchronous: bool = False
+) -> Any:
+    if backend == "llamacpp":
+        cls = httpx.AsyncClient if asynchronous else httpx.Client
+        return cls(base_url=host or _LLAMACPP_HOST, timeout=timeout)
+    cls = ollama.AsyncClient if asynchronous else ollama.Client
+    return cls(host=host, timeout=timeout)
+
+
+async def _aclose(client: Any) -> None:
+    """Close an async client made by :func:`_new_client` and its connection pool."""
+    if isinstance(client, httpx.AsyncClient):
+        await client.aclose()
+    else:
+        await client.close()
+
+
+def _completion_text(reply: httpx.Response) -> str:
+    """Message content of an OpenAI-style chat completion."""
+    reply.raise_for_status()
+    return reply.json()["choices"][0]["message"]["content"]
+
+
 class LLMAgent:
     """LLM-powered agent using Ollama for reasoning.
 
@@ -88,22 +177,48 @@ class LLMAgent:
     The LLM receives the observation text and must return a JSON object
     with thought, action, and params. The agent parses that JSON and
     returns an Action object the environment can execute.
+
+    Picking an action is a classification task, so ``routing_model`` can
+    name a smaller, faster model for it: :meth:`act`, :meth:`step` and
+    :meth:`act_many` use ``routing_model``, while :meth:`think` (whose
+    reply :meth:`act` then reuses) asks ``model`` for the reasoning.
+
+    ``backend="llamacpp"`` talks to a llama.cpp ``llama-server`` (default
+    ``http://localhost:8080``) instead of Ollama, which exposes the
+    batching knobs directly, e.g.
+    ``llama-server -m model.gguf --parallel 4 --batch-size 256 --ubatch-size 256``.
+    ``--parallel`` sets the concurrent slots :meth:`act_many` can fill;
+    smaller batch sizes trade a little prefill speed for less VRAM.
     """
 
     def __init__(
         self,
-        model: str = "llama3.2:latest",
+        model: str = DEFAULT_MODEL,
         system_prompt: str | None = None,
         temperature: float = 0.1,
+        routing_model: str | None = None,
+        host: str | None = None,
+        timeout: float | None = None,
+        backend: str = "ollama",
     ) -> None:
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown LLM backend {backend!r}; valid: {', '.join(_BACKENDS)}")
+        self._backend = backend
+        self._client = _shared_client(backend, host, timeout)
+        self._host = host
+        self._timeout = timeout
         self._model = model
+        self._routing_model = routing_model or model
         self._system_prompt = system_prompt or SYSTEM_PROMPT
+        # Built once: every request starts with this exact message, so
+        # Ollama can reuse the prompt prefix it already evaluated
+        self._system_message = {"role": "system", "content": self._system_prompt}
         self._temperature = temperature
         self._last_response: dict[str, Any] = {}
 
     def think(self, observation: Observation) -> str:
         """Ask the LLM to reason about the observation, return the thought."""
-        response = self._call_llm(observation.text)
+        response = self._call_llm(observation.text, self._model)
         self._last_response = response
         return response.get("thought", "No reasoning provided.")
 
@@ -112,55 +227,200 @@ class LLMAgent:
         # If think() was just called with the same text, reuse the response
         # to avoid calling the LLM twice for the same observation
         if not self._last_response:
-            self._call_llm(observation.text)
+            self._call_llm(observation.text, self._routing_model)
 
         response = self._last_response
         self._last_response = {}  # reset for next call
-
+        return self._to_action(response)
+
+    def step(self, observation: Observation) -> tuple[str, Action]:
+        """Think and act in one LLM call, return ``(thought, action)``."""
+        response = self._call_llm(observation.text, self._routing_model)
+        self._last_response = {}
+        return response.get("thought", "No reasoning provided."), self._to_action(response)
+
+    def with_system_prompt(self, system_prompt: str) -> LLMAgent:
+        """A copy of this agent (sharing its client) using *system_prompt*."""
+        agent = copy.copy(self)
+        agent._system_prompt = system_prompt
+        agent._system_message = {"role": "system", "content": system_prompt}
+        agent._last_response = {}
+        return agent
+
+    @property
+    def system_prompt(self) -> str:
+        return self._system_prompt
+
+    @staticmethod
+    def _to_action(response: dict[str, Any]) -> Action:
         action_name = response.get("action", "query")
         params = response.get("params", {})
 
         # Validate action name
-        valid = {"assimilate", "query", "retrieve", "prune", "list_blobs"}
-        if action_name not in valid:
+        if action_name not in _VALID_ACTIONS:
             log.warning("LLM returned invalid action '%s', defaulting to query", action_name)
             action_name = "query"
             params = {"tag_pattern": "*"}
 
         return Action(name=action_name, params=params)
 
-    def _call_llm(self, user_text: str) -> dict[str, Any]:
-        """Send the observation to Ollama and parse the JSON response."""
+    @staticmethod
+    def cache_info() -> dict[str, int]:
+        """Hit/miss counts and current size of the shared response cache."""
+        return {**_cache_stats, "size": len(_response_cache), "max_size": _RESPONSE_CACHE_SIZE}
+
+    @staticmethod
+    def cache_clear() -> None:
+        """Drop every cached response and reset the counters."""
+        _response_cache.clear()
+        _cache_stats.update(hits=0, misses=0)
+
+    def act_many(self, observations: list[Observation]) -> list[Action]:
+        """Choose actions for several observations with concurrent LLM calls.
+
+        All requests are in flight at once on one async client.  Ollama
+        runs up to ``OLLAMA_NUM_PARALLEL`` of them in parallel per loaded
+        model (set it where ``ollama serve`` runs), llama-server up to its
+        ``--parallel`` slots, and each queues the rest.  Uses
+        ``asyncio.run``, so call it from synchronous code; inside an
+        event loop, await :meth:`aact` instead.
+        """
+        async def run() -> list[dict[str, Any]]:
+            client = self._async_client()
+            try:
+                return await asyncio.gather(
+                    *(self._acall_llm(client, obs.text) for obs in observations)
+                )
+            finally:
+                await _aclose(client)
+
+        return [self._to_action(response) for response in asyncio.run(run())]
+
+    async def aact(self, observation: Observation, client: Any = None) -> Action:
+        """Async :meth:`act` (no think/act reuse) on an optional shared async *client*."""
+        if client is not None:
+            return self._to_action(await self._acall_llm(client, observation.text))
+        client = self._async_client()
         try:
-            result = ollama.chat(
-                model=self._model,
-                messages=[
-                    {"role": "system", "content": self._system_prompt},
-                    {"role": "user", "content": user_text},
-                ],
-                options={"temperature": self._temperature},
-            )
-            raw = result.message.content
-            log.debug("LLM raw response: %s", raw)
-
-            parsed = _parse_llm_response(raw)
-            self._last_response = parsed
-            return parsed
-
-        except json.JSONDecodeError as exc:
+            return self._to_action(await self._acall_llm(client, observation.text))
+        finally:
+            await _aclose(client)
+
+    def _call_llm(self, user_text: str, model: str) -> dict[str, Any]:
+        """Send the observation to *model* and parse the JSON response."""
+        response = self._cache_get(user_text, model)
+        if response is None:
+            try:
+                response = self._accept(user_text, model, self._chat(user_text, model))
+            except Exception as exc:
+                response = self._fallback(exc)
+        self._last_response = response
+        return response
+
+    async def _acall_llm(self, client: Any, user_text: str) -> dict[str, Any]:
+        """:meth:`_call_llm` with ``routing_model`` on an async client.
+
+        Leaves ``_last_response`` alone.
+        """
+        model = self._routing_model
+        response = self._cache_get(user_text, model)
+        if response is None:
+            try:
+                raw = await self._achat(client, user_text, model)
+                response = self._accept(user_text, model, raw)
+            except Exception as exc:
+                response = self._fallback(exc)
+        return response
+
+    def _async_client(self) -> Any:
+        # Async clients are bound to the event loop they run on, so they
+        # are made per batch rather than shared
+        return _new_client(self._backend, self._host, self._timeout, asynchronous=True)
+
+    def _chat(self, user_text: str, model: str) -> str:
+        """One blocking chat call; returns the raw reply text."""
+        if self._backend == "llamacpp":
+            body = self._completion_request(user_text, model)
+            reply = self._client.post(_LLAMACPP_CHAT, json=body)
+            return _completion_text(reply)
+        return self._client.chat(**self._chat_request(user_text, model)).message.content
+
+    async def _achat(self, client: Any, user_text: str, model: str) -> str:
+        """:meth:`_chat` on an async client."""
+        if self._backend == "llamacpp":
+            body = self._completion_request(user_text, model)
+            reply = await client.post(_LLAMACPP_CHAT, json=body)
+            return _completion_text(reply)
+        return (await client.chat(**self._chat_request(user_text, model))).message.content
+
+    def _messages(self, user_text: str) -> list[dict[str, str]]:
+        return [self._system_message, {"role": "user", "content": _with_hints(user_text)}]
+
+    def _completion_request(self, user_text: str, model: str) -> dict[str, Any]:
+        """llama-server request body, equivalent to :meth:`_chat_request`."""
+        return {
+            "model": model,
+            "messages": self._messages(user_text),
+            "response_format": {"type": "json_object", "schema": _RESPONSE_SCHEMA},
+            "temperature": self._temperature,
+            "max_tokens": _NUM_PREDICT,
+            # Reuse the KV cache of the shared system-prompt prefix
+            "cache_prompt": True,
+        }
+
+    def _chat_request(self, user_text: str, model: str) -> dict[str, Any]:
+        return {
+            "model": model,
+            "messages": self._messages(user_text),
+            # Schema-constrained JSON: the reply is a bare, valid object
+            "format": _RESPONSE_SCHEMA,
+            "options": {
+                "temperature": self._temperature,
+                "num_predict": _NUM_PREDICT,
+                "num_ctx": _NUM_CTX,
+            },
+            # Keep the model (and its KV cache of the fixed system
+            # prompt prefix) loaded between turns
+            "keep_alive": _KEEP_ALIVE,
+        }
+
+    def _cache_key(self, user_text: str, model: str) -> tuple[str, str, str] | None:
+        if self._temperature > _MAX_CACHED_TEMPERATURE:
+            return None
+        return (model, self._system_prompt, user_text)
+
+    def _cache_get(self, user_text: str, model: str) -> dict[str, Any] | None:
+        key = self._cache_key(user_text, model)
+        if key is None:
+            return None
+        cached = _response_cache.get(key)
+        if cached is None:
+            _cache_stats["misses"] += 1
+            return None
+        _response_cache.move_to_end(key)
+        _cache_stats["hits"] += 1
+        return copy.deepcopy(cached)
+
+    def _accept(self, user_text: str, model: str, raw: str) -> dict[str, Any]:
+        """Parse a reply and cache it if it is a real, valid decision."""
+        log.debug("LLM raw response: %s", raw)
+        parsed = _parse_llm_response(raw)
+
+        # Only real, valid decisions are cached, never the fallbacks
+        key = self._cache_key(user_text, model)
+        if key is not None and parsed.get("action") in _VALID_ACTIONS:
+            _response_cache[key] = copy.deepcopy(parsed)
+            if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
+        return parsed
+
+    @staticmethod
+    def _fallback(exc: Exception) -> dict[str, Any]:
+        """The safe ``query *`` response used when the LLM call fails."""
+        if isinstance(exc, _JSON_ERRORS):
             log.warning("LLM returned invalid JSON: %s", exc)
-            self._last_response = {
-                "thought": f"Failed to parse LLM response: {exc}",
-                "action": "query",
-                "params": {"tag_pattern": "*"},
-            }
-            return self._last_response
-
-        except Exception as exc:
+            thought = f"Failed to parse LLM response: {exc}"
+        else:
             log.error("Ollama call failed: %s", exc)
-            self._last_response = {
-                "thought": f"LLM error: {exc}",
-                "action": "query",
-                "params": {"tag_pattern": "*"},
-            }
-            return self._last_response
+            thought = f"LLM error: {exc}"
+        return {"thought": thought, "action": "query", "params": {"tag_pattern": "*"}}
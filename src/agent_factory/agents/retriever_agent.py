@@ -10,8 +10,10 @@ all matching blobs.
 from __future__ import annotations
 
 import logging
+from dataclasses import replace
 from typing import Any
 
+from agent_factory.agents.iowarp_agent import IOWarpAgent
 from agent_factory.core.types import Action, Observation, StepResult
 
 log = logging.getLogger(__name__)
@@ -34,6 +36,11 @@ class RetrieverAgent:
     """Agent that constrains its backend to retrieval actions.
 
     Satisfies the ``Agent`` protocol from ``agent_factory.core.protocols``.
+
+    The retriever instructions go where the backend can use them: into
+    the system prompt of a backend that has one (``with_system_prompt``),
+    nowhere for the keyword-matching ``IOWarpAgent``, and in front of the
+    observation text for any other backend.
     """
 
     def __init__(
@@ -42,26 +49,22 @@ class RetrieverAgent:
         *,
         default_tag_pattern: str = "*",
     ) -> None:
+        self._prefix = ""
+        if hasattr(type(backend), "with_system_prompt"):
+            # Once, here: the prompt prefix stays identical on every call
+            backend = backend.with_system_prompt(_RETRIEVER_PREFIX + backend.system_prompt)
+        elif not isinstance(backend, IOWarpAgent):
+            self._prefix = _RETRIEVER_PREFIX
         self._backend = backend
         self._default_tag_pattern = default_tag_pattern
 
     def think(self, observation: Observation) -> str:
-        """Prepend retriever context and delegate to backend."""
-        augmented = Observation(
-            text=_RETRIEVER_PREFIX + observation.text,
-            data=observation.data,
-            done=observation.done,
-        )
-        return self._backend.think(augmented)
+        """Delegate to backend with the retriever context."""
+        return self._backend.think(self._augment(observation))
 
     def act(self, observation: Observation) -> Action:
         """Delegate to backend; constrain to allowed retrieval actions."""
-        augmented = Observation(
-            text=_RETRIEVER_PREFIX + observation.text,
-            data=observation.data,
-            done=observation.done,
-        )
-        action = self._backend.act(augmented)
+        action = self._backend.act(self._augment(observation))
 
         if action.name in _ALLOWED_ACTIONS:
             return action
@@ -76,6 +79,12 @@ class RetrieverAgent:
             params={"tag_pattern": self._default_tag_pattern},
         )
 
+    def _augment(self, observation: Observation) -> Observation:
+        """The observation as the backend should see it."""
+        if not self._prefix:
+            return observation
+        return replace(observation, text=self._prefix + observation.text)
+
     def act_compound(
         self,
         observation: Observation,
@@ -84,7 +93,8 @@ class RetrieverAgent:
         """Run query then retrieve all matches (beyond Agent protocol).
 
         Useful for pipeline execution where we want to query and then
-        automatically retrieve every matching blob.
+        automatically retrieve every matching blob.  Environments with a
+        ``retrieve_many`` method fetch them all in bulk.
 
         Returns a list of StepResult from the retrieve steps.
         """
@@ -95,17 +105,17 @@ class RetrieverAgent:
         )
         query_result = environment.step(query_action)
 
-        # Step 2: Retrieve each match
-        results: list[StepResult] = []
+        # Step 2: Retrieve every match
         matches = query_result.observation.data.get("matches", [])
-        for match in matches:
-            tag = match.get("tag", "")
-            for blob_name in match.get("blobs", []):
-                retrieve_action = Action(
-                    name="retrieve",
-                    params={"tag": tag, "blob_name": blob_name},
-                )
-                result = environment.step(retrieve_action)
-                results.append(result)
-
-        return results
+        pairs = [
+            (match.get("tag", ""), blob_name)
+            for match in matches
+            for blob_name in match.get("blobs", [])
+        ]
+        if hasattr(type(environment), "retrieve_many"):
+            return environment.retrieve_many(pairs)
+
+        return [
+            environment.step(Action(name="retrieve", params={"tag": tag, "blob_name": blob_name}))
+            for tag, blob_name in pairs
+        ]
@@ -1,6 +1,6 @@
 """Core data types for AgentFactory.
 
-All types are frozen dataclasses — immutable value objects that flow
+All types are frozen, slotted dataclasses — immutable value objects that flow
 through the Environment / Agent loop.
 """
 
@@ -10,7 +10,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaskSpec:
     """Describes a task the agent should carry out."""
 
@@ -19,7 +19,7 @@ class TaskSpec:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Observation:
     """What the environment shows the agent after each step."""
 
@@ -28,7 +28,7 @@ class Observation:
     done: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Action:
     """An action the agent wants to perform on the environment."""
 
@@ -36,7 +36,7 @@ class Action:
     params: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepResult:
     """Outcome of a single environment step."""
 
@@ -46,7 +46,7 @@ class StepResult:
     info: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Trajectory:
     """A sequence of (action, step_result) pairs from a single episode."""
 
@@ -66,7 +66,7 @@ class Trajectory:
         return len(self.steps)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AssimilationRequest:
     """Parameters for ingesting data into the context engine."""
 
@@ -75,14 +75,14 @@ class AssimilationRequest:
     format: str = "arrow"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QueryResult:
     """Result of a context query."""
 
     matches: list[dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetrieveResult:
     """Result of a context retrieve."""
 
@@ -95,7 +95,7 @@ class RetrieveResult:
 # ── Pipeline orchestration types ──────────────────────────────────────────
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineStep:
     """A single step in a pipeline DAG."""
 
@@ -106,7 +106,7 @@ class PipelineStep:
     depends_on: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PipelineSpec:
     """Full specification of a pipeline (parsed from YAML)."""
 
@@ -115,7 +115,7 @@ class PipelineSpec:
     steps: tuple[PipelineStep, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepOutput:
     """Result of executing a single pipeline step."""
 
@@ -9,6 +9,7 @@ Supported actions:
     retrieve    — cache-aside retrieval
     prune       — selectively delete blobs or tags + invalidate cache
     list_blobs  — list stored blobs for a tag pattern
+    batch       — run several of the above in order (``params["actions"]``)
 """
 
 from __future__ import annotations
@@ -17,10 +18,11 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
-from agent_factory.core.errors import IOWarpError
+from agent_factory.core.errors import CacheError, IOWarpError
 from agent_factory.core.types import Action, Observation, StepResult, TaskSpec
 from agent_factory.iowarp.cache import BlobCache
 from agent_factory.iowarp.client import IOWarpClient
+from agent_factory.iowarp.models import RetrieveParams, RetrieveResultModel
 from agent_factory.iowarp.uri_resolver import URIResolver
 
 log = logging.getLogger(__name__)
@@ -38,6 +40,14 @@ class RewardConfig:
     error: float = -0.5
 
 
+def _blob_data(result: RetrieveResultModel) -> Any:
+    """Blob bytes of a retrieve result (msgpack peers return bytes; JSON peers hex-encode them)."""
+    data = result.data
+    if isinstance(data, str) and result.encoding == "hex":
+        data = bytes.fromhex(data)
+    return data
+
+
 class IOWarpEnvironment:
     """Step-based environment wrapping IOWarp + memcached.
 
@@ -81,6 +91,7 @@ class IOWarpEnvironment:
             "prune": self._do_prune,
             "destroy": self._do_destroy,
             "list_blobs": self._do_list_blobs,
+            "batch": self._do_batch,
         }.get(action.name)
 
         if handler is None:
@@ -201,39 +212,86 @@ class IOWarpEnvironment:
         if not skip_cache:
             cached = self._cache.get(tag, blob_name)
             if cached is not None:
-                obs = Observation(
-                    text=f"Retrieved '{blob_name}' from cache (hit).",
-                    data={"tag": tag, "blob_name": blob_name, "cache_hit": True,
-                          "size": len(cached), "content": cached},
-                )
-                self._last_obs = obs
-                return StepResult(
-                    observation=obs,
-                    reward=self._rewards.cache_hit,
-                )
+                return self._retrieved(tag, blob_name, cached, "cache (hit)")
 
         # Cache miss or skip_cache — fetch from IOWarp
-        result = self._client.context_retrieve(tag=tag, blob_name=blob_name)
-
-        # Decode hex-encoded bytes if needed
-        data = result.data
-        if isinstance(data, str) and result.encoding == "hex":
-            data = bytes.fromhex(data)
+        data = _blob_data(self._client.context_retrieve(tag=tag, blob_name=blob_name))
 
         # Populate cache (unless skipping cache)
         if not skip_cache and isinstance(data, (bytes, bytearray)):
             self._cache.put(tag, blob_name, data)
 
         source = "IOWarp (bypassed cache)" if skip_cache else "IOWarp (cache miss, now cached)"
+        return self._retrieved(tag, blob_name, data, source)
+
+    def retrieve_many(self, pairs: list[tuple[str, str]]) -> list[StepResult]:
+        """Retrieve several ``(tag, blob_name)`` blobs, cache-aside, in bulk.
+
+        Same results as one ``retrieve`` step per pair, but costs one cache
+        multi-get, one bridge round trip for all the misses and one cache
+        multi-set, instead of up to three round trips per blob.
+        """
+        if not pairs:
+            return []
+        try:
+            return self._retrieve_many(pairs)
+        except Exception as exc:
+            obs = Observation(text=f"Unexpected error: {exc}")
+            self._last_obs = obs
+            return [StepResult(observation=obs, reward=self._rewards.error)] * len(pairs)
+
+    def _retrieve_many(self, pairs: list[tuple[str, str]]) -> list[StepResult]:
+        cached = self._cache.get_many(pairs)
+        misses = [pair for pair, data in zip(pairs, cached) if data is None]
+
+        fetched: dict[tuple[str, str], Any] = {}
+        error: StepResult | None = None
+        if misses:
+            try:
+                results = self._client.context_retrieve_many(
+                    [RetrieveParams(tag=tag, blob_name=blob_name) for tag, blob_name in misses]
+                )
+            except IOWarpError as exc:
+                error = StepResult(
+                    observation=Observation(text=f"IOWarp error: {exc}"),
+                    reward=self._rewards.error,
+                )
+            else:
+                fetched = {pair: _blob_data(r) for pair, r in zip(misses, results)}
+                try:
+                    self._cache.put_many({
+                        pair: data for pair, data in fetched.items()
+                        if isinstance(data, (bytes, bytearray))
+                    })
+                except CacheError as exc:
+                    # The blobs were still retrieved; only the write-back failed
+                    log.warning("Bulk cache write-back failed: %s", exc)
+
+        out: list[StepResult] = []
+        for (tag, blob_name), data in zip(pairs, cached):
+            if data is not None:
+                out.append(self._retrieved(tag, blob_name, data, "cache (hit)"))
+            elif error is not None:
+                out.append(error)
+            else:
+                out.append(self._retrieved(
+                    tag, blob_name, fetched[(tag, blob_name)], "IOWarp (cache miss, now cached)",
+                ))
+        self._last_obs = out[-1].observation
+        return out
+
+    def _retrieved(self, tag: str, blob_name: str, data: Any, source: str) -> StepResult:
+        """StepResult for a retrieve served from *source*."""
+        cache_hit = source == "cache (hit)"
         obs = Observation(
             text=f"Retrieved '{blob_name}' from {source}.",
-            data={"tag": tag, "blob_name": blob_name, "cache_hit": False,
+            data={"tag": tag, "blob_name": blob_name, "cache_hit": cache_hit,
                   "size": len(data) if data else 0, "content": data},
         )
         self._last_obs = obs
         return StepResult(
             observation=obs,
-            reward=self._rewards.cache_miss,
+            reward=self._rewards.cache_hit if cache_hit else self._rewards.cache_miss,
         )
 
     def _do_prune(self, params: dict[str, Any]) -> StepResult:
@@ -310,6 +368,15 @@ class IOWarpEnvironment:
             reward=self._rewards.prune_success,
         )
 
+    def _do_batch(self, params: dict[str, Any]) -> StepResult:
+        results = [self.step(action) for action in params["actions"]]
+        obs = Observation(
+            text="\n".join(r.observation.text for r in results),
+            data={"results": [r.observation.data for r in results]},
+        )
+        self._last_obs = obs
+        return StepResult(observation=obs, reward=sum(r.reward for r in results))
+
     def _do_list_blobs(self, params: dict[str, Any]) -> StepResult:
         tag_pattern = params.get("tag_pattern", "*")
 
@@ -1,6 +1,31 @@
-"""Factory — blueprint registry and agent builder."""
+"""Factory — blueprint registry and agent builder.
 
-from agent_factory.factory.builder import AgentBuilder
-from agent_factory.factory.registry import BlueprintRegistry
+Exports are resolved lazily so that importing the registry alone (as the
+CLI's ``list``/``show``/``delete`` commands do) does not pull in the
+builder and its ZeroMQ, memcached, and pydantic dependencies.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agent_factory.factory.builder import AgentBuilder
+    from agent_factory.factory.registry import BlueprintRegistry
 
 __all__ = ["AgentBuilder", "BlueprintRegistry"]
+
+_LAZY_EXPORTS = {
+    "AgentBuilder": "agent_factory.factory.builder",
+    "BlueprintRegistry": "agent_factory.factory.registry",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -55,6 +55,9 @@ class AgentBuilder:
 
         If *connect* is True (default) the client and cache will be
         connected immediately.  Set to False for testing without Docker.
+
+        *blueprint* is treated as read-only, so callers may pass a shallow
+        copy that shares sections with a registry entry.
         """
         try:
             return self._build(blueprint, connect=connect)
@@ -63,6 +66,27 @@ class AgentBuilder:
         except Exception as exc:
             raise BlueprintError(f"Failed to build agent: {exc}") from exc
 
+    def rebuild_agent(self, blueprint: dict[str, Any], current: BuiltAgent) -> BuiltAgent:
+        """Build the agent from *blueprint* on top of *current*'s infrastructure.
+
+        The live client, cache, resolver, and environment of *current* are
+        reused as-is, so no bridge or memcached reconnect happens.  Callers
+        must only use this when the infrastructure sections of *blueprint*
+        match the ones *current* was built from.
+        """
+        try:
+            return self._assemble(
+                blueprint,
+                current.client,
+                current.cache,
+                current.resolver,
+                current.environment,
+            )
+        except BlueprintError:
+            raise
+        except Exception as exc:
+            raise BlueprintError(f"Failed to build agent: {exc}") from exc
+
     def build_pipeline(
         self,
         blueprint: dict[str, Any],
@@ -179,7 +203,16 @@ class AgentBuilder:
 
     def _build(self, bp: dict[str, Any], connect: bool) -> BuiltAgent:
         client, cache, resolver, environment = self._build_infra(bp, connect=connect)
+        return self._assemble(bp, client, cache, resolver, environment)
 
+    def _assemble(
+        self,
+        bp: dict[str, Any],
+        client: IOWarpClient,
+        cache: BlobCache,
+        resolver: URIResolver,
+        environment: IOWarpEnvironment,
+    ) -> BuiltAgent:
         # -- Agent -----------------------------------------------------------
         agent_cfg = bp.get("agent", {})
         agent_type = agent_cfg.get("type", "rule_based")
@@ -252,7 +285,7 @@ class AgentBuilder:
                     role = "retriever"
                 else:
                     # Generic agents use their blueprint name as role
-                    role = blueprint_name.replace("_agent", "")
+                    role = blueprint_name.removesuffix("_agent")
                 
                 # Build the specialized agent wrapper
                 specialized_agent = AgentBuilder._build_agent(agent_sub_cfg)
@@ -275,7 +308,7 @@ class AgentBuilder:
         else:
             log.info(f"Coordinator: Managing {len(agents)} agents: {', '.join(agents.keys())}")
         
-        return CoordinatorAgent(backend, agents)
+        return CoordinatorAgent(backend, agents, router_model=agent_cfg.get("router_model"))
 
     @staticmethod
     def _build_agent(agent_cfg: dict[str, Any]) -> Any:
@@ -287,10 +320,14 @@ class AgentBuilder:
             return IOWarpAgent()
 
         if agent_type == "llm":
-            from agent_factory.agents.llm_agent import LLMAgent
+            from agent_factory.agents.llm_agent import DEFAULT_MODEL, LLMAgent
             return LLMAgent(
-                model=agent_cfg.get("model", "llama3.2:latest"),
+                model=agent_cfg.get("model", DEFAULT_MODEL),
                 temperature=agent_cfg.get("temperature", 0.1),
+                routing_model=agent_cfg.get("routing_model"),
+                host=agent_cfg.get("host"),
+                timeout=agent_cfg.get("timeout"),
+                backend=agent_cfg.get("backend", "ollama"),
             )
 
         if agent_type == "claude":
@@ -344,7 +381,9 @@ class AgentBuilder:
                 backend_cfg["temperature"] = agent_cfg["temperature"]
             backend = AgentBuilder._build_agent(backend_cfg)
             
-            return CoordinatorAgent(backend, agents={})
+            return CoordinatorAgent(
+                backend, agents={}, router_model=agent_cfg.get("router_model"),
+            )
 
         raise BlueprintError(
             f"Unknown agent type '{agent_type}'. "
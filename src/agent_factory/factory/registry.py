@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import copy
+import functools
+import hashlib
 import logging
+import os
+import pickle
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from agent_factory.core.errors import BlueprintError
 
 log = logging.getLogger(__name__)
@@ -53,9 +55,42 @@ _DEFAULT_BLUEPRINT: dict[str, Any] = {
     },
 }
 
+_DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "agent_factory"
+)
+
 _VALID_AGENT_TYPES = {"rule_based", "llm", "claude", "ingestor", "retriever"}
 
 
+@functools.lru_cache(maxsize=None)
+def _yaml_codec() -> tuple[Any, type, type]:
+    """Return ``(yaml, Loader, Dumper)``, preferring the libyaml C classes."""
+    import yaml
+
+    try:
+        return yaml, yaml.CSafeLoader, yaml.CSafeDumper
+    except AttributeError:
+        log.warning("PyYAML built without libyaml — using the slower pure-Python codec")
+        return yaml, yaml.SafeLoader, yaml.SafeDumper
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML from a string or file object with the fastest safe loader."""
+    yaml, loader, _ = _yaml_codec()
+    return yaml.load(stream, Loader=loader)
+
+
+def dump_yaml(data: Any, stream: Any = None) -> str | None:
+    """Serialise *data* as block-style YAML, preserving key order.
+
+    Returns the YAML text when *stream* is None, otherwise writes to it.
+    """
+    yaml, _, dumper = _yaml_codec()
+    return yaml.dump(
+        data, stream, Dumper=dumper, default_flow_style=False, sort_keys=False,
+    )
+
+
 def _deep_merge(base: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
     """Recursively merge *overrides* into a deep copy of *base*."""
     result = copy.deepcopy(base)
@@ -87,7 +122,7 @@ class BlueprintRegistry:
         for path in sorted(self._dir.glob("*.yaml")):
             try:
                 with open(path) as f:
-                    data = yaml.safe_load(f)
+                    data = load_yaml(f)
                 name = data.get("blueprint", {}).get("name")
                 if not name:
                     log.warning("Skipping %s — no blueprint.name field", path.name)
@@ -97,6 +132,48 @@ class BlueprintRegistry:
             except Exception as exc:
                 log.warning("Failed to load %s: %s", path.name, exc)
 
+    def load_cached(self, cache_dir: str | Path | None = None) -> None:
+        """Like :meth:`load`, but reuse a pickled snapshot when nothing changed.
+
+        The snapshot is keyed on the ``(name, mtime_ns, size)`` of every
+        ``*.yaml`` file in the blueprints directory, so any create, update,
+        delete, or hand edit invalidates it.  Cache I/O failures are never
+        fatal — they just fall back to a full :meth:`load`.
+        """
+        if not self._dir.is_dir():
+            raise BlueprintError(f"Blueprints directory not found: {self._dir}")
+
+        cache_root = Path(cache_dir) if cache_dir else _DEFAULT_CACHE_DIR
+        dir_key = hashlib.sha1(str(self._dir.resolve()).encode()).hexdigest()[:16]
+        cache_path = cache_root / f"registry-{dir_key}.pkl"
+
+        fingerprint = []
+        for path in sorted(self._dir.glob("*.yaml")):
+            st = path.stat()
+            fingerprint.append((path.name, st.st_mtime_ns, st.st_size))
+
+        try:
+            with open(cache_path, "rb") as f:
+                cached_fingerprint, blueprints = pickle.load(f)
+            if cached_fingerprint == fingerprint:
+                self._blueprints.update(blueprints)
+                log.debug("Loaded %d blueprint(s) from %s", len(blueprints), cache_path)
+                return
+        except FileNotFoundError:
+            pass
+        except Exception as exc:
+            log.debug("Ignoring unreadable registry cache %s: %s", cache_path, exc)
+
+        self.load()
+        try:
+            cache_root.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((fingerprint, self._blueprints), f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            log.debug("Could not write registry cache %s: %s", cache_path, exc)
+
     def get(self, name: str) -> dict[str, Any]:
         """Return the parsed blueprint dict for *name*."""
         if name not in self._blueprints:
@@ -110,6 +187,10 @@ class BlueprintRegistry:
         """Return names of all loaded blueprints."""
         return list(self._blueprints.keys())
 
+    def items(self) -> list[tuple[str, dict[str, Any]]]:
+        """Return ``(name, blueprint)`` pairs for all loaded blueprints."""
+        return list(self._blueprints.items())
+
     def __contains__(self, name: str) -> bool:
         return name in self._blueprints
 
@@ -137,7 +218,7 @@ class BlueprintRegistry:
         path = self._dir / f"{safe_name}.yaml"
         self._dir.mkdir(parents=True, exist_ok=True)
         with open(path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+            dump_yaml(data, f)
         log.info("Saved blueprint to %s", path)
         return path
 
@@ -123,6 +123,25 @@ class BlobCache:
         self.hits += 1
         return val
 
+    def get_many(self, pairs: list[tuple[str, str]]) -> list[bytes | None]:
+        """Get several ``(tag, blob_name)`` blobs in one multi-get.
+
+        Returns the data (or None on a miss) for each pair, in order.
+        """
+        if self._client is None:
+            raise CacheError("Not connected — call connect() first")
+        keys = [_make_key(self._prefix, tag, blob_name) for tag, blob_name in pairs]
+        try:
+            found = self._client.get_many(keys)
+        except Exception as exc:
+            log.warning("Cache get_many failed for %d key(s): %s", len(keys), exc)
+            found = {}
+        values = [found.get(key) for key in keys]
+        hits = sum(val is not None for val in values)
+        self.hits += hits
+        self.misses += len(values) - hits
+        return values
+
     def put(
         self,
         tag: str,
@@ -141,6 +160,27 @@ class BlobCache:
             log.warning("Cache put failed for %s: %s", key, exc)
             raise CacheError(f"Cache put failed: {exc}") from exc
 
+    def put_many(
+        self,
+        items: dict[tuple[str, str], bytes],
+        ttl: int | None = None,
+    ) -> None:
+        """Store several ``(tag, blob_name) -> data`` entries in one multi-set."""
+        if self._client is None:
+            raise CacheError("Not connected — call connect() first")
+        if not items:
+            return
+        values = {
+            _make_key(self._prefix, tag, blob_name): data
+            for (tag, blob_name), data in items.items()
+        }
+        expire = ttl if ttl is not None else self._default_ttl
+        try:
+            self._client.set_many(values, expire=expire)
+        except Exception as exc:
+            log.warning("Cache put_many failed for %d key(s): %s", len(values), exc)
+            raise CacheError(f"Cache put_many failed: {exc}") from exc
+
     def delete(self, tag: str, blob_name: str) -> bool:
         """Delete a single cached blob.  Returns True if key existed."""
         if self._client is None:
@@ -3,11 +3,16 @@
 Supports both single-endpoint and multi-endpoint (distributed) operation:
   - Single endpoint  → one REQ socket
   - Multiple endpoints → one REQ socket per endpoint, round-robin with fallback
+
+Messages are JSON by default.  When ``msgspec`` is installed and the bridge
+advertises support in its ping reply, a peer switches to msgpack frames
+(a one-byte ``_MSGPACK_TAG`` followed by the msgpack body).
 """
 
 from __future__ import annotations
 
 import itertools
+import json
 import logging
 from dataclasses import dataclass
 from typing import Any
@@ -18,18 +23,50 @@ from agent_factory.core.errors import BridgeConnectionError, IOWarpError
 from agent_factory.iowarp.models import (
     BridgeRequest,
     BridgeResponse,
+    BundleManyParams,
+    BundleManyResult,
     BundleParams,
     BundleResult,
     DestroyParams,
     DestroyResult,
     QueryParams,
     QueryResultModel,
+    RetrieveManyParams,
+    RetrieveManyResult,
     RetrieveParams,
     RetrieveResultModel,
 )
 
 log = logging.getLogger(__name__)
 
+try:
+    import msgspec
+
+    _MSGPACK_ENC = msgspec.msgpack.Encoder()
+    _MSGPACK_DEC = msgspec.msgpack.Decoder()
+    HAS_MSGPACK = True
+except ImportError:  # optional dependency
+    HAS_MSGPACK = False
+
+# First byte of a msgpack frame; JSON frames always start with "{".
+_MSGPACK_TAG = b"\x01"
+
+
+def _encode_frame(msg: dict[str, Any], msgpack: bool) -> bytes:
+    """Serialise *msg* as a tagged msgpack frame or as plain JSON."""
+    if msgpack:
+        return _MSGPACK_TAG + _MSGPACK_ENC.encode(msg)
+    return json.dumps(msg).encode()
+
+
+def _decode_frame(buf: bytes | memoryview) -> dict[str, Any]:
+    """Inverse of :func:`_encode_frame`; the format is read from the tag byte."""
+    if buf[:1] == _MSGPACK_TAG:
+        if not HAS_MSGPACK:
+            raise IOWarpError("Received a msgpack frame but msgspec is not installed")
+        return _MSGPACK_DEC.decode(buf[1:])
+    return json.loads(bytes(buf))
+
 
 @dataclass
 class _Peer:
@@ -39,6 +76,7 @@ class _Peer:
     ctx: zmq.Context
     socket: zmq.Socket
     alive: bool = True
+    msgpack: bool = False
 
 
 class IOWarpClient:
@@ -101,7 +139,9 @@ class IOWarpClient:
 
     def _connect_one(self, endpoint: str) -> _Peer:
         """Connect and ping a single endpoint. Returns a _Peer."""
-        ctx = zmq.Context()
+        # Peers share the process-wide context (and its I/O thread); only
+        # their sockets are closed, the context lives for the process.
+        ctx = zmq.Context.instance()
         sock = ctx.socket(zmq.REQ)
         sock.setsockopt(zmq.RCVTIMEO, self._connect_timeout_ms)
         sock.setsockopt(zmq.SNDTIMEO, self._connect_timeout_ms)
@@ -115,7 +155,6 @@ class IOWarpClient:
             raw = sock.recv_json()
         except (zmq.Again, zmq.ZMQError) as exc:
             sock.close()
-            ctx.term()
             raise BridgeConnectionError(
                 f"Bridge ping failed at {endpoint}: {exc}"
             ) from exc
@@ -123,19 +162,22 @@ class IOWarpClient:
         resp = BridgeResponse.model_validate(raw)
         if resp.error or resp.result != "pong":
             sock.close()
-            ctx.term()
             raise BridgeConnectionError(
                 f"Bridge ping failed at {endpoint}: {resp.error or resp.result}"
             )
 
-        return _Peer(endpoint=endpoint, ctx=ctx, socket=sock)
+        # The handshake ping is always JSON; the reply says whether the
+        # bridge can also speak msgpack.
+        return _Peer(
+            endpoint=endpoint, ctx=ctx, socket=sock,
+            msgpack=HAS_MSGPACK and bool(raw.get("msgpack")),
+        )
 
     def close(self) -> None:
         """Tear down all ZeroMQ resources."""
         for peer in self._peers:
             try:
                 peer.socket.close()
-                peer.ctx.term()
             except Exception:
                 pass
         self._peers.clear()
@@ -169,8 +211,12 @@ class IOWarpClient:
             peer = self._next_peer()
             peer.socket.setsockopt(zmq.RCVTIMEO, self._request_timeout_ms)
             try:
-                peer.socket.send_json(req.model_dump())
-                raw = peer.socket.recv_json()
+                peer.socket.send(_encode_frame(req.model_dump(), peer.msgpack), copy=False)
+                frames = peer.socket.recv_multipart(copy=False)
+                raw = _decode_frame(frames[0].buffer)
+                if len(frames) > 1:
+                    # Blob bytes arrive as their own frame, never re-encoded
+                    raw["result"] = {**raw["result"], "data": frames[1].bytes, "encoding": None}
                 resp = BridgeResponse.model_validate(raw)
                 if resp.error:
                     raise IOWarpError(f"Bridge error on '{method}': {resp.error}")
@@ -206,6 +252,12 @@ class IOWarpClient:
         resp = self._call("context_bundle", params.model_dump())
         return BundleResult.model_validate(resp.result)
 
+    def context_bundle_many(self, items: list[BundleParams]) -> list[BundleResult]:
+        """Assimilate several bundles in a single bridge round trip."""
+        params = BundleManyParams(items=items)
+        resp = self._call("context_bundle_many", params.model_dump())
+        return BundleManyResult.model_validate(resp.result).results
+
     def context_query(
         self,
         tag_pattern: str = "*",
@@ -222,6 +274,12 @@ class IOWarpClient:
         resp = self._call("context_retrieve", params.model_dump())
         return RetrieveResultModel.model_validate(resp.result)
 
+    def context_retrieve_many(self, items: list[RetrieveParams]) -> list[RetrieveResultModel]:
+        """Retrieve several blobs in a single bridge round trip."""
+        params = RetrieveManyParams(items=items)
+        resp = self._call("context_retrieve_many", params.model_dump())
+        return RetrieveManyResult.model_validate(resp.result).results
+
     def context_destroy(self, tags: str | list[str]) -> DestroyResult:
         """Destroy context tag(s)."""
         params = DestroyParams(tags=tags)
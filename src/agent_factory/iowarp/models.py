@@ -17,6 +17,8 @@ class BridgeRequest(BaseModel):
     method: str
     params: dict[str, Any] = Field(default_factory=dict)
     id: int | None = None
+    # Accept blob data as a separate raw frame (ignored by older bridges)
+    frames: bool = True
 
 
 class BridgeResponse(BaseModel):
@@ -49,6 +51,16 @@ class BundleResult(BaseModel):
     stub: bool = False
 
 
+class BundleManyParams(BaseModel):
+    """Parameters for context_bundle_many."""
+
+    items: list[BundleParams]
+
+
+class BundleManyResult(BaseModel):
+    results: list[BundleResult] = Field(default_factory=list)
+
+
 class QueryParams(BaseModel):
     """Parameters for context_query."""
 
@@ -74,6 +86,16 @@ class RetrieveResultModel(BaseModel):
     stub: bool = False
 
 
+class RetrieveManyParams(BaseModel):
+    """Parameters for context_retrieve_many."""
+
+    items: list[RetrieveParams]
+
+
+class RetrieveManyResult(BaseModel):
+    results: list[RetrieveResultModel] = Field(default_factory=list)
+
+
 class DestroyParams(BaseModel):
     """Parameters for context_destroy."""
 
@@ -23,7 +23,8 @@ class PipelineExecutor:
     Each step:
       1. Resolves ``${step_name.key}`` input references from prior outputs.
       2. Builds an Observation from resolved inputs.
-      3. Calls ``agent.think(obs)`` then ``agent.act(obs)``.
+      3. Calls ``agent.step(obs)`` when the agent has one, else
+         ``agent.think(obs)`` then ``agent.act(obs)``.
       4. Calls ``environment.step(action)``.
       5. Stores ``StepOutput`` in context.
     """
@@ -108,12 +109,14 @@ class PipelineExecutor:
         )
         obs = Observation(text=input_text, data=resolved_inputs)
 
-        # 3. Think
-        thought = agent.think(obs)
+        # 3-4. Think and act (one LLM call for agents that offer step())
+        # Looked up on the class so only agents that define step() use it
+        if hasattr(type(agent), "step"):
+            thought, action = agent.step(obs)
+        else:
+            thought = agent.think(obs)
+            action = agent.act(obs)
         log.debug("Step '%s' thought: %s", step.name, thought)
-
-        # 4. Act
-        action = agent.act(obs)
         log.debug("Step '%s' action: %s(%s)", step.name, action.name, action.params)
 
         # 5. Environment step
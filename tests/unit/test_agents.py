@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import io
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from agent_factory.core.types import Action, Observation
-from agent_factory.agents.iowarp_agent import IOWarpAgent
+from agent_factory.agents.iowarp_agent import IOWarpAgent, _parse
+from agent_factory.agents import llm_agent
 from agent_factory.agents.llm_agent import LLMAgent, _parse_llm_response
 
 
@@ -70,11 +73,39 @@ class TestIOWarpAgent:
         # "ingestion" should NOT trigger assimilate
         assert action.name != "assimilate"
 
+    def test_rule_order_beats_text_order(self):
+        """The earliest rule wins, wherever its keyword sits in the text."""
+        obs = Observation(text="List the files, then INGEST them")
+        assert self.agent.act(obs).name == "assimilate"
+
     def test_extract_uri_from_text(self):
         obs = Observation(text="load folder::./data/docs into tag: docs")
         action = self.agent.act(obs)
         assert action.params["src"] == "folder::./data/docs"
 
+    def test_extract_uri_classifies_plain_path(self, tmp_path):
+        (tmp_path / "notes").touch()
+        obs = Observation(text=f"load {tmp_path} and {tmp_path}/notes")
+        assert self.agent.act(obs).params["src"] == f"folder::{tmp_path}"
+        assert IOWarpAgent._extract_uri(f"load {tmp_path}/notes") == f"file::{tmp_path}/notes"
+
+    def test_extract_uri_sees_filesystem_changes(self, tmp_path):
+        path = tmp_path / "out"
+        obs = Observation(text=f"load {path}")
+        path.mkdir()
+        assert self.agent.act(obs).params["src"] == f"folder::{path}"
+        path.rmdir()
+        path.touch()
+        assert self.agent.act(obs).params["src"] == f"file::{path}"
+
+    def test_think_and_act_share_one_parse(self):
+        _parse.cache_clear()
+        obs = Observation(text="retrieve blob: readme.md from tag: docs")
+        self.agent.think(obs)
+        self.agent.act(obs)
+        # Parsed once; every later lookup is a cache hit
+        assert _parse.cache_info().misses == 1
+
     def test_extract_tag_from_text(self):
         obs = Observation(text="ingest file::/data/x.csv into tag: my_tag")
         action = self.agent.act(obs)
@@ -105,6 +136,11 @@ class TestParseResponse:
         result = _parse_llm_response(raw)
         assert result["action"] == "query"
 
+    def test_json_with_unclosed_fence(self):
+        raw = '```json\n{"thought": "t", "action": "retrieve", "params": {}}'
+        result = _parse_llm_response(raw)
+        assert result["action"] == "retrieve"
+
     def test_json_with_whitespace(self):
         raw = '  \n  {"thought": "t", "action": "prune", "params": {"tags": "x"}}  \n  '
         result = _parse_llm_response(raw)
@@ -118,6 +154,14 @@ class TestParseResponse:
 class TestLLMAgent:
     """Tests for the Ollama-backed LLMAgent."""
 
+    @pytest.fixture(autouse=True)
+    def _empty_response_cache(self):
+        LLMAgent.cache_clear()
+        llm_agent._clients.clear()
+        yield
+        LLMAgent.cache_clear()
+        llm_agent._clients.clear()
+
     def _make_ollama_response(self, content: str):
         """Create a mock Ollama chat response."""
         mock_msg = MagicMock()
@@ -133,14 +177,14 @@ class TestLLMAgent:
             "action": "query",
             "params": {"tag_pattern": "*"},
         })
-        mock_ollama.chat.return_value = self._make_ollama_response(response_json)
+        mock_ollama.Client.return_value.chat.return_value = self._make_ollama_response(response_json)
 
         agent = LLMAgent(model="test-model")
         obs = Observation(text="show me what's stored")
         thought = agent.think(obs)
 
         assert thought == "I should query all tags"
-        mock_ollama.chat.assert_called_once()
+        mock_ollama.Client.return_value.chat.assert_called_once()
 
     @patch("agent_factory.agents.llm_agent.ollama")
     def test_act_returns_action(self, mock_ollama):
@@ -149,7 +193,7 @@ class TestLLMAgent:
             "action": "assimilate",
             "params": {"src": "folder::./data", "dst": "docs", "format": "markdown"},
         })
-        mock_ollama.chat.return_value = self._make_ollama_response(response_json)
+        mock_ollama.Client.return_value.chat.return_value = self._make_ollama_response(response_json)
 
         agent = LLMAgent(model="test-model")
         obs = Observation(text="ingest folder::./data into tag: docs")
@@ -168,7 +212,7 @@ class TestLLMAgent:
             "action": "retrieve",
             "params": {"tag": "docs", "blob_name": "readme.md"},
         })
-        mock_ollama.chat.return_value = self._make_ollama_response(response_json)
+        mock_ollama.Client.return_value.chat.return_value = self._make_ollama_response(response_json)
 
         agent = LLMAgent(model="test-model")
         obs = Observation(text="get readme.md from docs")
@@ -179,7 +223,167 @@ class TestLLMAgent:
         assert thought == "Will retrieve data"
         assert action.name == "retrieve"
         # Only one LLM call should have been made
-        assert mock_ollama.chat.call_count == 1
+        assert mock_ollama.Client.return_value.chat.call_count == 1
+
+    @patch.object(LLMAgent, "_chat")
+    def test_step_returns_thought_and_action_in_one_call(self, mock_chat):
+        mock_chat.return_value = json.dumps({
+            "thought": "list it",
+            "action": "list_blobs",
+            "params": {"tag_pattern": "docs*"},
+        })
+
+        agent = LLMAgent(model="test-model")
+        thought, action = agent.step(Observation(text="list docs"))
+
+        assert thought == "list it"
+        assert action == Action(name="list_blobs", params={"tag_pattern": "docs*"})
+        assert mock_chat.call_count == 1
+
+    @patch.object(LLMAgent, "_chat")
+    def test_repeated_observation_served_from_cache(self, mock_chat):
+        mock_chat.return_value = json.dumps(
+            {"thought": "t", "action": "query", "params": {"tag_pattern": "*"}}
+        )
+
+        first = LLMAgent(model="test-model").act(Observation(text="show everything"))
+        second = LLMAgent(model="test-model").act(Observation(text="show everything"))
+
+        assert first == second
+        assert mock_chat.call_count == 1
+        assert LLMAgent.cache_info()["hits"] == 1
+
+    @patch.object(LLMAgent, "_chat")
+    def test_invalid_or_warm_responses_not_cached(self, mock_chat):
+        mock_chat.return_value = json.dumps({"thought": "t", "action": "bogus", "params": {}})
+
+        agent = LLMAgent(model="test-model")
+        agent.act(Observation(text="do it"))
+        agent.act(Observation(text="do it"))
+        warm = LLMAgent(model="test-model", temperature=0.7)
+        mock_chat.return_value = json.dumps({"thought": "t", "action": "query", "params": {}})
+        warm.act(Observation(text="again"))
+        warm.act(Observation(text="again"))
+
+        assert mock_chat.call_count == 4
+
+    @patch.object(LLMAgent, "_chat")
+    def test_routing_model_picks_actions_model_thinks(self, mock_chat):
+        mock_chat.return_value = json.dumps({"thought": "t", "action": "query", "params": {}})
+
+        agent = LLMAgent(model="big-model", routing_model="small-model")
+        agent.step(Observation(text="list everything"))
+        agent.think(Observation(text="list everything"))
+
+        assert [c.args[1] for c in mock_chat.call_args_list] == ["small-model", "big-model"]
+        request = agent._chat_request("list everything", "small-model")
+        assert request["format"]["properties"]["action"]["enum"] == sorted(llm_agent._VALID_ACTIONS)
+
+    @patch("agent_factory.agents.llm_agent.ollama")
+    def test_requests_share_a_fixed_prefix(self, mock_ollama):
+        response_json = json.dumps({"thought": "t", "action": "query", "params": {}})
+        chat = mock_ollama.Client.return_value.chat
+        chat.return_value = self._make_ollama_response(response_json)
+
+        agent = LLMAgent(model="test-model")
+        agent.act(Observation(text="first"))
+        agent.act(Observation(text="second"))
+
+        first, second = (call.kwargs for call in chat.call_args_list)
+        assert first["messages"][0] == second["messages"][0] == {
+            "role": "system", "content": llm_agent.SYSTEM_PROMPT,
+        }
+        assert first["options"] == second["options"]
+        assert first["options"]["num_ctx"] == llm_agent._NUM_CTX
+        assert first["keep_alive"] == llm_agent._KEEP_ALIVE
+
+    @patch("agent_factory.agents.llm_agent.ollama")
+    def test_uri_rules_only_sent_when_relevant(self, mock_ollama):
+        response_json = json.dumps({"thought": "t", "action": "query", "params": {}})
+        chat = mock_ollama.Client.return_value.chat
+        chat.return_value = self._make_ollama_response(response_json)
+
+        agent = LLMAgent(model="test-model")
+        agent.act(Observation(text="ingest folder::./data into docs"))
+        agent.act(Observation(text="list everything"))
+
+        ingest, listing = (call.kwargs["messages"][1]["content"] for call in chat.call_args_list)
+        assert ingest.startswith("ingest folder::./data into docs")
+        assert "never turn :: into ://" in ingest
+        assert listing == "list everything"
+
+    @patch("agent_factory.agents.llm_agent.ollama")
+    def test_agents_share_one_client_per_host(self, mock_ollama):
+        a = LLMAgent(model="a", host="http://h:11434")
+        b = LLMAgent(model="b", host="http://h:11434")
+        LLMAgent(model="c", host="http://other:11434")
+
+        assert a._client is b._client
+        assert mock_ollama.Client.call_count == 2
+
+    @patch("agent_factory.agents.llm_agent.ollama")
+    def test_act_many_gathers_calls_on_async_client(self, mock_ollama):
+        async def chat(**kwargs):
+            text = kwargs["messages"][1]["content"]
+            if text == "boom":
+                raise ConnectionError("Ollama not running")
+            return self._make_ollama_response(json.dumps({
+                "thought": "ok", "action": "retrieve", "params": {"tag": text},
+            }))
+
+        mock_ollama.AsyncClient.return_value.chat = AsyncMock(side_effect=chat)
+        mock_ollama.AsyncClient.return_value.close = AsyncMock()
+
+        agent = LLMAgent(model="test-model")
+        actions = agent.act_many([Observation(text="a"), Observation(text="boom"), Observation(text="b")])
+
+        assert actions == [
+            Action(name="retrieve", params={"tag": "a"}),
+            Action(name="query", params={"tag_pattern": "*"}),
+            Action(name="retrieve", params={"tag": "b"}),
+        ]
+        assert mock_ollama.AsyncClient.call_count == 1
+        mock_ollama.AsyncClient.return_value.close.assert_awaited_once()
+        mock_ollama.Client.return_value.chat.assert_not_called()
+
+    def test_llamacpp_backend_posts_openai_chat(self):
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content))
+            content = json.dumps({"thought": "t", "action": "list_blobs", "params": {}})
+            return httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+
+        agent = LLMAgent(model="qwen", backend="llamacpp")
+        agent._client = httpx.Client(
+            base_url=llm_agent._LLAMACPP_HOST, transport=httpx.MockTransport(handler),
+        )
+        action = agent.act(Observation(text="list everything"))
+
+        assert action.name == "list_blobs"
+        assert sent[0]["model"] == "qwen"
+        assert sent[0]["response_format"]["schema"] == llm_agent._RESPONSE_SCHEMA
+        assert sent[0]["max_tokens"] == llm_agent._NUM_PREDICT
+
+    def test_llamacpp_act_many_closes_its_client(self):
+        content = json.dumps({"thought": "t", "action": "query", "params": {}})
+        client = httpx.AsyncClient(
+            base_url=llm_agent._LLAMACPP_HOST,
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(200, json={"choices": [{"message": {"content": content}}]})
+            ),
+        )
+        agent = LLMAgent(model="qwen", backend="llamacpp")
+        agent._async_client = lambda: client
+
+        actions = agent.act_many([Observation(text="a"), Observation(text="b")])
+
+        assert [a.name for a in actions] == ["query", "query"]
+        assert client.is_closed
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError, match="Unknown LLM backend"):
+            LLMAgent(backend="vllm")
 
     @patch("agent_factory.agents.llm_agent.ollama")
     def test_invalid_action_defaults_to_query(self, mock_ollama):
@@ -188,7 +392,7 @@ class TestLLMAgent:
             "action": "invalid_action",
             "params": {},
         })
-        mock_ollama.chat.return_value = self._make_ollama_response(response_json)
+        mock_ollama.Client.return_value.chat.return_value = self._make_ollama_response(response_json)
 
         agent = LLMAgent(model="test-model")
         obs = Observation(text="do something")
@@ -199,7 +403,7 @@ class TestLLMAgent:
 
     @patch("agent_factory.agents.llm_agent.ollama")
     def test_json_parse_error_handled(self, mock_ollama):
-        mock_ollama.chat.return_value = self._make_ollama_response("not valid json!")
+        mock_ollama.Client.return_value.chat.return_value = self._make_ollama_response("not valid json!")
 
         agent = LLMAgent(model="test-model")
         obs = Observation(text="do something")
@@ -210,7 +414,7 @@ class TestLLMAgent:
 
     @patch("agent_factory.agents.llm_agent.ollama")
     def test_ollama_exception_handled(self, mock_ollama):
-        mock_ollama.chat.side_effect = ConnectionError("Ollama not running")
+        mock_ollama.Client.return_value.chat.side_effect = ConnectionError("Ollama not running")
 
         agent = LLMAgent(model="test-model")
         obs = Observation(text="do something")
@@ -223,13 +427,13 @@ class TestLLMAgent:
     def test_all_valid_actions_accepted(self, mock_ollama):
         agent = LLMAgent(model="test-model")
 
-        for action_name in ("assimilate", "query", "retrieve", "prune", "list_blobs"):
+        for action_name in ("assimilate", "query", "retrieve", "destroy", "prune", "list_blobs"):
             response_json = json.dumps({
                 "thought": f"doing {action_name}",
                 "action": action_name,
                 "params": {},
             })
-            mock_ollama.chat.return_value = self._make_ollama_response(response_json)
+            mock_ollama.Client.return_value.chat.return_value = self._make_ollama_response(response_json)
 
             obs = Observation(text=f"test {action_name}")
             action = agent.act(obs)
@@ -245,11 +449,41 @@ class TestLLMAgent:
 
 
 # ===========================================================================
-# ClaudeAgent (CLI) — tested with mocks for subprocess
+# ClaudeAgent (CLI) — tested with a fake stream-json claude process
 # ===========================================================================
 
+def _claude_session(*results: str, is_error: bool = False) -> MagicMock:
+    """Fake ``claude`` process whose stream-json output answers each turn."""
+    events = [{"type": "system", "subtype": "init"}]
+    for result in results:
+        events.append({
+            "type": "result",
+            "subtype": "error_during_execution" if is_error else "success",
+            "is_error": is_error,
+            "result": result,
+        })
+    proc = MagicMock()
+    proc.stdout = io.StringIO("".join(json.dumps(e) + "\n" for e in events))
+    proc.poll.return_value = None
+    return proc
+
+
+class TestClaudeParseResponse:
+    """Tests for the ClaudeAgent _parse_response helper."""
+
+    def test_json_with_markdown_fences(self):
+        from agent_factory.agents.claude_agent import _parse_response
+        raw = '```json\n{"thought": "t", "action": "query", "params": {}}\n```'
+        assert _parse_response(raw)["action"] == "query"
+
+    def test_fence_inside_json_is_kept(self):
+        from agent_factory.agents.claude_agent import _parse_response
+        raw = '```\n{"thought": "wrap it in\\n```\\n", "action": "query",\n "params": {}}\n```'
+        assert _parse_response(raw)["thought"] == "wrap it in\n```\n"
+
+
 class TestClaudeAgent:
-    """Tests for ClaudeAgent (mocked subprocess calls)."""
+    """Tests for ClaudeAgent (mocked subprocess.Popen)."""
 
     @patch("shutil.which", return_value=None)
     def test_runtime_error_when_cli_missing(self, mock_which):
@@ -259,33 +493,33 @@ class TestClaudeAgent:
             CA()
 
     @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch("subprocess.run")
-    def test_think_returns_thought(self, mock_run, mock_which):
+    @patch("subprocess.Popen")
+    def test_think_returns_thought(self, mock_popen, mock_which):
         from agent_factory.agents.claude_agent import ClaudeAgent as CA
         response_json = json.dumps({
             "thought": "I should query all tags",
             "action": "query",
             "params": {"tag_pattern": "*"},
         })
-        mock_run.return_value = MagicMock(returncode=0, stdout=response_json, stderr="")
+        mock_popen.return_value = _claude_session(response_json)
 
         agent = CA()
         obs = Observation(text="show me what's stored")
         thought = agent.think(obs)
 
         assert thought == "I should query all tags"
-        mock_run.assert_called_once()
+        mock_popen.assert_called_once()
 
     @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch("subprocess.run")
-    def test_act_returns_action(self, mock_run, mock_which):
+    @patch("subprocess.Popen")
+    def test_act_returns_action(self, mock_popen, mock_which):
         from agent_factory.agents.claude_agent import ClaudeAgent as CA
         response_json = json.dumps({
             "thought": "User wants to ingest data",
             "action": "assimilate",
             "params": {"src": "folder::./data", "dst": "docs", "format": "arrow"},
         })
-        mock_run.return_value = MagicMock(returncode=0, stdout=response_json, stderr="")
+        mock_popen.return_value = _claude_session(response_json)
 
         agent = CA()
         obs = Observation(text="ingest folder::./data into tag: docs")
@@ -296,8 +530,8 @@ class TestClaudeAgent:
         assert action.params["src"] == "folder::./data"
 
     @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch("subprocess.run")
-    def test_think_then_act_reuses_response(self, mock_run, mock_which):
+    @patch("subprocess.Popen")
+    def test_think_then_act_reuses_response(self, mock_popen, mock_which):
         """Calling think() then act() should only call claude CLI once."""
         from agent_factory.agents.claude_agent import ClaudeAgent as CA
         response_json = json.dumps({
@@ -305,7 +539,7 @@ class TestClaudeAgent:
             "action": "retrieve",
             "params": {"tag": "docs", "blob_name": "readme.md"},
         })
-        mock_run.return_value = MagicMock(returncode=0, stdout=response_json, stderr="")
+        mock_popen.return_value = _claude_session(response_json)
 
         agent = CA()
         obs = Observation(text="get readme.md from docs")
@@ -315,18 +549,19 @@ class TestClaudeAgent:
 
         assert thought == "Will retrieve data"
         assert action.name == "retrieve"
-        assert mock_run.call_count == 1
+        assert mock_popen.call_count == 1
+        assert mock_popen.return_value.stdin.write.call_count == 1
 
     @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch("subprocess.run")
-    def test_invalid_action_defaults_to_query(self, mock_run, mock_which):
+    @patch("subprocess.Popen")
+    def test_invalid_action_defaults_to_query(self, mock_popen, mock_which):
         from agent_factory.agents.claude_agent import ClaudeAgent as CA
         response_json = json.dumps({
             "thought": "confused",
             "action": "invalid_action",
             "params": {},
         })
-        mock_run.return_value = MagicMock(returncode=0, stdout=response_json, stderr="")
+        mock_popen.return_value = _claude_session(response_json)
 
         agent = CA()
         obs = Observation(text="do something")
@@ -336,10 +571,10 @@ class TestClaudeAgent:
         assert action.params == {"tag_pattern": "*"}
 
     @patch("shutil.which", return_value="/usr/bin/claude")
-    @patch("subprocess.run")
-    def test_cli_error_handled(self, mock_run, mock_which):
+    @patch("subprocess.Popen")
+    def test_cli_error_handled(self, mock_popen, mock_which):
         from agent_factory.agents.claude_agent import ClaudeAgent as CA
-        mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="error occurred")
+        mock_popen.return_value = _claude_session("error occurred", is_error=True)
 
         agent = CA()
         obs = Observation(text="do something")
@@ -347,6 +582,35 @@ class TestClaudeAgent:
 
         assert action.name == "query"
 
+    @patch("shutil.which", return_value="/usr/bin/claude")
+    @patch("subprocess.Popen")
+    def test_invalid_json_defaults_to_query(self, mock_popen, mock_which):
+        from agent_factory.agents.claude_agent import ClaudeAgent as CA
+        mock_popen.return_value = _claude_session("not json at all")
+
+        agent = CA()
+        action = agent.act(Observation(text="do something"))
+
+        assert action.name == "query"
+        assert action.params == {"tag_pattern": "*"}
+
+    @patch("shutil.which", return_value="/usr/bin/claude")
+    @patch("subprocess.Popen")
+    def test_session_reused_across_turns(self, mock_popen, mock_which):
+        """One claude process serves consecutive observations."""
+        from agent_factory.agents.claude_agent import ClaudeAgent as CA
+        first = json.dumps({"thought": "a", "action": "query", "params": {}})
+        second = json.dumps({"thought": "b", "action": "list_blobs", "params": {}})
+        mock_popen.return_value = _claude_session(first, second)
+
+        agent = CA()
+        assert agent.think(Observation(text="one")) == "a"
+        assert agent.think(Observation(text="two")) == "b"
+
+        assert mock_popen.call_count == 1
+        sent = [json.loads(c.args[0]) for c in mock_popen.return_value.stdin.write.call_args_list]
+        assert [m["message"]["content"] for m in sent] == ["one", "two"]
+
 
 # ===========================================================================
 # Builder agent type selection
@@ -382,3 +646,25 @@ class TestBuilderAgentSelection:
         from agent_factory.core.errors import BlueprintError
         with pytest.raises(BlueprintError, match="Unknown agent type"):
             AgentBuilder._build_agent({"type": "nonexistent"})
+
+    def test_rebuild_agent_reuses_infrastructure(self, sample_blueprint):
+        from agent_factory.agents.ingestor_agent import IngestorAgent
+        from agent_factory.factory.builder import AgentBuilder
+        builder = AgentBuilder()
+        built = builder.build(sample_blueprint, connect=False)
+
+        new_bp = {**sample_blueprint, "agent": {"type": "ingestor"}}
+        rebuilt = builder.rebuild_agent(new_bp, built)
+
+        assert isinstance(rebuilt.agent, IngestorAgent)
+        assert rebuilt.client is built.client
+        assert rebuilt.cache is built.cache
+        assert rebuilt.environment is built.environment
+        assert rebuilt.blueprint is new_bp
+
+    def test_build_does_not_mutate_blueprint(self, sample_blueprint):
+        import copy
+        from agent_factory.factory.builder import AgentBuilder
+        snapshot = copy.deepcopy(sample_blueprint)
+        AgentBuilder().build(sample_blueprint, connect=False)
+        assert sample_blueprint == snapshot
@@ -61,6 +61,23 @@ class TestBlobCache:
         assert result is None
         assert cache.misses == 1
 
+    def test_get_many_one_round_trip(self, cache_with_mock):
+        cache, mock_client = cache_with_mock
+        mock_client.get_many.return_value = {"iowarp:t:a": b"A"}
+
+        result = cache.get_many([("t", "a"), ("t", "b")])
+
+        assert result == [b"A", None]
+        mock_client.get_many.assert_called_once_with(["iowarp:t:a", "iowarp:t:b"])
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_put_many(self, cache_with_mock):
+        cache, mock_client = cache_with_mock
+        cache.put_many({("t", "a"): b"A", ("t", "b"): b"B"}, ttl=60)
+        mock_client.set_many.assert_called_once_with(
+            {"iowarp:t:a": b"A", "iowarp:t:b": b"B"}, expire=60,
+        )
+
     def test_put(self, cache_with_mock):
         cache, mock_client = cache_with_mock
         cache.put("tag1", "blob1", b"data", ttl=120)
@@ -0,0 +1,27 @@
+"""Tests for the IOWarpClient wire framing."""
+
+from __future__ import annotations
+
+import pytest
+
+from agent_factory.iowarp import client as client_mod
+from agent_factory.iowarp.client import _decode_frame, _encode_frame
+
+
+class TestFraming:
+    def test_json_round_trip(self):
+        msg = {"method": "ping", "params": {}, "id": 1}
+        frame = _encode_frame(msg, msgpack=False)
+        assert frame.startswith(b"{")
+        assert _decode_frame(frame) == msg
+
+    def test_json_decodes_from_memoryview(self):
+        frame = _encode_frame({"result": "pong"}, msgpack=False)
+        assert _decode_frame(memoryview(frame)) == {"result": "pong"}
+
+    @pytest.mark.skipif(not client_mod.HAS_MSGPACK, reason="msgspec not installed")
+    def test_msgpack_round_trip(self):
+        msg = {"result": {"data": b"\x00\xff"}, "id": 7}
+        frame = _encode_frame(msg, msgpack=True)
+        assert frame[:1] == client_mod._MSGPACK_TAG
+        assert _decode_frame(memoryview(frame)) == msg
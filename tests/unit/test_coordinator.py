@@ -0,0 +1,230 @@
+"""Tests for CoordinatorAgent routing."""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from agent_factory.agents import coordinator_agent
+from agent_factory.agents.coordinator_agent import CoordinatorAgent
+from agent_factory.core.types import Action, Observation
+
+
+@pytest.fixture(autouse=True)
+def _empty_route_cache(monkeypatch):
+    # Route through the (mocked) claude CLI unless a test installs a client
+    monkeypatch.setattr(coordinator_agent, "_sdk_client", lambda: None)
+    coordinator_agent._route_cache.clear()
+    yield
+    coordinator_agent._route_cache.clear()
+
+
+ROUTING = {"thought": "search", "agent": "retriever", "instruction": "query docs"}
+
+
+def _cli(result: str = "", is_error: bool = False, turns: int = 3):
+    """Fake ``subprocess.Popen`` for a claude stream-json session.
+
+    Every turn is answered with the same *result*.
+    """
+    event = {
+        "type": "result",
+        "subtype": "error_during_execution" if is_error else "success",
+        "is_error": is_error,
+        "result": result,
+    }
+    proc = MagicMock()
+    proc.stdout = io.StringIO((json.dumps(event) + "\n") * turns)
+    proc.poll.return_value = None
+    return MagicMock(return_value=proc)
+
+
+class TestRouteCache:
+    @patch("shutil.which", return_value="/usr/bin/claude")
+    @patch.object(CoordinatorAgent, "_ask_cli", return_value=json.dumps(ROUTING))
+    def test_repeated_command_skips_llm(self, mock_ask, mock_which):
+        coord = CoordinatorAgent(backend=None, agents={})
+
+        first = coord.think(Observation(text="Query docs  for HDF5"))
+        second = coord.think(Observation(text="query docs for hdf5"))
+
+        assert first == second
+        assert mock_ask.call_count == 1
+        assert coord._last_routing == ROUTING
+
+    @patch("shutil.which", return_value="/usr/bin/claude")
+    @patch.object(CoordinatorAgent, "_ask_cli", return_value=None)
+    def test_fallback_routing_not_cached(self, mock_ask, mock_which):
+        coord = CoordinatorAgent(backend=None, agents={})
+
+        coord.think(Observation(text="query docs"))
+        coord.think(Observation(text="query docs"))
+
+        assert mock_ask.call_count == 2
+
+    def test_cli_uses_router_model(self):
+        coord = CoordinatorAgent(backend=None, agents={}, router_model="tiny")
+
+        argv = coord._cli_argv("/usr/bin/claude")
+
+        assert argv[argv.index("--model") + 1] == "tiny"
+
+
+class TestCliSession:
+    @patch("shutil.which", return_value="/usr/bin/claude")
+    def test_commands_share_one_claude_process(self, mock_which, monkeypatch):
+        popen = _cli(json.dumps(ROUTING))
+        monkeypatch.setattr("subprocess.Popen", popen)
+        coord = CoordinatorAgent(backend=None, agents={})
+
+        coord.think(Observation(text="query docs"))
+        coord.think(Observation(text="query other docs"))
+
+        assert coord._last_routing == ROUTING
+        assert popen.call_count == 1
+        assert popen.return_value.stdin.write.call_count == 2
+
+    @patch("shutil.which", return_value="/usr/bin/claude")
+    def test_error_result_takes_fallback(self, mock_which, monkeypatch):
+        monkeypatch.setattr("subprocess.Popen", _cli("boom", is_error=True))
+        coord = CoordinatorAgent(backend=None, agents={})
+
+        coord.think(Observation(text="query docs"))
+
+        assert coord._last_routing["thought"] == "Claude CLI error"
+
+
+class TestRuleCascade:
+    @patch.object(CoordinatorAgent, "_ask_cli", return_value=json.dumps(ROUTING))
+    def test_unambiguous_keywords_skip_llm(self, mock_ask):
+        coord = CoordinatorAgent(backend=None, agents={"retriever": MagicMock()})
+
+        coord.think(Observation(text="list all blobs in docs"))
+
+        mock_ask.assert_not_called()
+        assert coord._last_routing["agent"] == "retriever"
+        assert coord._last_routing["thought"] == "rule-matched"
+
+    @patch("shutil.which", return_value="/usr/bin/claude")
+    @patch.object(CoordinatorAgent, "_ask_cli", return_value=json.dumps(ROUTING))
+    def test_mixed_keywords_go_to_llm(self, mock_ask, mock_which):
+        agents = {"retriever": MagicMock(), "ingestor": MagicMock()}
+        coord = CoordinatorAgent(backend=None, agents=agents)
+
+        coord.think(Observation(text="ingest file::a.txt then list it"))
+
+        assert mock_ask.call_count == 1
+
+
+class TestFirstJsonObject:
+    def test_fenced_reply_read_up_to_first_object(self):
+        fenced = "```json\n" + json.dumps(ROUTING, indent=2) + "\n```\ntrailing {"
+        reply = coordinator_agent._first_json_object(io.StringIO(fenced))
+        assert json.loads(reply) == ROUTING
+
+    def test_braces_inside_strings_ignored(self):
+        text = '{"thought": "a } and a {", "agent": "x"}\nmore'
+        assert coordinator_agent._first_json_object(io.StringIO(text)) == text.split("\n")[0]
+
+    def test_incomplete_object_is_none(self):
+        assert coordinator_agent._first_json_object(io.StringIO('{"a": 1')) is None
+
+
+class TestSdkRouting:
+    @patch.object(CoordinatorAgent, "_ask_cli")
+    def test_sdk_client_used_when_available(self, mock_ask, monkeypatch):
+        client = MagicMock()
+        client.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(type="tool_use", name="route", input=dict(ROUTING))],
+        )
+        monkeypatch.setattr(coordinator_agent, "_sdk_client", lambda: client)
+        coord = CoordinatorAgent(backend=None, agents={})
+
+        coord.think(Observation(text="query docs"))
+
+        assert coord._last_routing == ROUTING
+        mock_ask.assert_not_called()
+        kwargs = client.messages.create.call_args.kwargs
+        assert kwargs["messages"] == [{"role": "user", "content": "User command: query docs"}]
+        assert kwargs["system"][0]["cache_control"] == {"type": "ephemeral"}
+        assert kwargs["tool_choice"] == {"type": "tool", "name": "route"}
+
+    @patch("shutil.which", return_value="/usr/bin/claude")
+    def test_shipped_blueprint_routes_with_sdk_model_id(self, mock_which, monkeypatch):
+        from pathlib import Path
+
+        import yaml
+
+        from agent_factory.factory.builder import AgentBuilder
+
+        path = Path(__file__).parents[2] / "configs" / "blueprints" / "coordinator_agent.yaml"
+        blueprint = yaml.safe_load(path.read_text())
+        coord = AgentBuilder().build(blueprint, connect=False).agent
+
+        client = MagicMock()
+        client.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(type="tool_use", name="route", input=dict(ROUTING))],
+        )
+        monkeypatch.setattr(coordinator_agent, "_sdk_client", lambda: client)
+        coord.think(Observation(text="do the usual thing"))
+
+        assert blueprint["agent"]["router_model"] == "haiku"
+        assert client.messages.create.call_args.kwargs["model"] == coordinator_agent.SDK_MODEL
+
+class TestFanOut:
+    def test_compound_routing_returns_ordered_batch(self):
+        def built(name):
+            agent = MagicMock()
+            agent.act.side_effect = lambda obs: Action(name=name, params={"text": obs.text})
+            return SimpleNamespace(agent=agent)
+
+        coord = CoordinatorAgent(
+            backend=None,
+            agents={"ingestor": built("assimilate"), "retriever": built("query")},
+        )
+        coord._last_routing = {
+            "thought": "two parts",
+            "agents": ["ingestor", "retriever"],
+            "instructions": ["ingest a", "query b"],
+        }
+
+        action = coord.act(Observation(text="ingest a then query b"))
+
+        assert action.name == "batch"
+        assert action.params["actions"] == [
+            Action(name="assimilate", params={"text": "ingest a"}),
+            Action(name="query", params={"text": "query b"}),
+        ]
+
+    def test_tasks_for_one_agent_run_one_at_a_time(self):
+        active, overlaps = [0], []
+        lock = threading.Lock()
+
+        def act(obs):
+            with lock:
+                active[0] += 1
+                overlaps.append(active[0] > 1)
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return Action(name="query", params={"text": obs.text})
+
+        agent = MagicMock()
+        agent.act.side_effect = act
+        coord = CoordinatorAgent(backend=None, agents={"retriever": SimpleNamespace(agent=agent)})
+        coord._last_routing = {
+            "thought": "three lookups",
+            "agents": ["retriever", "retriever", "retriever"],
+            "instructions": ["query a", "query b", "query c"],
+        }
+
+        action = coord.act(Observation(text="query a, b and c"))
+
+        assert [a.params["text"] for a in action.params["actions"]] == ["query a", "query b", "query c"]
+        assert not any(overlaps)
@@ -82,6 +82,29 @@ class TestPipelineExecutor:
         assert "step_a" in ctx.outputs
         assert "step_b" in ctx.outputs
 
+    def test_prefers_step_when_agent_defines_it(self):
+        class SteppingAgent:
+            def __init__(self):
+                self.calls = 0
+
+            def think(self, obs):
+                raise AssertionError("think() should not be called")
+
+            act = think
+
+            def step(self, obs):
+                self.calls += 1
+                return "thinking", Action(name="query", params={})
+
+        dag = _simple_dag()
+        env = _make_env("success", {"tag": "docs"})
+        agent_a, agent_b = SteppingAgent(), SteppingAgent()
+
+        executor = PipelineExecutor(env, {"agent_a": agent_a, "agent_b": agent_b})
+        executor.execute(dag, "test task", initial_vars={"src": "/data"})
+
+        assert agent_a.calls == agent_b.calls == 1
+
     def test_initial_vars_injected(self):
         dag = _simple_dag()
         env = _make_env("ok", {"tag": "docs"})
@@ -131,3 +131,29 @@ class TestIngestorAgent:
 
         assert result.name == "assimilate"
         assert result.params["dst"] == "fallback"
+
+    def test_think_then_act_share_augmented_observation(self):
+        action = Action(name="assimilate", params={"src": "file::x", "dst": "docs"})
+        backend = self._make_backend(action=action)
+        agent = IngestorAgent(backend)
+        obs = Observation(text="ingest x")
+
+        agent.think(obs)
+        agent.act(obs)
+
+        assert backend.think.call_args[0][0] is backend.act.call_args[0][0]
+
+    def test_step_uses_backend_step(self):
+        class SteppingBackend:
+            def step(self, obs):
+                self.seen = obs
+                return "t", Action(name="query", params={})
+
+        backend = SteppingBackend()
+        agent = IngestorAgent(backend, default_tag="docs")
+        thought, action = agent.step(Observation(text="load file::/a.csv"))
+
+        assert thought == "t"
+        assert "ingestion specialist" in backend.seen.text
+        assert action.name == "assimilate"
+        assert action.params["src"] == "file::/a.csv"
@@ -24,6 +24,13 @@ class TestBlueprintRegistry:
         assert "cache" in bp
         assert "environment" in bp
 
+    def test_items_pairs_names_with_blueprints(self):
+        reg = BlueprintRegistry()
+        reg.load()
+        items = dict(reg.items())
+        assert list(items) == reg.list_blueprints()
+        assert items["iowarp_agent"] is reg.get("iowarp_agent")
+
     def test_get_missing_raises(self):
         reg = BlueprintRegistry()
         reg.load()
@@ -151,3 +158,34 @@ class TestBlueprintRegistry:
         assert bp["cache"]["default_ttl"] == 9999
         assert bp["cache"]["key_prefix"] == "iowarp"  # preserved
         assert bp["cache"]["hosts"][0]["host"] == "127.0.0.1"  # preserved
+
+    # ── Cached load ───────────────────────────────────────────────────────
+
+    def test_load_cached_reuses_snapshot(self, tmp_path):
+        bp_dir = tmp_path / "blueprints"
+        cache_dir = tmp_path / "cache"
+        BlueprintRegistry(bp_dir).create("agent1", agent_type="llm")
+
+        reg1 = BlueprintRegistry(bp_dir)
+        reg1.load_cached(cache_dir)
+        assert "agent1" in reg1
+        assert len(list(cache_dir.glob("registry-*.pkl"))) == 1
+
+        reg2 = BlueprintRegistry(bp_dir)
+        reg2.load = None  # a cache hit must not fall through to a YAML parse
+        reg2.load_cached(cache_dir)
+        assert reg2.get("agent1")["agent"]["type"] == "llm"
+
+    def test_load_cached_invalidated_by_changes(self, tmp_path):
+        bp_dir = tmp_path / "blueprints"
+        cache_dir = tmp_path / "cache"
+        reg = BlueprintRegistry(bp_dir)
+        reg.create("agent1")
+        BlueprintRegistry(bp_dir).load_cached(cache_dir)
+
+        reg.create("agent2")
+        reg.delete("agent1")
+
+        fresh = BlueprintRegistry(bp_dir)
+        fresh.load_cached(cache_dir)
+        assert fresh.list_blueprints() == ["agent2"]
@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from collections import OrderedDict
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from agent_factory.core.types import Action, Observation, StepResult
-from agent_factory.agents.retriever_agent import RetrieverAgent
+from agent_factory.agents.retriever_agent import _RETRIEVER_PREFIX, RetrieverAgent
+from agent_factory.environments.iowarp_env import IOWarpEnvironment
+from agent_factory.iowarp.models import QueryResultModel, RetrieveResultModel
 
 
 class TestRetrieverAgent:
@@ -30,6 +33,23 @@ class TestRetrieverAgent:
         assert "data-access specialist" in call_args[0].text
         assert "search for docs" in call_args[0].text
 
+    @patch("agent_factory.agents.llm_agent.ollama")
+    def test_llm_backend_gets_context_in_system_prompt(self, mock_ollama, monkeypatch):
+        from agent_factory.agents import llm_agent
+        from agent_factory.agents.llm_agent import LLMAgent
+
+        monkeypatch.setattr(llm_agent, "_clients", {})
+        monkeypatch.setattr(llm_agent, "_response_cache", OrderedDict())
+        backend = LLMAgent(model="m")
+        agent = RetrieverAgent(backend)
+        agent.act(Observation(text="search for docs"))
+
+        system, user = mock_ollama.Client.return_value.chat.call_args.kwargs["messages"]
+        assert system["content"].startswith(_RETRIEVER_PREFIX)
+        assert user["content"] == "search for docs"
+        # The caller's agent keeps its own prompt
+        assert "data-access specialist" not in backend.system_prompt
+
     def test_think_returns_backend_result(self):
         backend = self._make_backend(thought="I will query tags")
         agent = RetrieverAgent(backend)
@@ -161,3 +181,24 @@ class TestRetrieverActCompound:
 
         assert results == []
         assert mock_env.step.call_count == 1
+
+    def test_act_compound_retrieves_in_bulk(self):
+        client, cache = MagicMock(), MagicMock()
+        client.context_query.return_value = QueryResultModel(
+            matches=[{"tag": "docs", "blobs": ["a.md", "b.md"]}],
+        )
+        cache.get_many.return_value = [b"A", None]
+        client.context_retrieve_many.return_value = [
+            RetrieveResultModel(data=b"B".hex(), encoding="hex"),
+        ]
+        env = IOWarpEnvironment(client=client, cache=cache, resolver=MagicMock())
+
+        results = RetrieverAgent(MagicMock()).act_compound(Observation(text="get docs"), env)
+
+        assert [r.observation.data["content"] for r in results] == [b"A", b"B"]
+        assert [r.observation.data["cache_hit"] for r in results] == [True, False]
+        cache.get_many.assert_called_once_with([("docs", "a.md"), ("docs", "b.md")])
+        [items] = client.context_retrieve_many.call_args.args
+        assert [(p.tag, p.blob_name) for p in items] == [("docs", "b.md")]
+        cache.put_many.assert_called_once_with({("docs", "b.md"): b"B"})
+        client.context_retrieve.assert_not_called()
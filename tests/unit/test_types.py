@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+
 import pytest
 
 from agent_factory.core.types import (
@@ -41,6 +44,12 @@ class TestObservation:
         with pytest.raises(AttributeError):
             o.text = "y"  # type: ignore[misc]
 
+    def test_slotted(self):
+        o = Observation(text="x", data={"k": 1})
+        assert not hasattr(o, "__dict__")
+        assert pickle.loads(pickle.dumps(o)) == o
+        assert copy.deepcopy(o) == o
+
 
 class TestAction:
     def test_creation(self):